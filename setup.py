@@ -39,6 +39,13 @@ setup(
         ],
     },
     install_requires=requirements,
+    extras_require={
+        # Fuzzy skill matching; exact/variant matching works without it
+        "fuzzy": [
+            "rapidfuzz>=3.0.0",
+            "numpy>=1.24.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "resume-builder=resume_builder_cli:main",
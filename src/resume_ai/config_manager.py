@@ -2,10 +2,24 @@
 Configuration Manager - Handles user and system configuration.
 """
 
-import yaml
+import functools
+import json
+import logging
+import math
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import ClassVar, Dict, Iterator, Optional, Any
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# PyYAML is imported on the first config read rather than with this module
+@functools.lru_cache(maxsize=1)
+def _yaml_loader_class() -> type:
+    """Prefer the libyaml-backed loader when PyYAML was built with it."""
+    import yaml
+    
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 @dataclass
@@ -48,6 +62,113 @@ class ResumeConfig:
     verbose: bool = True
 
 
+# YAML section -> {yaml key: ResumeConfig attribute}
+_SCHEMA: Dict[str, Dict[str, str]] = {
+    'resume_paths': {
+        'primary': 'resume_primary_path',
+        'applications': 'resume_applications_path',
+        'fallback': 'resume_fallback_path',
+        'base_resume': 'base_resume_path',
+    },
+    'ollama': {
+        'base_url': 'ollama_url',
+        'model': 'ollama_model',
+        'temperature': 'ollama_temperature',
+        'timeout': 'ollama_timeout',
+    },
+    'thresholds': {
+        'minimum_overall': 'threshold_minimum',
+        'borderline_min': 'threshold_borderline_min',
+        'borderline_max': 'threshold_borderline_max',
+        'auto_stop_below': 'threshold_auto_stop',
+        'ask_on_borderline': 'threshold_ask_borderline',
+    },
+    'export': {
+        'auto_validate': 'export_auto_validate',
+        'create_package': 'export_create_package',
+        'default_format': 'export_default_format',
+    },
+    'output': {
+        'base_dir': 'output_base_dir',
+        'create_subdirs': 'output_create_subdirs',
+        'preserve_existing': 'output_preserve_existing',
+    },
+}
+
+# Top-level YAML keys -> ResumeConfig attribute
+_TOP_LEVEL_SCHEMA: Dict[str, str] = {
+    'verbose': 'verbose',
+    'skills_inventory': 'skills_inventory_path',
+}
+
+# Resume search directories, in priority order
+_SEARCH_PATH_FIELDS = ('resume_primary_path', 'resume_applications_path', 'resume_fallback_path')
+
+# Attributes only written to the user config when set
+_OPTIONAL_FIELDS = frozenset({'base_resume_path', 'skills_inventory_path'})
+
+
+def _build_yaml_template() -> tuple[tuple[Optional[str], str], ...]:
+    """
+    Build the user config layout from the schema.
+    
+    Returns:
+        (attribute, line prefix) pairs; attribute is None for section headers
+    """
+    lines: list[tuple[Optional[str], str]] = []
+    for section, mapping in _SCHEMA.items():
+        lines.append((None, f"{section}:"))
+        lines.extend((attr_name, f"  {yaml_key}: ") for yaml_key, attr_name in mapping.items())
+    lines.extend((attr_name, f"{yaml_key}: ") for yaml_key, attr_name in _TOP_LEVEL_SCHEMA.items())
+    return tuple(lines)
+
+
+_YAML_TEMPLATE = _build_yaml_template()
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a config value as a YAML scalar that loads back to the same value."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int) or (isinstance(value, float) and math.isfinite(value)):
+        return repr(value)
+    # JSON strings are valid YAML double-quoted scalars
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a config YAML file into {ResumeConfig attribute: value}.
+    
+    Only keys named in the schema are kept. Memoized on (path, mtime, size)
+    so an edited file is re-parsed; callers must treat the returned dict as
+    read-only.
+    """
+    import yaml
+    
+    with open(path_str, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=_yaml_loader_class()) or {}
+    
+    values: Dict[str, Any] = {}
+    for section, mapping in _SCHEMA.items():
+        section_data = data.get(section)
+        if isinstance(section_data, dict):
+            values.update(
+                (attr_name, section_data[yaml_key])
+                for yaml_key, attr_name in mapping.items()
+                if yaml_key in section_data
+            )
+    values.update(
+        (attr_name, data[yaml_key])
+        for yaml_key, attr_name in _TOP_LEVEL_SCHEMA.items()
+        if yaml_key in data
+    )
+    return values
+
+
 class ConfigManager:
     """Manages user configuration for resume builder."""
     
@@ -56,9 +177,29 @@ class ConfigManager:
     USER_CONFIG_FILE = USER_CONFIG_DIR / "config.yaml"
     PROJECT_CONFIG_FILE = Path(__file__).parent.parent.parent / "config" / "settings.yaml"
     
+    # CLI-friendly aliases for config attributes
+    KEY_MAP: ClassVar[Dict[str, str]] = {
+        'resume-path': 'resume_primary_path',
+        'base-resume': 'base_resume_path',
+        'output-dir': 'output_base_dir',
+        'model': 'ollama_model',
+        'min-score': 'threshold_minimum',
+    }
+    
     def __init__(self):
         """Initialize config manager."""
-        self.config = self.load_config()
+        self._config: Optional[ResumeConfig] = None
+        self._dirty = False
+        self._in_batch = False
+        self._path_cache: Dict[str, Path] = {}
+        self._search_paths_cache: Optional[tuple[Path, ...]] = None
+    
+    @property
+    def config(self) -> ResumeConfig:
+        """Merged configuration, loaded on first access."""
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
     
     def load_config(self) -> ResumeConfig:
         """
@@ -88,81 +229,18 @@ class ConfigManager:
         return config
     
     def _load_yaml_config(self, path: Path) -> Dict[str, Any]:
-        """Load YAML config file."""
+        """Load YAML config file as {ResumeConfig attribute: value}."""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            st = path.stat()
+            return _load_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
         except Exception as e:
-            print(f"Warning: Could not load config from {path}: {e}")
+            logger.warning("Could not load config from %s: %s", path, e)
             return {}
     
-    def _merge_config(self, config: ResumeConfig, yaml_data: Dict[str, Any]) -> ResumeConfig:
-        """Merge YAML data into config object."""
-        # Resume paths
-        if 'resume_paths' in yaml_data:
-            paths = yaml_data['resume_paths']
-            if 'primary' in paths:
-                config.resume_primary_path = paths['primary']
-            if 'applications' in paths:
-                config.resume_applications_path = paths['applications']
-            if 'fallback' in paths:
-                config.resume_fallback_path = paths['fallback']
-            if 'base_resume' in paths:
-                config.base_resume_path = paths['base_resume']
-        
-        # Ollama configuration
-        if 'ollama' in yaml_data:
-            ollama = yaml_data['ollama']
-            if 'base_url' in ollama:
-                config.ollama_url = ollama['base_url']
-            if 'model' in ollama:
-                config.ollama_model = ollama['model']
-            if 'temperature' in ollama:
-                config.ollama_temperature = ollama['temperature']
-            if 'timeout' in ollama:
-                config.ollama_timeout = ollama['timeout']
-        
-        # Threshold configuration
-        if 'thresholds' in yaml_data:
-            thresholds = yaml_data['thresholds']
-            if 'minimum_overall' in thresholds:
-                config.threshold_minimum = thresholds['minimum_overall']
-            if 'borderline_min' in thresholds:
-                config.threshold_borderline_min = thresholds['borderline_min']
-            if 'borderline_max' in thresholds:
-                config.threshold_borderline_max = thresholds['borderline_max']
-            if 'auto_stop_below' in thresholds:
-                config.threshold_auto_stop = thresholds['auto_stop_below']
-            if 'ask_on_borderline' in thresholds:
-                config.threshold_ask_borderline = thresholds['ask_on_borderline']
-        
-        # Export configuration
-        if 'export' in yaml_data:
-            export = yaml_data['export']
-            if 'auto_validate' in export:
-                config.export_auto_validate = export['auto_validate']
-            if 'create_package' in export:
-                config.export_create_package = export['create_package']
-            if 'default_format' in export:
-                config.export_default_format = export['default_format']
-        
-        # Output configuration
-        if 'output' in yaml_data:
-            output = yaml_data['output']
-            if 'base_dir' in output:
-                config.output_base_dir = output['base_dir']
-            if 'create_subdirs' in output:
-                config.output_create_subdirs = output['create_subdirs']
-            if 'preserve_existing' in output:
-                config.output_preserve_existing = output['preserve_existing']
-        
-        # Skills inventory
-        if 'skills_inventory' in yaml_data:
-            config.skills_inventory_path = yaml_data['skills_inventory']
-        
-        # General
-        if 'verbose' in yaml_data:
-            config.verbose = yaml_data['verbose']
+    def _merge_config(self, config: ResumeConfig, values: Dict[str, Any]) -> ResumeConfig:
+        """Merge parsed config values into config object."""
+        for attr_name, value in values.items():
+            setattr(config, attr_name, value)
         
         return config
     
@@ -179,49 +257,40 @@ class ConfigManager:
         # Create config directory if it doesn't exist
         self.USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         
-        # Convert config to YAML format
-        yaml_data = {
-            'resume_paths': {
-                'primary': config.resume_primary_path,
-                'applications': config.resume_applications_path,
-                'fallback': config.resume_fallback_path,
-            },
-            'ollama': {
-                'base_url': config.ollama_url,
-                'model': config.ollama_model,
-                'temperature': config.ollama_temperature,
-                'timeout': config.ollama_timeout,
-            },
-            'thresholds': {
-                'minimum_overall': config.threshold_minimum,
-                'borderline_min': config.threshold_borderline_min,
-                'borderline_max': config.threshold_borderline_max,
-                'auto_stop_below': config.threshold_auto_stop,
-                'ask_on_borderline': config.threshold_ask_borderline,
-            },
-            'export': {
-                'auto_validate': config.export_auto_validate,
-                'create_package': config.export_create_package,
-                'default_format': config.export_default_format,
-            },
-            'output': {
-                'base_dir': config.output_base_dir,
-                'create_subdirs': config.output_create_subdirs,
-                'preserve_existing': config.output_preserve_existing,
-            },
-            'verbose': config.verbose,
-        }
+        # Render from the fixed layout (optional fields only written when set)
+        parts = []
+        for attr_name, prefix in _YAML_TEMPLATE:
+            if attr_name is None:
+                parts.append(f"{prefix}\n")
+                continue
+            value = getattr(config, attr_name)
+            if attr_name in _OPTIONAL_FIELDS and not value:
+                continue
+            parts.append(f"{prefix}{_yaml_scalar(value)}\n")
         
-        # Add optional fields
-        if config.base_resume_path:
-            yaml_data['resume_paths']['base_resume'] = config.base_resume_path
+        self.USER_CONFIG_FILE.write_text("".join(parts), encoding='utf-8')
         
-        if config.skills_inventory_path:
-            yaml_data['skills_inventory'] = config.skills_inventory_path
+        # A rewrite can land within the same mtime tick at the same size
+        _load_yaml_cached.cache_clear()
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer saving until the block exits, then write once if anything changed.
         
-        # Write to file
-        with open(self.USER_CONFIG_FILE, 'w', encoding='utf-8') as f:
-            yaml.safe_dump(yaml_data, f, default_flow_style=False, sort_keys=False)
+        Example:
+            with config.batch():
+                config.set_value('model', 'mistral')
+                config.set_value('min-score', 75)
+        """
+        self._in_batch = True
+        try:
+            yield
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self.save_user_config()
+                self._dirty = False
     
     def set_value(self, key: str, value: Any) -> None:
         """
@@ -231,52 +300,55 @@ class ConfigManager:
             key: Config key (dot notation supported: 'resume_paths.primary')
             value: Value to set
         """
-        # Map common keys
-        key_map = {
-            'resume-path': 'resume_primary_path',
-            'base-resume': 'base_resume_path',
-            'output-dir': 'output_base_dir',
-            'model': 'ollama_model',
-            'min-score': 'threshold_minimum',
-        }
-        
-        attr_name = key_map.get(key, key)
+        attr_name = self.KEY_MAP.get(key, key)
         
         if hasattr(self.config, attr_name):
             # Expand paths
             if 'path' in attr_name or 'dir' in attr_name:
                 value = str(Path(value).expanduser())
+                self._path_cache.pop(attr_name, None)
+                if attr_name in _SEARCH_PATH_FIELDS:
+                    self._search_paths_cache = None
             
             setattr(self.config, attr_name, value)
-            self.save_user_config()
+            self._dirty = True
+            if not self._in_batch:
+                self.save_user_config()
+                self._dirty = False
         else:
             raise ValueError(f"Unknown configuration key: {key}")
     
     def get_value(self, key: str) -> Any:
         """Get a configuration value."""
-        key_map = {
-            'resume-path': 'resume_primary_path',
-            'base-resume': 'base_resume_path',
-            'output-dir': 'output_base_dir',
-            'model': 'ollama_model',
-            'min-score': 'threshold_minimum',
-        }
+        attr_name = self.KEY_MAP.get(key, key)
+        
+        # Before the full config is loaded, answer from the user config alone
+        # (it has the highest priority) and skip the project config and merge
+        if self._config is None and self.USER_CONFIG_FILE.exists():
+            user_values = self._load_yaml_config(self.USER_CONFIG_FILE)
+            if attr_name in user_values:
+                return user_values[attr_name]
         
-        attr_name = key_map.get(key, key)
         return getattr(self.config, attr_name, None)
     
+    def _expanded_path(self, attr_name: str) -> Path:
+        """Get a config path attribute with ~ expanded, cached per attribute."""
+        path = self._path_cache.get(attr_name)
+        if path is None:
+            path = Path(getattr(self.config, attr_name)).expanduser()
+            self._path_cache[attr_name] = path
+        return path
+    
     def get_resume_search_paths(self) -> list[Path]:
         """Get list of paths to search for resumes."""
-        paths = []
+        if self._search_paths_cache is None:
+            # Configured directories, deduplicated in priority order
+            self._search_paths_cache = tuple(dict.fromkeys(
+                map(self._expanded_path, _SEARCH_PATH_FIELDS)
+            ))
         
-        for path_str in [
-            self.config.resume_primary_path,
-            self.config.resume_applications_path,
-            self.config.resume_fallback_path,
-        ]:
-            path = Path(path_str).expanduser()
-            if path.exists():
-                paths.append(path)
+        # Existence is checked on every call; directories come and go
+        paths = [path for path in self._search_paths_cache if path.exists()]
         
         # Always include current directory as fallback
         paths.append(Path.cwd())
@@ -286,14 +358,14 @@ class ConfigManager:
     def get_base_resume_path(self) -> Optional[Path]:
         """Get configured base resume path if set."""
         if self.config.base_resume_path:
-            path = Path(self.config.base_resume_path).expanduser()
+            path = self._expanded_path('base_resume_path')
             if path.exists():
                 return path
         return None
     
     def get_output_directory(self) -> Path:
         """Get output directory for applications."""
-        return Path(self.config.output_base_dir).expanduser()
+        return self._expanded_path('output_base_dir')
     
     def validate_paths(self) -> Dict[str, bool]:
         """
@@ -305,20 +377,25 @@ class ConfigManager:
         validation = {}
         
         paths_to_check = {
-            'resume_primary': self.config.resume_primary_path,
-            'resume_applications': self.config.resume_applications_path,
-            'output_dir': self.config.output_base_dir,
+            'resume_primary': 'resume_primary_path',
+            'resume_applications': 'resume_applications_path',
+            'output_dir': 'output_base_dir',
         }
         
         if self.config.base_resume_path:
-            paths_to_check['base_resume'] = self.config.base_resume_path
+            paths_to_check['base_resume'] = 'base_resume_path'
         
         if self.config.skills_inventory_path:
-            paths_to_check['skills_inventory'] = self.config.skills_inventory_path
+            paths_to_check['skills_inventory'] = 'skills_inventory_path'
         
-        for name, path_str in paths_to_check.items():
-            path = Path(path_str).expanduser()
-            validation[name] = path.exists()
+        # Defaults often repeat a directory; stat each distinct path once
+        seen: Dict[Path, bool] = {}
+        for name, attr_name in paths_to_check.items():
+            path = self._expanded_path(attr_name)
+            exists = seen.get(path)
+            if exists is None:
+                exists = seen[path] = path.exists()
+            validation[name] = exists
         
         return validation
     
@@ -332,7 +409,8 @@ class ConfigManager:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
-        return asdict(self.config)
+        # ResumeConfig holds only flat primitives, so a shallow copy suffices
+        return dict(vars(self.config))
 
 
 # Global config instance
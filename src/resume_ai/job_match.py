@@ -3,15 +3,251 @@ Job Match - Analyze how well a resume matches a job description.
 """
 
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, Optional
+import os
 import re
+import zipfile
+from xml.etree import ElementTree
 from .ollama_client import OllamaClient
 from .prompts import load_prompt
 from .config_manager import get_config
 
 
-@dataclass
+# Scalar fields, found in a single scan; each alternative has one named group
+_FIELDS_RE = re.compile(
+    r'Overall Fit Score[:\s]+(?P<overall>\d+)'
+    r'|Interview Probability[:\s]+(?P<interview>\d+)'
+    r'|Keyword Match Score[:\s]+(?P<keyword>\d+)'
+    r'|Structural.*?Readiness[:\s]+(?P<structural>\d+)'
+    r'|ATS Pass Probability[:\s]+(?P<ats_pass>\d+)'
+    r'|Seniority Alignment[:\s]+(?P<seniority>[\w\s-]+?)(?:\n|$)',
+    re.IGNORECASE
+)
+_FIELD_COUNT = len(_FIELDS_RE.groupindex)
+
+# Overall score as soon as it is complete (a non-digit follows it) in streamed text
+_STREAMED_SCORE_RE = re.compile(r'Overall Fit Score[:\s]+(\d+)\D', re.IGNORECASE)
+_SCORE_SEARCH_CHARS = 2000
+
+_VERDICT_RE = re.compile(r'Final Verdict[:\s]+(.*?)(?:\n\n|$)', re.IGNORECASE | re.DOTALL)
+
+# Non-empty line with any leading bullet marker and/or list number stripped,
+# e.g. "- foo", "2. foo", "* 3. foo" -> "foo"
+_BULLET_LINE_RE = re.compile(
+    r'^[ \t]*(?>(?:[-*•][ \t]*)?(?:\d+\.[ \t]*)?)(\S.*?)[ \t\r]*$',
+    re.MULTILINE
+)
+
+# Rough characters-per-token ratio used to size Ollama's num_keep hint
+_CHARS_PER_TOKEN = 4
+
+# Rubric criteria rated by match_parallel: (name, weight, what to consider)
+_MATCH_CRITERIA = (
+    ("Experience Relevance", 0.25,
+     "Consider how closely past roles, projects and achievements match the work this job describes."),
+    ("Skills Match", 0.25,
+     "Consider the required and preferred technologies, tools and methods the resume demonstrates."),
+    ("Domain Fit", 0.15,
+     "Consider industry and problem-domain experience relevant to this company and product."),
+    ("Seniority Alignment", 0.15,
+     "Consider years of experience, scope and leadership against the level of this role.\n"
+     "After the Gap line, add one more line: "
+     "Alignment: (Under-qualified, Appropriate or Over-qualified)"),
+    ("Title Alignment", 0.10,
+     "Consider how closely past job titles match the title and function of this role."),
+    ("Education", 0.10,
+     "Consider degrees, certifications and training against what the job asks for."),
+)
+
+# Lines of a criterion response; each alternative has one named group
+_CRITERION_RE = re.compile(
+    r'Score[:\s]+(?P<score>\d+)'
+    r'|Strength[:\s]+(?P<strength>.+)'
+    r'|Gap[:\s]+(?P<gap>.+)'
+    r'|Alignment[:\s]+(?P<alignment>[\w\s-]+?)(?:\n|$)',
+    re.IGNORECASE
+)
+
+# Compiled section patterns, keyed by section name
+_SECTION_RE_CACHE: dict[str, re.Pattern] = {}
+
+
+def _section_pattern(section_name: str) -> re.Pattern:
+    """Get compiled pattern matching the body of a named section."""
+    pattern = _SECTION_RE_CACHE.get(section_name)
+    if pattern is None:
+        pattern = re.compile(
+            rf'{section_name}[:\s]+(.*?)(?=\n\n|\n#|$)',
+            re.IGNORECASE | re.DOTALL
+        )
+        _SECTION_RE_CACHE[section_name] = pattern
+    return pattern
+
+
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W_NS + 'body'
+_W_P = _W_NS + 'p'
+_W_R = _W_NS + 'r'
+_W_HYPERLINK = _W_NS + 'hyperlink'
+_W_BR = _W_NS + 'br'
+_W_BR_TYPE = _W_NS + 'type'
+_W_T = _W_NS + 't'
+
+# Run content elements with fixed text, as python-docx's Run.text renders
+# them; w:br is a line break only as a text-wrapping break (its default type)
+_W_RUN_TEXT = {
+    _W_NS + 'cr': '\n',
+    _W_NS + 'noBreakHyphen': '-',
+    _W_NS + 'ptab': '\t',
+    _W_NS + 'tab': '\t',
+}
+
+
+def _run_text(run: ElementTree.Element) -> str:
+    """Text of one w:r, with breaks, tabs and hyphens as Run.text gives them."""
+    parts = []
+    for node in run:
+        if node.tag == _W_T:
+            parts.append(node.text or '')
+        elif node.tag == _W_BR:
+            if node.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_W_RUN_TEXT.get(node.tag, ''))
+    return ''.join(parts)
+
+
+def _paragraph_text(paragraph: ElementTree.Element) -> str:
+    """Text of one w:p from its runs and hyperlinks, like Paragraph.text."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child.iterfind(_W_R))
+    return ''.join(parts)
+
+
+def _read_docx_text(path: Path) -> str:
+    """
+    Extract body paragraph text from a .docx file.
+    
+    Streams word/document.xml instead of building python-docx's full
+    Document object graph, producing the same text as joining
+    Document.paragraphs. Each top-level body element is cleared once read.
+    """
+    parts = []
+    depth = 0
+    body_depth = None
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as f:
+        for event, element in ElementTree.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if element.tag == _W_BODY:
+                    body_depth = depth
+                continue
+            
+            # Direct children of w:body: paragraphs are read, tables and
+            # section properties skipped (Document.paragraphs leaves them out)
+            if body_depth is not None and depth == body_depth + 1:
+                if element.tag == _W_P:
+                    parts.append(_paragraph_text(element))
+                element.clear()
+            depth -= 1
+    return '\n'.join(parts)
+
+
+@lru_cache(maxsize=4)
+def _load_resume_cached(path_str: str, mtime_ns: int) -> str:
+    """
+    Read resume text, memoized on (path, mtime).
+    
+    Matching one resume against many postings parses it only once.
+    """
+    path = Path(path_str)
+    
+    if path.suffix == ".docx":
+        return _read_docx_text(path)
+    
+    # .md, .txt, .rtf or anything else: one read, one decode
+    return path.read_bytes().decode('utf-8', errors='replace')
+
+
+def _walk_scandir(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield every file entry under root, walking each directory once.
+    
+    Unreadable directories are skipped, matching Path.rglob.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _find_latest_resume() -> Path:
+    """
+    Find most recent resume file in configured locations.
+    
+    Returns:
+        Path to most recent resume
+        
+    Raises:
+        FileNotFoundError: If no resume found
+    """
+    config = get_config()
+    
+    # Check configured base resume first
+    base_resume = config.get_base_resume_path()
+    if base_resume:
+        return base_resume
+    
+    # Search in configured directories
+    search_dirs = config.get_resume_search_paths()
+    
+    # Single walk per directory, tracking the newest match inline
+    latest = None
+    latest_mtime = -1.0
+    
+    for dir_path in search_dirs:
+        for entry in _walk_scandir(dir_path):
+            name = entry.name.lower()
+            if ('resume' in name or 'cv' in name) and name.endswith(('.md', '.docx')):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
+                    latest = Path(entry.path)
+    
+    if latest is None:
+        raise FileNotFoundError(
+            "No resume found in configured locations.\n"
+            f"Searched in: {', '.join(str(d) for d in search_dirs)}\n"
+            "Options:\n"
+            "  1. Use --resume-path to specify resume file\n"
+            "  2. Set base resume: resume-builder config set base-resume /path/to/resume.md\n"
+            "  3. Run setup: resume-builder setup"
+        )
+    
+    return latest
+
+
+def _has_overall_score(response: str) -> bool:
+    """Whether a match analysis states an overall fit score."""
+    return any(match.lastgroup == "overall" for match in _FIELDS_RE.finditer(response))
+
+
+@dataclass(slots=True, frozen=True)
 class JobMatchResult:
     """Result from job-match analysis."""
     
@@ -26,6 +262,7 @@ class JobMatchResult:
     highest_impact_improvements: list[str]
     final_verdict: str
     raw_output: str
+    truncated: bool = False  # Analysis stopped once the fit score ruled the job out
 
 
 class JobMatcher:
@@ -45,7 +282,8 @@ class JobMatcher:
         job_description: str,
         resume_text: Optional[str] = None,
         resume_path: Optional[str | Path] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        stop_below: Optional[int] = None
     ) -> JobMatchResult:
         """
         Analyze how well resume matches job description.
@@ -55,6 +293,8 @@ class JobMatcher:
             resume_text: Resume text (if pasting directly)
             resume_path: Path to resume file or "auto" to search
             verbose: Show progress
+            stop_below: Stop generating as soon as the overall fit score
+                comes out below this; the result then has truncated=True
             
         Returns:
             JobMatchResult with detailed analysis
@@ -77,22 +317,193 @@ class JobMatcher:
             print("\n🤖 Analyzing job match with AI...")
             print("   This may take 30-60 seconds...\n")
         
+        # The fit score is the first section of the analysis, so a poor
+        # match can be recognized without waiting for the rest
+        on_token = None
+        low_score = None
+        if stop_below is not None:
+            head = ""
+            checking = True
+            
+            def stop_on_low_score(text: str) -> bool:
+                nonlocal head, checking, low_score
+                if not checking:
+                    return False
+                
+                head += text
+                match = _STREAMED_SCORE_RE.search(head)
+                if match is None:
+                    # No score near the top: read the rest unchecked
+                    checking = len(head) < _SCORE_SEARCH_CHARS
+                    return False
+                
+                checking = False
+                if int(match.group(1)) < stop_below:
+                    low_score = int(match.group(1))
+                    return True
+                return False
+            
+            on_token = stop_on_low_score
+        
         response = self.ollama.generate(
             prompt=prompt,
             system="You are an expert technical recruiter and ATS specialist. "
                    "Provide realistic, unbiased analysis. No optimism bias.",
-            stream=verbose,
-            verbose=verbose
+            stream=verbose or stop_below is not None,
+            verbose=verbose,
+            num_keep=self._prefix_token_estimate("job_match", resume_text),
+            on_token=on_token
         )
         
         # Parse response
         result = self._parse_response(response)
         
-        if verbose:
+        if low_score is not None:
+            result = replace(result, truncated=True)
+            if verbose:
+                print(f"\n⏹️  Fit score {low_score} is below {stop_below}; stopped the analysis early")
+        elif verbose:
             print("\n✅ Analysis complete")
         
         return result
     
+    def match_parallel(
+        self,
+        job_description: str,
+        resume_text: Optional[str] = None,
+        resume_path: Optional[str | Path] = None,
+        verbose: bool = False
+    ) -> JobMatchResult:
+        """
+        Analyze the match as separate rubric criteria rated concurrently.
+        
+        Each criterion is a short, focused request, so the generations are
+        brief and overlap on the Ollama server instead of one long answer
+        covering everything. The overall fit score is the weighted mean of
+        the criterion scores. ATS scores are not rated; if any criterion
+        fails or can't be parsed, the full match() analysis is used instead.
+        
+        Args:
+            job_description: Job posting text
+            resume_text: Resume text (if pasting directly)
+            resume_path: Path to resume file or "auto" to search
+            verbose: Show progress
+            
+        Returns:
+            JobMatchResult with detailed analysis
+            
+        Raises:
+            FileNotFoundError: If resume file not found
+        """
+        # Load resume
+        if resume_text is None:
+            if resume_path is None:
+                resume_path = "auto"
+            resume_text = self._load_resume(resume_path, verbose)
+        
+        template = load_prompt("job_match_criterion")
+        num_keep = self._prefix_token_estimate("job_match_criterion", resume_text)
+        prompts = [
+            template.format(
+                criterion=criterion,
+                focus=focus,
+                job_description=job_description,
+                resume_text=resume_text
+            )
+            for criterion, _, focus in _MATCH_CRITERIA
+        ]
+        
+        if verbose:
+            print(f"\n🤖 Rating {len(prompts)} match criteria with AI in parallel...")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+                responses = list(executor.map(
+                    lambda prompt: self.ollama.generate(
+                        prompt=prompt,
+                        system="You are an expert technical recruiter. "
+                               "Provide realistic, unbiased ratings. No optimism bias.",
+                        num_keep=num_keep
+                    ),
+                    prompts
+                ))
+        except RuntimeError as e:
+            if verbose:
+                print(f"⚠️  Criterion rating failed ({e}); running full analysis")
+            return self.match(job_description, resume_text=resume_text, verbose=verbose)
+        
+        ratings = [self._parse_criterion(response) for response in responses]
+        if any("score" not in rating for rating in ratings):
+            if verbose:
+                print("⚠️  Could not read every criterion score; running full analysis")
+            return self.match(job_description, resume_text=resume_text, verbose=verbose)
+        
+        result = self._combine_criteria(ratings, responses)
+        
+        if verbose:
+            print("✅ Analysis complete")
+        
+        return result
+    
+    def _parse_criterion(self, response: str) -> dict[str, str]:
+        """Extract the score, strength, gap and alignment of one criterion."""
+        fields: dict[str, str] = {}
+        for match in _CRITERION_RE.finditer(response):
+            name = match.lastgroup
+            if name not in fields:
+                fields[name] = match.group(name).strip()
+        return fields
+    
+    def _combine_criteria(
+        self,
+        ratings: list[dict[str, str]],
+        responses: list[str]
+    ) -> JobMatchResult:
+        """
+        Aggregate criterion ratings into a match result.
+        
+        Args:
+            ratings: Parsed fields per criterion, in _MATCH_CRITERIA order
+            responses: Raw responses per criterion
+            
+        Returns:
+            JobMatchResult scored by the weighted criterion mean
+        """
+        scores = [min(int(rating["score"]), 100) for rating in ratings]
+        overall = round(sum(
+            score * weight for score, (_, weight, _) in zip(scores, _MATCH_CRITERIA)
+        ))
+        
+        # Strengths from the best-rated criteria, gaps from the worst
+        by_score = sorted(range(len(ratings)), key=scores.__getitem__, reverse=True)
+        strengths = [ratings[i]["strength"] for i in by_score if "strength" in ratings[i]][:5]
+        gaps = [ratings[i]["gap"] for i in reversed(by_score) if "gap" in ratings[i]][:5]
+        
+        seniority = "Unknown"
+        breakdown = []
+        raw_parts = []
+        for (criterion, _, _), score, rating, response in zip(
+            _MATCH_CRITERIA, scores, ratings, responses
+        ):
+            if "alignment" in rating:
+                seniority = rating["alignment"]
+            breakdown.append(f"{criterion} {score}")
+            raw_parts.append(f"## {criterion}\n{response.strip()}")
+        
+        return JobMatchResult(
+            overall_fit_score=overall,
+            interview_probability=0.0,
+            matching_strengths=strengths,
+            gaps=gaps,
+            seniority_alignment=seniority,
+            ats_keyword_match=0,
+            ats_structural_readiness=0,
+            ats_pass_probability=0.0,
+            highest_impact_improvements=gaps[:3],
+            final_verdict=f"Weighted rubric score {overall}/100 ({', '.join(breakdown)})",
+            raw_output="\n\n".join(raw_parts)
+        )
+    
     def _load_resume(self, resume_path: str | Path, verbose: bool) -> str:
         """
         Load resume from file system.
@@ -116,18 +527,7 @@ class JobMatcher:
         if not path.exists():
             raise FileNotFoundError(f"Resume not found: {path}")
         
-        if path.suffix == ".md":
-            return path.read_text()
-        elif path.suffix == ".docx":
-            # Use python-docx to extract text
-            from docx import Document
-            doc = Document(path)
-            return "\n".join(p.text for p in doc.paragraphs)
-        elif path.suffix in [".txt", ".rtf"]:
-            return path.read_text()
-        else:
-            # Try to read as text anyway
-            return path.read_text()
+        return _load_resume_cached(str(path), path.stat().st_mtime_ns)
     
     def _find_latest_resume(self) -> Path:
         """
@@ -139,43 +539,7 @@ class JobMatcher:
         Raises:
             FileNotFoundError: If no resume found
         """
-        config = get_config()
-        
-        # Check configured base resume first
-        base_resume = config.get_base_resume_path()
-        if base_resume:
-            return base_resume
-        
-        # Search in configured directories
-        search_dirs = config.get_resume_search_paths()
-        
-        resume_files = []
-        patterns = [
-            "*resume*.md",
-            "*resume*.docx",
-            "*cv*.md",
-            "*cv*.docx",
-            "*Resume*.md",
-            "*Resume*.docx"
-        ]
-        
-        for dir_path in search_dirs:
-            if dir_path.exists():
-                for pattern in patterns:
-                    resume_files.extend(dir_path.rglob(pattern))
-        
-        if not resume_files:
-            raise FileNotFoundError(
-                "No resume found in configured locations.\n"
-                f"Searched in: {', '.join(str(d) for d in search_dirs)}\n"
-                "Options:\n"
-                "  1. Use --resume-path to specify resume file\n"
-                "  2. Set base resume: resume-builder config set base-resume /path/to/resume.md\n"
-                "  3. Run setup: resume-builder setup"
-            )
-        
-        # Return most recently modified
-        return max(resume_files, key=lambda p: p.stat().st_mtime)
+        return _find_latest_resume()
     
     def _build_prompt(self, job_description: str, resume_text: str) -> str:
         """
@@ -197,6 +561,24 @@ class JobMatcher:
         
         return prompt
     
+    def _prefix_token_estimate(self, template_name: str, resume_text: str) -> int:
+        """
+        Estimate token count of the job-independent prompt prefix.
+        
+        The match templates place the resume before the job description,
+        so this prefix is shared by every match against the same resume.
+        
+        Args:
+            template_name: Prompt template the request is built from
+            resume_text: Resume content
+            
+        Returns:
+            Approximate number of prefix tokens
+        """
+        template = load_prompt(template_name)
+        prefix_chars = template.index("{resume_text}") + len(resume_text)
+        return prefix_chars // _CHARS_PER_TOKEN
+    
     def _parse_response(self, response: str) -> JobMatchResult:
         """
         Parse Ollama response into structured result.
@@ -207,20 +589,16 @@ class JobMatcher:
         Returns:
             JobMatchResult with parsed data
         """
-        # Extract scores and data using regex
-        overall_match = re.search(r'Overall Fit Score[:\s]+(\d+)', response, re.IGNORECASE)
-        interview_prob = re.search(r'Interview Probability[:\s]+(\d+)%?', response, re.IGNORECASE)
-        keyword_match = re.search(r'Keyword Match Score[:\s]+(\d+)', response, re.IGNORECASE)
-        structural = re.search(r'Structural.*?Readiness[:\s]+(\d+)', response, re.IGNORECASE)
-        ats_pass = re.search(r'ATS Pass Probability[:\s]+(\d+)%?', response, re.IGNORECASE)
-        
-        # Extract seniority alignment
-        seniority_match = re.search(
-            r'Seniority Alignment[:\s]+([\w\s-]+?)(?:\n|$)',
-            response,
-            re.IGNORECASE
-        )
-        seniority = seniority_match.group(1).strip() if seniority_match else "Unknown"
+        # Extract scores and seniority in one pass (first occurrence wins)
+        fields: dict[str, str] = {}
+        for match in _FIELDS_RE.finditer(response):
+            name = match.lastgroup
+            if name not in fields:
+                fields[name] = match.group(name)
+                if len(fields) == _FIELD_COUNT:
+                    break
+        
+        seniority = fields["seniority"].strip() if "seniority" in fields else "Unknown"
         
         # Extract lists (strengths, gaps, improvements)
         strengths = self._extract_list_section(response, "Matching Strengths")
@@ -228,22 +606,18 @@ class JobMatcher:
         improvements = self._extract_list_section(response, "Highest Impact Improvements")
         
         # Extract verdict
-        verdict_match = re.search(
-            r'Final Verdict[:\s]+(.*?)(?:\n\n|$)',
-            response,
-            re.IGNORECASE | re.DOTALL
-        )
+        verdict_match = _VERDICT_RE.search(response)
         verdict = verdict_match.group(1).strip() if verdict_match else ""
         
         return JobMatchResult(
-            overall_fit_score=int(overall_match.group(1)) if overall_match else 0,
-            interview_probability=float(interview_prob.group(1))/100 if interview_prob else 0.0,
+            overall_fit_score=int(fields.get("overall", 0)),
+            interview_probability=float(fields.get("interview", 0))/100,
             matching_strengths=strengths,
             gaps=gaps,
             seniority_alignment=seniority,
-            ats_keyword_match=int(keyword_match.group(1)) if keyword_match else 0,
-            ats_structural_readiness=int(structural.group(1)) if structural else 0,
-            ats_pass_probability=float(ats_pass.group(1))/100 if ats_pass else 0.0,
+            ats_keyword_match=int(fields.get("keyword", 0)),
+            ats_structural_readiness=int(fields.get("structural", 0)),
+            ats_pass_probability=float(fields.get("ats_pass", 0))/100,
             highest_impact_improvements=improvements,
             final_verdict=verdict,
             raw_output=response
@@ -261,23 +635,13 @@ class JobMatcher:
             List of items
         """
         # Find section
-        pattern = rf'{section_name}[:\s]+(.*?)(?=\n\n|\n#|$)'
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        match = _section_pattern(section_name).search(text)
         
         if not match:
             return []
         
         section_text = match.group(1)
         
-        # Extract bullet points
-        items = []
-        for line in section_text.split('\n'):
-            line = line.strip()
-            # Remove bullet markers
-            line = re.sub(r'^[-*•]\s*', '', line)
-            line = re.sub(r'^\d+\.\s*', '', line)
-            if line:
-                items.append(line)
-        
-        return items[:5]  # Return top 5
+        # Extract bullet points (top 5)
+        return [m.group(1) for m in islice(_BULLET_LINE_RE.finditer(section_text), 5)]
 
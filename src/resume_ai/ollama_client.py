@@ -2,11 +2,59 @@
 Ollama Client - Interface to local Ollama instance for AI processing.
 """
 
+import asyncio
+import time
 import requests
-from typing import Optional
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Callable, Optional
 from dataclasses import dataclass
+from urllib3.util.retry import Retry
 import sys
 
+try:
+    # orjson works on bytes directly and is much faster on token frames
+    # and large prompt payloads
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    import json
+    from json import loads as _json_loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_STREAM_CHUNK_SIZE = 65536
+
+# Verbose streaming flushes stdout after this many tokens or seconds
+_FLUSH_EVERY_TOKENS = 64
+_FLUSH_INTERVAL = 0.05
+
+def _create_session() -> requests.Session:
+    """
+    Create a pooled HTTP session.
+    
+    Reusing one keep-alive connection avoids a TCP connect/teardown
+    for every request to the Ollama server.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+@lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """Process-wide session for clients that share Ollama connections."""
+    return _create_session()
+
 
 @dataclass
 class OllamaConfig:
@@ -16,21 +64,45 @@ class OllamaConfig:
     model: str = "llama3.1"
     temperature: float = 0.7
     timeout: int = 180  # 3 minutes for long responses
-    
-    
+    keep_alive: Optional[str] = "10m"  # How long Ollama keeps the model loaded
+
+
 class OllamaClient:
     """Client for interacting with local Ollama instance."""
     
-    def __init__(self, config: Optional[OllamaConfig] = None):
+    def __init__(
+        self,
+        config: Optional[OllamaConfig] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize Ollama client.
         
         Args:
             config: Optional configuration. Uses defaults if not provided.
+            session: HTTP session to share with other clients (e.g.
+                shared_session()). The client creates and owns one if None.
         """
         self.config = config or OllamaConfig()
+        self._owns_session = session is None
+        self._session = self._create_session() if session is None else session
         self._check_connection()
     
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session."""
+        return _create_session()
+    
+    def close(self) -> None:
+        """Close pooled connections, unless the session is shared."""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self) -> "OllamaClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def _check_connection(self) -> None:
         """
         Verify Ollama is running and accessible.
@@ -39,7 +111,7 @@ class OllamaClient:
             RuntimeError: If cannot connect to Ollama
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.config.base_url}/api/tags",
                 timeout=5
             )
@@ -71,7 +143,9 @@ class OllamaClient:
         prompt: str,
         system: Optional[str] = None,
         stream: bool = False,
-        verbose: bool = False
+        verbose: bool = False,
+        num_keep: Optional[int] = None,
+        on_token: Optional[Callable[[str], bool]] = None
     ) -> str:
         """
         Generate response from Ollama.
@@ -81,6 +155,10 @@ class OllamaClient:
             system: System prompt (optional)
             stream: Stream response for real-time output
             verbose: Show generation progress
+            num_keep: Number of leading prompt tokens Ollama should retain
+                (optional; hint for prompts sharing a stable prefix)
+            on_token: Called with each streamed token; returning True stops
+                the generation and returns the text so far (stream only)
             
         Returns:
             Generated text response
@@ -105,22 +183,28 @@ class OllamaClient:
         if system:
             payload["system"] = system
         
+        if num_keep is not None:
+            payload["options"]["num_keep"] = num_keep
+        
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
+        
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.config.base_url}/api/generate",
-                json=payload,
+                data=_json_dumps(payload),
+                headers=_JSON_HEADERS,
                 timeout=self.config.timeout,
                 stream=stream
             )
             response.raise_for_status()
             
             if stream:
-                return self._handle_stream(response, verbose)
+                result, _ = self._handle_stream(response, verbose, on_token)
             else:
-                result = response.json()["response"]
+                result = _json_loads(response.content)["response"]
                 if verbose:
                     print("✅ Done")
-                return result
                 
         except requests.exceptions.Timeout:
             raise RuntimeError(
@@ -129,36 +213,103 @@ class OllamaClient:
             )
         except Exception as e:
             raise RuntimeError(f"Ollama generation failed: {e}")
+        
+        return result
     
-    def _handle_stream(self, response, verbose: bool) -> str:
+    async def agenerate(self, prompt: str, system: Optional[str] = None) -> str:
+        """
+        Generate response from Ollama without blocking the event loop.
+        
+        The request runs in a worker thread on the pooled session, so
+        several calls can be awaited together with ``asyncio.gather`` and
+        queue on the Ollama server concurrently.
+        
+        Args:
+            prompt: User prompt
+            system: System prompt (optional)
+            
+        Returns:
+            Generated text response
+            
+        Raises:
+            RuntimeError: If generation fails
+        """
+        return await asyncio.to_thread(self.generate, prompt, system)
+    
+    def _handle_stream(
+        self,
+        response,
+        verbose: bool,
+        on_token: Optional[Callable[[str], bool]] = None
+    ) -> tuple[str, bool]:
         """
         Handle streaming response for real-time output.
         
         Args:
             response: Streaming response object
             verbose: Whether to print to console
+            on_token: Called with each token; returning True stops reading
             
         Returns:
-            Complete response text
+            (response text, whether on_token stopped it early)
         """
-        import json
+        parts = []
+        buffer = bytearray()
+        done = False
+        stopped = False
+        
+        # Echo tokens with plain writes, flushing in batches rather than per token
+        write = sys.stdout.write
+        pending = 0
+        last_flush = time.monotonic()
         
-        full_response = ""
+        def emit(data: dict) -> bool:
+            nonlocal pending, last_flush, stopped
+            text = data.get("response", "")
+            parts.append(text)
+            
+            if on_token is not None and on_token(text):
+                stopped = True
+            
+            if verbose:
+                write(text)
+                pending += 1
+                now = time.monotonic()
+                if pending >= _FLUSH_EVERY_TOKENS or now - last_flush >= _FLUSH_INTERVAL:
+                    sys.stdout.flush()
+                    pending = 0
+                    last_flush = now
+            
+            # Check if done
+            return stopped or data.get("done", False)
         
         try:
-            for line in response.iter_lines():
-                if line:
-                    data = json.loads(line.decode('utf-8'))
-                    text = data.get("response", "")
-                    
-                    if verbose:
-                        print(text, end="", flush=True)
-                    
-                    full_response += text
-                    
-                    # Check if done
-                    if data.get("done", False):
+            for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                buffer += chunk
+                start = 0
+                
+                # Parse every complete NDJSON frame in the buffer
+                while not done:
+                    end = buffer.find(b"\n", start)
+                    if end == -1:
                         break
+                    
+                    line = bytes(buffer[start:end])
+                    start = end + 1
+                    if line.strip():
+                        done = emit(_json_loads(line))
+                
+                del buffer[:start]
+                if done:
+                    break
+            
+            # Final frame without a trailing newline
+            if not done and buffer.strip():
+                emit(_json_loads(bytes(buffer)))
+            
+            # Dropping the connection makes Ollama stop generating
+            if stopped:
+                response.close()
             
             if verbose:
                 print("\n✅ Done")
@@ -168,7 +319,7 @@ class OllamaClient:
                 print("\n\n⚠️  Generation interrupted by user")
             raise
         
-        return full_response
+        return "".join(parts), stopped
     
     def check_model(self, model_name: Optional[str] = None) -> bool:
         """
@@ -183,7 +334,7 @@ class OllamaClient:
         model = model_name or self.config.model
         
         try:
-            response = requests.get(f"{self.config.base_url}/api/tags")
+            response = self._session.get(f"{self.config.base_url}/api/tags")
             response.raise_for_status()
             
             data = response.json()
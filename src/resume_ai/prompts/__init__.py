@@ -2,11 +2,16 @@
 Prompt Templates - Load AI prompts from template files.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 PROMPTS_DIR = Path(__file__).parent
 
+# Templates ship with the package, so index them once at import time
+_PROMPTS = {p.stem: p for p in PROMPTS_DIR.glob("*.txt")}
 
+
+@lru_cache(maxsize=32)
 def load_prompt(name: str) -> str:
     """
     Load prompt template by name.
@@ -20,12 +25,12 @@ def load_prompt(name: str) -> str:
     Raises:
         FileNotFoundError: If prompt template not found
     """
-    path = PROMPTS_DIR / f"{name}.txt"
+    path = _PROMPTS.get(name)
     
-    if not path.exists():
+    if path is None:
         raise FileNotFoundError(
             f"Prompt template not found: {name}\n"
-            f"Expected at: {path}"
+            f"Expected at: {PROMPTS_DIR / f'{name}.txt'}"
         )
     
     return path.read_text()
@@ -38,8 +43,5 @@ def list_prompts() -> list[str]:
     Returns:
         List of prompt names
     """
-    return [
-        p.stem
-        for p in PROMPTS_DIR.glob("*.txt")
-    ]
+    return list(_PROMPTS)
 
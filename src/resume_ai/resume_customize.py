@@ -2,17 +2,211 @@
 Resume Customize - AI-powered resume customization for specific jobs.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional
 import re
 from .ollama_client import OllamaClient
 from .prompts import load_prompt
-from .skills_manager import SkillsManager
-from .config_manager import get_config
+from .skills_manager import SkillsManager, get_manager
+from .config_manager import ConfigManager, get_config
 
 
-@dataclass
+_RESUME_MARKERS_RE = re.compile(
+    r'# CUSTOMIZED RESUME START(.*?)# CUSTOMIZED RESUME END',
+    re.DOTALL
+)
+_RESUME_CODE_BLOCK_RE = re.compile(r'```markdown\n(# .*?)\n```', re.DOTALL)
+_COVER_LETTER_RE = re.compile(
+    r'# COVER LETTER.*?$(.*?)(?=# |$)',
+    re.MULTILINE | re.DOTALL
+)
+_CHECKLIST_RE = re.compile(
+    r'# APPLICATION CHECKLIST(.*?)(?=# |$)',
+    re.MULTILINE | re.DOTALL
+)
+# Match the section header and capture until next top-level heading (# ) or end of string
+_COMPENSATION_RE = re.compile(
+    r'# Compensation Negotiation Guide\s*\n(.*?)(?=\n# [^#]|$)',
+    re.DOTALL | re.IGNORECASE
+)
+_SKILLS_SECTION_RE = re.compile(
+    r'## Core Skills\s*\n(.*?)(?=\n## |\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+# One skills-section line: "### Heading", "**Category**: a, b", or an item.
+# Bold lines with a colon that are not "**Category**: ..." match no group.
+_SKILL_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'### [^\S\n]*(?P<heading>\S[^\n]*?)'
+    r'|\*\*(?:(?P<category>[^*\n]+)\*\*:[^\S\n]*(?P<values>\S[^\n]*?)|[^\n]*:[^\n]*?)'
+    r'|(?P<item>\S[^\n]*?)'
+    r')[^\S\n]*$',
+    re.MULTILINE
+)
+_AT_COMPANY_RE = re.compile(r'at ([A-Z][A-Za-z\s]+)')
+_COMPANY_HINT_RE = re.compile(r'at |company|about us', re.IGNORECASE)
+_ROLE_HINT_RE = re.compile(r'position:|role:|hiring', re.IGNORECASE)
+_JOB_INFO_LINES = 10  # Company/role are only looked for near the top
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Rough characters-per-token ratio used to size Ollama's num_keep hint
+_CHARS_PER_TOKEN = 4
+
+_MAX_WRITE_WORKERS = 4
+
+# Lines that open the instruction parts of the customize and job-match
+# templates; the combined template splices the two around them
+_CUSTOMIZE_INSTRUCTIONS = "Provide complete analysis and customized resume in Markdown format."
+_MATCH_INSTRUCTIONS = "Provide your analysis in the following structured format:"
+
+# Heading separating the match analysis from the customization in a
+# combined response
+_CUSTOMIZATION_PART_HEADING = "# PART 2: RESUME CUSTOMIZATION"
+
+
+@lru_cache(maxsize=1)
+def _combined_prompt_template() -> str:
+    """
+    Build a template asking for the job-match analysis and the customization.
+    
+    The customize template's opening (base resume, company, role and job
+    description) is sent once, followed by the job-match instructions and
+    then the customize instructions.
+    """
+    customize_head, customize_body = load_prompt("resume_customize").split(
+        _CUSTOMIZE_INSTRUCTIONS, 1
+    )
+    match_body = load_prompt("job_match").split(_MATCH_INSTRUCTIONS, 1)[1]
+    
+    return (
+        f"{customize_head}"
+        "Respond in two parts, in order.\n\n"
+        "# PART 1: JOB MATCH ANALYSIS\n\n"
+        f"{_MATCH_INSTRUCTIONS}{match_body.rstrip()}\n\n"
+        f"{_CUSTOMIZATION_PART_HEADING}\n\n"
+        f"{_CUSTOMIZE_INSTRUCTIONS}{customize_body}"
+    )
+
+
+def _normalize_resume_text(text: str) -> str:
+    """
+    Canonicalize resume text so identical resumes yield identical prompts.
+    
+    Line endings are unified and trailing whitespace is stripped, keeping
+    the prompt prefix byte-identical across runs so Ollama can reuse it.
+    """
+    return "\n".join(line.rstrip() for line in text.splitlines()).strip()
+
+
+@lru_cache(maxsize=16)
+def _read_text_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """
+    Read and normalize a base resume, memoized on (path, mtime, size).
+    
+    Customizing one resume for many jobs reads it from disk only once.
+    """
+    return _normalize_resume_text(Path(path_str).read_text(encoding='utf-8'))
+
+
+def _write_file(item: tuple[Path, str]) -> None:
+    """Write one (path, content) pair."""
+    path, content = item
+    path.write_text(content)
+
+
+def _scan_resume_dir(dir_path: Path) -> tuple[Optional[Path], Optional[Path]]:
+    """
+    Scan one directory for base resume candidates.
+    
+    Args:
+        dir_path: Directory to scan (missing directories are skipped)
+        
+    Returns:
+        (first "master"/"Master" .md file, most recent "resume" .md file);
+        scanning stops as soon as a master resume is found
+    """
+    latest = None
+    latest_mtime = -1.0
+    
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') or not name.endswith('.md'):
+                    continue
+                
+                is_master = 'master' in name or 'Master' in name
+                if not (is_master or 'resume' in name):
+                    continue
+                
+                try:
+                    if not entry.is_file():
+                        continue
+                    if is_master:
+                        return Path(entry.path), None
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                
+                if mtime > latest_mtime:
+                    latest, latest_mtime = Path(entry.path), mtime
+    except OSError:
+        return None, None
+    
+    return None, latest
+
+
+def _find_base_resume(config: ConfigManager, verbose: bool) -> Path:
+    """
+    Find the base resume to customize.
+    
+    Prefers the configured base resume, then a "master" resume in the
+    search directories, then the most recent resume in the first directory
+    that has one.
+    
+    Raises:
+        FileNotFoundError: If no resume is found
+    """
+    # Check if configured base resume exists
+    base_resume = config.get_base_resume_path()
+    if base_resume:
+        if verbose:
+            print(f"   Using configured base resume: {base_resume.name}")
+        return base_resume
+    
+    # Search in configured directories
+    search_dirs = config.get_resume_search_paths()
+    
+    # Look for "master" resume first, falling back to the most recent
+    # resume in the first directory that has one
+    fallback = None
+    for dir_path in search_dirs:
+        master, latest = _scan_resume_dir(dir_path)
+        if master is not None:
+            return master
+        if fallback is None:
+            fallback = latest
+    
+    if fallback is not None:
+        return fallback
+    
+    raise FileNotFoundError(
+        "No base resume found.\n"
+        f"Searched in: {', '.join(str(d) for d in search_dirs)}\n"
+        "Options:\n"
+        "  1. Specify with --base-resume option\n"
+        "  2. Set base resume: resume-builder config set base-resume /path/to/resume.md\n"
+        "  3. Run setup: resume-builder setup"
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class CustomizationResult:
     """Result from resume customization."""
     
@@ -25,12 +219,18 @@ class CustomizationResult:
     output_directory: Path
     files_created: list[Path]
     compensation_negotiation_guide_md: Optional[str] = None
+    resume_md_path: Optional[Path] = None  # The customized resume .md file
+    match_analysis_md: Optional[str] = None  # Set for combined match requests
 
 
 class ResumeCustomizer:
     """Customize resumes for specific job descriptions using AI."""
     
-    def __init__(self, ollama_client: OllamaClient, skills_manager: Optional[SkillsManager] = None):
+    def __init__(
+        self,
+        ollama_client: OllamaClient,
+        skills_manager: Optional[SkillsManager] = None
+    ):
         """
         Initialize resume customizer.
         
@@ -44,7 +244,7 @@ class ResumeCustomizer:
     def _init_skills_manager(self) -> Optional[SkillsManager]:
         """Initialize skills manager if available."""
         try:
-            return SkillsManager()
+            return get_manager()
         except FileNotFoundError:
             # Skills inventory not found - will work without it
             return None
@@ -56,7 +256,9 @@ class ResumeCustomizer:
         company_name: Optional[str] = None,
         role_title: Optional[str] = None,
         output_dir: Optional[str | Path] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        base_resume_text: Optional[str] = None,
+        include_match_analysis: bool = False
     ) -> CustomizationResult:
         """
         Customize resume for a specific job.
@@ -68,19 +270,29 @@ class ResumeCustomizer:
             role_title: Job title (auto-extract if None)
             output_dir: Where to save files (auto-create if None)
             verbose: Show progress
+            base_resume_text: Base resume content already read by the
+                caller (read from base_resume_path if None)
+            include_match_analysis: Also ask for the job-match analysis in
+                the same request, returned as match_analysis_md
             
         Returns:
             CustomizationResult with all generated files
         """
-        # Load base resume
-        if base_resume_path is None:
-            if verbose:
-                print("🔍 Finding base resume...")
-            base_resume_path = self._find_base_resume(verbose)
+        cfg = get_config()
         
-        base_resume = Path(base_resume_path).read_text()
+        # Load base resume
+        if base_resume_text is not None:
+            base_resume = _normalize_resume_text(base_resume_text)
+        else:
+            if base_resume_path is None:
+                if verbose:
+                    print("🔍 Finding base resume...")
+                base_resume_path = self._find_base_resume(cfg, verbose)
+            
+            stat = Path(base_resume_path).stat()
+            base_resume = _read_text_cached(str(base_resume_path), stat.st_mtime_ns, stat.st_size)
         
-        if verbose:
+        if verbose and base_resume_path is not None:
             print(f"   Using: {Path(base_resume_path).name}")
         
         # Extract company and role if not provided
@@ -97,7 +309,7 @@ class ResumeCustomizer:
         
         # Create output directory
         if output_dir is None:
-            output_dir = self._create_output_directory(company_name)
+            output_dir = self._create_output_directory(cfg, company_name)
         else:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -110,7 +322,8 @@ class ResumeCustomizer:
             job_description,
             base_resume,
             company_name,
-            role_title
+            role_title,
+            include_match_analysis
         )
         
         # Call Ollama
@@ -124,7 +337,8 @@ class ResumeCustomizer:
                    "Maintain complete accuracy - never fabricate experience. "
                    "Output in clean Markdown format.",
             stream=verbose,
-            verbose=verbose
+            verbose=verbose,
+            num_keep=self._prefix_token_estimate(base_resume)
         )
         
         # Parse and save outputs
@@ -139,85 +353,90 @@ class ResumeCustomizer:
             verbose
         )
         
+        if include_match_analysis:
+            match_analysis, heading, _ = response.partition(_CUSTOMIZATION_PART_HEADING)
+            if heading:
+                result = replace(result, match_analysis_md=match_analysis)
+        
         if verbose:
             print(f"\n✅ Complete! Files saved to: {output_dir}")
         
         return result
     
-    def _find_base_resume(self, verbose: bool) -> Path:
-        """Find base resume to use."""
-        config = get_config()
+    async def customize_many(
+        self,
+        job_descriptions: list[str],
+        base_resume_path: Optional[str | Path] = None,
+        verbose: bool = False
+    ) -> list[CustomizationResult]:
+        """
+        Customize the base resume for several jobs concurrently.
         
-        # Check if configured base resume exists
-        base_resume = config.get_base_resume_path()
-        if base_resume:
-            if verbose:
-                print(f"   Using configured base resume: {base_resume.name}")
-            return base_resume
-        
-        # Search in configured directories
-        search_dirs = config.get_resume_search_paths()
-        
-        # Look for "master" resume first
-        for dir_path in search_dirs:
-            if dir_path.exists():
-                for pattern in ["*master*.md", "*Master*.md"]:
-                    matches = list(dir_path.glob(pattern))
-                    if matches:
-                        return matches[0]
-        
-        # Fall back to any resume
-        for dir_path in search_dirs:
-            if dir_path.exists():
-                matches = list(dir_path.glob("*resume*.md"))
-                if matches:
-                    # Return most recent
-                    return max(matches, key=lambda p: p.stat().st_mtime)
-        
-        raise FileNotFoundError(
-            "No base resume found.\n"
-            f"Searched in: {', '.join(str(d) for d in search_dirs)}\n"
-            "Options:\n"
-            "  1. Specify with --base-resume option\n"
-            "  2. Set base resume: resume-builder config set base-resume /path/to/resume.md\n"
-            "  3. Run setup: resume-builder setup"
-        )
+        Each job runs the regular ``customize`` flow in a worker thread so
+        the Ollama requests overlap. Streaming output is disabled because
+        interleaved token streams would be unreadable. Every prompt starts
+        with the same base resume, so avoid editing it mid-batch.
+        
+        Args:
+            job_descriptions: Job posting texts
+            base_resume_path: Path to base resume (auto-detect if None)
+            verbose: Show progress
+            
+        Returns:
+            One CustomizationResult per job, in input order
+        """
+        if base_resume_path is None:
+            base_resume_path = self._find_base_resume(get_config(), verbose)
+        
+        if verbose:
+            print(f"🤖 Customizing for {len(job_descriptions)} job(s) concurrently...")
+        
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self.customize, job_description, base_resume_path)
+            for job_description in job_descriptions
+        ))
+        
+        if verbose:
+            for result in results:
+                print(f"   ✓ {result.company_name}: {result.output_directory}")
+        
+        return list(results)
+    
+    def _find_base_resume(self, config: ConfigManager, verbose: bool) -> Path:
+        """Find base resume to use."""
+        return _find_base_resume(config, verbose)
     
     def _extract_job_info(self, job_description: str) -> dict:
         """Extract company name and role title from job description."""
         # Simple extraction - could be improved
-        lines = job_description.split('\n')
+        # maxsplit bounds the work to the lines actually inspected
+        lines = job_description.split('\n', _JOB_INFO_LINES)[:_JOB_INFO_LINES]
         
         company = "Company"
         role = "Role"
         
-        # Try to find common patterns
-        for line in lines[:10]:  # Check first 10 lines
-            if any(word in line.lower() for word in ["at ", "company", "about us"]):
+        # Try to find common patterns; later lines override earlier hits
+        for line in lines:
+            if _COMPANY_HINT_RE.search(line):
                 # Extract company name
-                match = re.search(r'at ([A-Z][A-Za-z\s]+)', line)
+                match = _AT_COMPANY_RE.search(line)
                 if match:
                     company = match.group(1).strip()
             
-            if any(word in line.lower() for word in ["position:", "role:", "hiring"]):
+            if _ROLE_HINT_RE.search(line):
                 # Extract role
                 role = line.split(':', 1)[-1].strip()
         
         # Sanitize for file names
-        company = re.sub(r'[^\w\s-]', '', company).strip()
-        company = re.sub(r'\s+', '_', company)
+        company = _NON_WORD_RE.sub('', company).strip()
+        company = _WHITESPACE_RE.sub('_', company)
         
         return {"company": company, "role": role}
     
-    def _create_output_directory(self, company_name: str) -> Path:
+    def _create_output_directory(self, config: ConfigManager, company_name: str) -> Path:
         """Create output directory for company."""
-        config = get_config()
-        base = config.get_output_directory()
-        
-        # Create base directory if it doesn't exist
-        base.mkdir(parents=True, exist_ok=True)
-        
-        output_dir = base / company_name
+        # parents=True creates the base output directory as needed
+        output_dir = config.get_output_directory() / company_name
         output_dir.mkdir(parents=True, exist_ok=True)
         
         return output_dir
@@ -227,7 +446,8 @@ class ResumeCustomizer:
         job_description: str,
         base_resume: str,
         company_name: str,
-        role_title: str
+        role_title: str,
+        include_match_analysis: bool = False
     ) -> str:
         """Build prompt for Ollama."""
         # Extract current skills from resume
@@ -254,7 +474,10 @@ class ResumeCustomizer:
             except Exception as e:
                 suggested_skills_text = f"Error finding matching skills: {e}"
         
-        template = load_prompt("resume_customize")
+        if include_match_analysis:
+            template = _combined_prompt_template()
+        else:
+            template = load_prompt("resume_customize")
         
         prompt = template.format(
             job_description=job_description,
@@ -266,6 +489,24 @@ class ResumeCustomizer:
         
         return prompt
     
+    def _prefix_token_estimate(self, base_resume: str) -> int:
+        """
+        Estimate token count of the job-independent prompt prefix.
+        
+        The customize template places its opening line and the base
+        resume before any job-specific content, so this prefix is shared
+        by every customization of the same resume.
+        
+        Args:
+            base_resume: Normalized base resume text
+            
+        Returns:
+            Approximate number of prefix tokens
+        """
+        template = load_prompt("resume_customize")
+        prefix_chars = template.index("{base_resume}") + len(base_resume)
+        return prefix_chars // _CHARS_PER_TOKEN
+    
     def _extract_skills_from_resume(self, resume_text: str) -> dict:
         """
         Extract skills section from resume markdown.
@@ -279,49 +520,38 @@ class ResumeCustomizer:
         skills = {}
         
         # Find Core Skills section
-        skills_match = re.search(
-            r'## Core Skills\s*\n(.*?)(?=\n## |\Z)',
-            resume_text,
-            re.DOTALL | re.IGNORECASE
-        )
+        skills_match = _SKILLS_SECTION_RE.search(resume_text)
         
         if not skills_match:
             return skills
         
-        skills_section = skills_match.group(1)
         current_category = "General"
         
-        for line in skills_section.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
+        # One pass over the section: headings, bold categories, plain items
+        for match in _SKILL_LINE_RE.finditer(skills_match.group(1)):
+            heading, category, values, item = match.group('heading', 'category', 'values', 'item')
             
-            # Check for category heading (### or **bold**)
-            if line.startswith('### '):
-                current_category = line[4:].strip()
+            if heading is not None:
+                # ### Category heading
+                current_category = heading
                 skills[current_category] = []
             
-            elif line.startswith('**') and ':' in line:
+            elif category is not None:
                 # Format: **Category**: skill1, skill2
-                match = re.match(r'\*\*([^*]+)\*\*:\s*(.+)', line)
-                if match:
-                    category = match.group(1).strip()
-                    skills_text = match.group(2).strip()
-                    skills[category] = [s.strip() for s in skills_text.split(',')]
+                skills[category.strip()] = [s.strip() for s in values.split(',')]
             
-            else:
+            elif item is not None:
                 # Regular skill item
-                if current_category not in skills:
-                    skills[current_category] = []
+                category_skills = skills.setdefault(current_category, [])
                 
                 # Split by comma if multiple skills
-                if ',' in line and not line.startswith('-'):
-                    skills[current_category].extend([s.strip() for s in line.split(',')])
-                elif line:
+                if ',' in item and not item.startswith('-'):
+                    category_skills.extend([s.strip() for s in item.split(',')])
+                else:
                     # Remove bullet if present
-                    skill = line.lstrip('- •*').strip()
+                    skill = item.lstrip('- •*').strip()
                     if skill:
-                        skills[current_category].append(skill)
+                        category_skills.append(skill)
         
         return skills
     
@@ -335,57 +565,39 @@ class ResumeCustomizer:
     ) -> CustomizationResult:
         """Parse AI response and save files."""
         # Extract customized resume (between markers or in code block)
-        resume_match = re.search(
-            r'# CUSTOMIZED RESUME START(.*?)# CUSTOMIZED RESUME END',
-            response,
-            re.DOTALL
-        )
+        resume_match = _RESUME_MARKERS_RE.search(response)
         
         if not resume_match:
             # Try code block
-            resume_match = re.search(
-                r'```markdown\n(# .*?)\n```',
-                response,
-                re.DOTALL
-            )
+            resume_match = _RESUME_CODE_BLOCK_RE.search(response)
         
         customized_resume = resume_match.group(1).strip() if resume_match else ""
         
+        # Collect (file, content) pairs; all files are written together below
+        writes = []
+        
         # Save resume
         resume_file = output_dir / f"{company_name}_Bisike_Nnadi_Resume_2025.md"
-        resume_file.write_text(customized_resume)
+        writes.append((resume_file, customized_resume))
         
         # Save full analysis
         analysis_file = output_dir / f"{company_name}_Analysis.md"
-        analysis_file.write_text(response)
+        writes.append((analysis_file, response))
         
         # Extract cover letter points (if present)
-        cl_match = re.search(
-            r'# COVER LETTER.*?$(.*?)(?=# |$)',
-            response,
-            re.MULTILINE | re.DOTALL
-        )
+        cl_match = _COVER_LETTER_RE.search(response)
         cover_letter = cl_match.group(1).strip() if cl_match else "See full analysis"
         cl_file = output_dir / f"{company_name}_Cover_Letter_Points.md"
-        cl_file.write_text(f"# Cover Letter Key Points - {company_name}\n\n{cover_letter}")
+        writes.append((cl_file, f"# Cover Letter Key Points - {company_name}\n\n{cover_letter}"))
         
         # Extract checklist (if present)
-        checklist_match = re.search(
-            r'# APPLICATION CHECKLIST(.*?)(?=# |$)',
-            response,
-            re.MULTILINE | re.DOTALL
-        )
+        checklist_match = _CHECKLIST_RE.search(response)
         checklist = checklist_match.group(1).strip() if checklist_match else "See full analysis"
         checklist_file = output_dir / f"{company_name}_Application_Checklist.md"
-        checklist_file.write_text(f"# Application Checklist - {company_name}\n\n{checklist}")
+        writes.append((checklist_file, f"# Application Checklist - {company_name}\n\n{checklist}"))
         
         # Extract compensation negotiation guide (if present and relevant)
-        # Match the section header and capture until next top-level heading (# ) or end of string
-        compensation_match = re.search(
-            r'# Compensation Negotiation Guide\s*\n(.*?)(?=\n# [^#]|$)',
-            response,
-            re.DOTALL | re.IGNORECASE
-        )
+        compensation_match = _COMPENSATION_RE.search(response)
         compensation_guide = None
         compensation_file = None
         
@@ -395,11 +607,16 @@ class ResumeCustomizer:
             if compensation_content and len(compensation_content) > 100:
                 compensation_guide = compensation_content
                 compensation_file = output_dir / f"{company_name}_Compensation_Negotiation_Guide.md"
-                compensation_file.write_text(f"# Compensation Negotiation Guide - {company_name}\n\n{compensation_content}")
+                writes.append((
+                    compensation_file,
+                    f"# Compensation Negotiation Guide - {company_name}\n\n{compensation_content}"
+                ))
+        
+        # Overlap the file writes; list() re-raises any write error
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(writes))) as executor:
+            list(executor.map(_write_file, writes))
         
-        files_created = [resume_file, analysis_file, cl_file, checklist_file]
-        if compensation_file:
-            files_created.append(compensation_file)
+        files_created = [path for path, _ in writes]
         
         if verbose:
             print(f"   ✓ {resume_file.name}")
@@ -418,6 +635,7 @@ class ResumeCustomizer:
             application_checklist_md=checklist,
             compensation_negotiation_guide_md=compensation_guide,
             output_directory=output_dir,
-            files_created=files_created
+            files_created=files_created,
+            resume_md_path=resume_file
         )
 
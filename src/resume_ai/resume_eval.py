@@ -2,13 +2,62 @@
 Resume Eval - Evaluate and compare multiple resumes, generate master resume.
 """
 
+import asyncio
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
 from .ollama_client import OllamaClient
+from .job_match import _load_resume_cached, _walk_scandir
 from .prompts import load_prompt
 
 
+_MARKDOWN_BLOCK_RE = re.compile(r'```markdown\n(.*?)\n```', re.DOTALL)
+
+_SYSTEM_PROMPT = (
+    "You are an expert resume consultant and ATS specialist. "
+    "Provide detailed, actionable analysis in clean Markdown format."
+)
+
+_MAX_RESUMES = 5
+_MAX_LOAD_WORKERS = 8
+
+# Names matched by the old *resume*/*Resume*/*cv* .md/.docx globs
+_RESUME_FILE_RE = re.compile(r'(?:resume|Resume|cv).*\.(?:md|docx)$')
+
+# Closes each resume block in the evaluation prompt
+_RESUME_SEPARATOR = "\n\n" + "=" * 80
+
+
+def _read_resume_file(path: Path) -> str:
+    """Read resume text from a Markdown or .docx file."""
+    if path.suffix == ".docx":
+        # Parsed .docx text is shared with job matching's cache
+        return _load_resume_cached(str(path), path.stat().st_mtime_ns)
+    return path.read_text()
+
+
+def _scan_files(dir_path: Path) -> Iterator[os.DirEntry]:
+    """Yield the file entries directly inside dir_path."""
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield entry
+    except OSError:
+        return
+
+
+def _file_size(path: Path) -> int:
+    """File size for scheduling; unreadable files sort last."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
 @dataclass
 class ResumeEvaluation:
     """Evaluation results for a single resume."""
@@ -95,8 +144,7 @@ class ResumeEvaluator:
         
         response = self.ollama.generate(
             prompt=prompt,
-            system="You are an expert resume consultant and ATS specialist. "
-                   "Provide detailed, actionable analysis in clean Markdown format.",
+            system=_SYSTEM_PROMPT,
             stream=verbose,
             verbose=verbose
         )
@@ -109,6 +157,46 @@ class ResumeEvaluator:
         
         return result
     
+    async def evaluate_many(
+        self,
+        resume_texts: list[str],
+        verbose: bool = False
+    ) -> list[ResumeEvalResult]:
+        """
+        Evaluate several resumes independently and concurrently.
+        
+        Each resume gets its own smaller prompt; all requests are in
+        flight at once, so wall time tracks the slowest evaluation rather
+        than the sum of them.
+        
+        Args:
+            resume_texts: Resume texts to evaluate
+            verbose: Show progress
+            
+        Returns:
+            One ResumeEvalResult per resume, in input order
+        """
+        batches = [
+            [(f"Resume {chr(64+i)}", text)]
+            for i, text in enumerate(resume_texts, 1)
+        ]
+        
+        if verbose:
+            print(f"🤖 Evaluating {len(batches)} resume(s) concurrently...")
+        
+        responses = await asyncio.gather(*(
+            self.ollama.agenerate(self._build_prompt(resumes), system=_SYSTEM_PROMPT)
+            for resumes in batches
+        ))
+        
+        if verbose:
+            print("✅ Evaluation complete")
+        
+        return [
+            self._parse_response(response, resumes)
+            for response, resumes in zip(responses, batches)
+        ]
+    
     def _discover_resumes(
         self,
         search_scope: Optional[str | Path],
@@ -134,42 +222,33 @@ class ResumeEvaluator:
                 Path.cwd()
             ]
         
-        resume_files = []
-        patterns = [
-            "*resume*.md",
-            "*resume*.docx",
-            "*cv*.md",
-            "*cv*.docx",
-            "*Resume*.md",
-            "*Resume*.docx"
-        ]
-        
+        # One walk per directory; stop as soon as enough resumes are found
+        resume_files = {}
         for dir_path in search_dirs:
-            if dir_path.exists():
-                for pattern in patterns:
-                    if search_scope:
-                        # Use glob for single directory
-                        resume_files.extend(dir_path.glob(pattern))
-                    else:
-                        # Use rglob for recursive search
-                        resume_files.extend(list(dir_path.rglob(pattern))[:5])  # Limit to 5
-        
-        # Remove duplicates
-        resume_files = list(set(resume_files))
-        
-        # Load and return
+            entries = _scan_files(dir_path) if search_scope else _walk_scandir(dir_path)
+            for entry in entries:
+                if _RESUME_FILE_RE.search(entry.name):
+                    resume_files.setdefault(Path(entry.path), None)
+                    if len(resume_files) >= _MAX_RESUMES:
+                        break
+            if len(resume_files) >= _MAX_RESUMES:
+                break
+        
+        # Load concurrently, scheduling the largest files first
+        resume_files = list(resume_files)
+        if not resume_files:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(resume_files))) as executor:
+            futures = {
+                path: executor.submit(_read_resume_file, path)
+                for path in sorted(resume_files, key=_file_size, reverse=True)
+            }
+        
         resumes = []
-        for i, path in enumerate(resume_files[:5], 1):  # Max 5 resumes
+        for i, path in enumerate(resume_files, 1):
             try:
-                if path.suffix == ".md":
-                    text = path.read_text()
-                elif path.suffix == ".docx":
-                    from docx import Document
-                    doc = Document(path)
-                    text = "\n".join(p.text for p in doc.paragraphs)
-                else:
-                    text = path.read_text()
-                
+                text = futures[path].result()
                 resumes.append((f"Resume {chr(64+i)} ({path.name})", text))
             except Exception as e:
                 if verbose:
@@ -190,9 +269,10 @@ class ResumeEvaluator:
         template = load_prompt("resume_eval")
         
         # Format resumes section
-        resumes_section = ""
-        for name, text in resumes:
-            resumes_section += f"\n\n## {name}\n\n{text}\n\n{'='*80}"
+        resumes_section = "".join([
+            f"\n\n## {name}\n\n{text}{_RESUME_SEPARATOR}"
+            for name, text in resumes
+        ])
         
         prompt = template.format(
             resumes_count=len(resumes),
@@ -234,12 +314,7 @@ class ResumeEvaluator:
             ))
         
         # Extract master resume if present
-        import re
-        master_match = re.search(
-            r'```markdown\n(.*?)\n```',
-            response,
-            re.DOTALL
-        )
+        master_match = _MARKDOWN_BLOCK_RE.search(response)
         master_resume = master_match.group(1) if master_match else ""
         
         return ResumeEvalResult(
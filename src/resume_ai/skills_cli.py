@@ -2,7 +2,7 @@
 
 import click
 from pathlib import Path
-from .skills_manager import SkillsManager
+from .skills_manager import get_manager
 
 
 @click.group()
@@ -15,14 +15,14 @@ def skills():
 def list():
     """List all skills in inventory."""
     try:
-        manager = SkillsManager()
+        manager = get_manager()
     except FileNotFoundError as e:
         click.echo(f"\n❌ Error: {e}")
         click.echo("\nCreate config/skills_inventory.yaml to get started.")
         return
     
-    click.echo("\n📋 Your Skills Inventory\n")
-    click.echo("=" * 70)
+    # Build the whole listing and write it once
+    out = ["\n📋 Your Skills Inventory\n", "=" * 70]
     
     all_skills = manager.get_all_skills()
     total_count = 0
@@ -30,14 +30,13 @@ def list():
     for category, skills_list in all_skills.items():
         # Format category name
         category_display = category.replace('_', ' ').title()
-        click.echo(f"\n{category_display} ({len(skills_list)} skills):")
-        
-        for skill in skills_list:
-            click.echo(f"  • {skill}")
-            total_count += 1
+        out.append(f"\n{category_display} ({len(skills_list)} skills):")
+        out.extend(f"  • {skill}" for skill in skills_list)
+        total_count += len(skills_list)
     
-    click.echo("\n" + "=" * 70)
-    click.echo(f"Total: {total_count} skills across {len(all_skills)} categories\n")
+    out.append("\n" + "=" * 70)
+    out.append(f"Total: {total_count} skills across {len(all_skills)} categories\n")
+    click.echo("\n".join(out))
 
 
 @skills.command()
@@ -52,7 +51,7 @@ def add(category: str, skill: str):
         skills add cloud_platforms "Digital Ocean"
     """
     try:
-        manager = SkillsManager()
+        manager = get_manager()
     except FileNotFoundError as e:
         click.echo(f"\n❌ Error: {e}")
         return
@@ -75,7 +74,7 @@ def match(job_description_file: str, max_skills: int):
         skills match /path/to/job_posting.txt
     """
     try:
-        manager = SkillsManager()
+        manager = get_manager()
     except FileNotFoundError as e:
         click.echo(f"\n❌ Error: {e}")
         return
@@ -93,8 +92,7 @@ def match(job_description_file: str, max_skills: int):
     )
     
     if matches:
-        click.echo(f"✅ Found {len(matches)} matching skills from your inventory:\n")
-        click.echo("=" * 70)
+        out = [f"✅ Found {len(matches)} matching skills from your inventory:\n", "=" * 70]
         
         # Group by category
         by_category = {}
@@ -105,15 +103,16 @@ def match(job_description_file: str, max_skills: int):
         
         for category, category_matches in by_category.items():
             category_display = category.replace('_', ' ').title()
-            click.echo(f"\n{category_display}:")
+            out.append(f"\n{category_display}:")
             
             for match in category_matches:
                 relevance_pct = int(match.relevance_score * 100)
-                click.echo(f"  • {match.skill} (relevance: {relevance_pct}%)")
+                out.append(f"  • {match.skill} (relevance: {relevance_pct}%)")
         
-        click.echo("\n" + "=" * 70)
-        click.echo("\n💡 These skills appear in the job description and are in your inventory.")
-        click.echo("   They will be suggested during resume customization.\n")
+        out.append("\n" + "=" * 70)
+        out.append("\n💡 These skills appear in the job description and are in your inventory.")
+        out.append("   They will be suggested during resume customization.\n")
+        click.echo("\n".join(out))
     else:
         click.echo("❌ No skills from your inventory found in this job description.")
         click.echo("\n💡 Consider:")
@@ -126,22 +125,21 @@ def match(job_description_file: str, max_skills: int):
 def categories():
     """List all skill categories."""
     try:
-        manager = SkillsManager()
+        manager = get_manager()
     except FileNotFoundError as e:
         click.echo(f"\n❌ Error: {e}")
         return
     
-    click.echo("\n📂 Skill Categories\n")
-    click.echo("=" * 70)
+    out = ["\n📂 Skill Categories\n", "=" * 70]
     
     all_skills = manager.get_all_skills()
     
     for category, skills_list in all_skills.items():
-        category_display = category.replace('_', ' ').title()
-        click.echo(f"  {category:<30} ({len(skills_list)} skills)")
+        out.append(f"  {category:<30} ({len(skills_list)} skills)")
     
-    click.echo("\n" + "=" * 70)
-    click.echo(f"Total: {len(all_skills)} categories\n")
+    out.append("\n" + "=" * 70)
+    out.append(f"Total: {len(all_skills)} categories\n")
+    click.echo("\n".join(out))
 
 
 @skills.command()
@@ -154,7 +152,7 @@ def show(category: str):
         skills show programming_languages
     """
     try:
-        manager = SkillsManager()
+        manager = get_manager()
     except FileNotFoundError as e:
         click.echo(f"\n❌ Error: {e}")
         return
@@ -172,13 +170,10 @@ def show(category: str):
     skills_list = all_skills[category]
     category_display = category.replace('_', ' ').title()
     
-    click.echo(f"\n{category_display} ({len(skills_list)} skills)\n")
-    click.echo("=" * 70)
-    
-    for skill in skills_list:
-        click.echo(f"  • {skill}")
-    
-    click.echo()
+    out = [f"\n{category_display} ({len(skills_list)} skills)\n", "=" * 70]
+    out.extend(f"  • {skill}" for skill in skills_list)
+    out.append("")
+    click.echo("\n".join(out))
 
 
 @skills.command()
@@ -191,27 +186,22 @@ def find(skill_name: str):
         skills find Python
     """
     try:
-        manager = SkillsManager()
+        manager = get_manager()
     except FileNotFoundError as e:
         click.echo(f"\n❌ Error: {e}")
         return
     
-    skill_lower = skill_name.lower()
-    found = []
-    
-    for category, skills_list in manager.get_all_skills().items():
-        for skill in skills_list:
-            if skill_lower in skill.lower():
-                found.append((category, skill))
+    found = manager.find_skills(skill_name)
     
     if found:
-        click.echo(f"\n🔍 Found {len(found)} match(es) for '{skill_name}':\n")
+        out = [f"\n🔍 Found {len(found)} match(es) for '{skill_name}':\n"]
         
         for category, skill in found:
             category_display = category.replace('_', ' ').title()
-            click.echo(f"  • {skill} ({category_display})")
+            out.append(f"  • {skill} ({category_display})")
         
-        click.echo()
+        out.append("")
+        click.echo("\n".join(out))
     else:
         click.echo(f"\n❌ No skills found matching '{skill_name}'")
         click.echo("\n💡 Try adding it with: skills add <category> \"{skill_name}\"\n")
@@ -3,12 +3,158 @@ Skills Manager - Manages skill inventory and intelligent skill selection.
 """
 
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Set, Tuple
 import yaml
 from dataclasses import dataclass
+import heapq
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+import hashlib
+import json
+import os
 import re
 
 
+# libyaml-backed loader/dumper when available, pure-Python otherwise
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Default inventory location, config/skills_inventory.yaml at the repo root
+_DEFAULT_SKILLS_FILE = Path(__file__).parent.parent.parent / "config" / "skills_inventory.yaml"
+
+# Parsed inventories are cached here, one JSON file per inventory path,
+# never next to the inventory itself (which may sit in a shared location)
+_CACHE_DIR = Path.home() / ".cache" / "resume_ai" / "skills"
+
+
+_WORD_RE = re.compile(r'\w+')
+
+# Mentions beyond this add nothing: min(count * 0.4, 1.0) is already 1.0
+_SATURATING_COUNT = 3
+
+# Fuzzy matches need this rapidfuzz similarity (0-100) and score like a
+# single variant mention
+_FUZZY_CUTOFF = 85
+_FUZZY_WEIGHT = 0.4
+
+# Suffixes dropped to form a base variant ("react.js" -> "react")
+_VARIANT_SUFFIXES = ('.js', ' api', ' framework')
+
+# Lowercased skill -> equivalent spellings also matched in job descriptions
+_ACRONYM_MAP: Dict[str, Tuple[str, ...]] = {
+    'natural language processing': ('nlp',),
+    'nlp': ('natural language processing',),
+    'large language models': ('llms', 'llm'),
+    'llms': ('large language models',),
+    'llm': ('large language models',),
+    'continuous integration': ('ci',),
+    'continuous deployment': ('cd',),
+    'ci/cd': ('continuous integration', 'continuous deployment'),
+}
+
+
+@lru_cache(maxsize=1)
+def _rapidfuzz():
+    """
+    Import rapidfuzz and numpy once, on the first fuzzy match.
+    
+    rapidfuzz's C++ edit-distance scorers catch misspelled and run-together
+    skills; process.cdist returns its score matrix as a numpy array.
+    
+    Returns:
+        (numpy, fuzz, process) or None if either is not installed
+    """
+    try:
+        import numpy
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        return None
+    return numpy, fuzz, process
+
+
+@lru_cache(maxsize=4096)
+def _normalize_skill(skill: str) -> str:
+    """Normalize skill name for comparison."""
+    return skill.lower().strip()
+
+
+@lru_cache(maxsize=4096)
+def _skill_variants(skill: str) -> FrozenSet[str]:
+    """Create variants of a skill for better matching."""
+    variants = {_normalize_skill(skill)}
+    
+    # Add common variants
+    skill_lower = skill.lower()
+    
+    # Remove common suffixes
+    for suffix in _VARIANT_SUFFIXES:
+        if skill_lower.endswith(suffix):
+            variants.add(skill_lower[:-len(suffix)].strip())
+    
+    # Add acronym variants
+    variants.update(_ACRONYM_MAP.get(skill_lower, ()))
+    
+    return frozenset(variants)
+
+
+# Compiled word-bounded patterns, keyed by variant
+_VARIANT_RE_CACHE: Dict[str, re.Pattern] = {}
+
+
+def _variant_pattern(variant: str) -> re.Pattern:
+    """Get compiled pattern matching a variant as a whole word."""
+    pattern = _VARIANT_RE_CACHE.get(variant)
+    if pattern is None:
+        pattern = re.compile(r'\b' + re.escape(variant) + r'\b')
+        _VARIANT_RE_CACHE[variant] = pattern
+    return pattern
+
+
+# Inventory category -> lowercased resume category names it maps onto
+_CATEGORY_MAP: Dict[str, Tuple[str, ...]] = {
+    "programming_languages": ("languages", "programming languages", "core languages"),
+    "web_frameworks": ("frameworks", "web technologies", "backend"),
+    "cloud_platforms": ("cloud", "cloud & infrastructure", "infrastructure"),
+    "containers_orchestration": ("devops", "infrastructure", "cloud"),
+    "databases": ("databases", "data storage"),
+    "ai_machine_learning": ("ai/ml", "machine learning", "ai & ml"),
+    "devops_ci_cd": ("devops", "ci/cd", "development tools"),
+    "version_control": ("tools", "development tools"),
+    "testing": ("testing", "quality assurance"),
+    "api_development": ("backend", "api development"),
+}
+
+
+def _trie_regex(words) -> str:
+    """
+    Build a regex alternation of words factored as a character trie.
+    
+    At any position at most one branch can continue, so matching costs a
+    few character tests instead of one attempt per word. Greedy optional
+    groups prefer the longest word that matches.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # end-of-word marker
+    
+    def build(node: dict) -> str:
+        branches = [
+            re.escape(ch) + build(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return build(trie)
+
+
 @dataclass
 class SkillMatch:
     """Represents a matched skill."""
@@ -28,32 +174,68 @@ class SkillsManager:
         Args:
             skills_file: Path to skills inventory YAML
         """
-        if skills_file is None:
-            # Default location
-            config_dir = Path(__file__).parent.parent.parent / "config"
-            skills_file = config_dir / "skills_inventory.yaml"
-        
-        self.skills_file = Path(skills_file)
+        self.skills_file = (
+            _DEFAULT_SKILLS_FILE if skills_file is None else Path(skills_file)
+        )
         self.skills_inventory = self._load_skills()
+        self._inventory_index = None
+        self._variant_scanner = None
+        self._flat_index = None
+    
+    @property
+    def _cache_file(self) -> Path:
+        """JSON cache file holding this inventory's parsed skills."""
+        digest = hashlib.sha256(str(self.skills_file.resolve()).encode()).hexdigest()
+        return _CACHE_DIR / f"{digest[:32]}.json"
     
     def _load_skills(self) -> Dict[str, List[str]]:
-        """Load skills from YAML file."""
-        if not self.skills_file.exists():
+        """
+        Load skills from YAML file.
+        
+        The parsed inventory is cached as JSON in the user cache directory,
+        keyed on the YAML file's mtime and size, so unchanged inventories
+        skip parsing.
+        """
+        try:
+            stat = self.skills_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Skills inventory not found: {self.skills_file}\n"
                 "Create config/skills_inventory.yaml with your skills."
-            )
+            ) from None
+        
+        cache_key = [stat.st_mtime_ns, stat.st_size]
+        cache_file = self._cache_file
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = json.load(f)
+            if cached["key"] == cache_key:
+                return cached["skills"]
+        except Exception:
+            # Missing, stale-format or corrupt cache: reparse below
+            pass
         
         with open(self.skills_file) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
             
             # Filter out comments and ensure all values are lists
             skills = {}
             for key, value in data.items():
                 if isinstance(value, list):
                     skills[key] = value
-            
-            return skills
+        
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"key": cache_key, "skills": skills}, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            # Unwritable cache dir or non-JSON values: work without the cache
+            tmp_file.unlink(missing_ok=True)
+        
+        return skills
     
     def get_all_skills(self) -> Dict[str, List[str]]:
         """Get all skills by category."""
@@ -66,42 +248,128 @@ class SkillsManager:
             all_skills.update(category_skills)
         return all_skills
     
+    def find_skills(self, query: str) -> List[Tuple[str, str]]:
+        """
+        Find inventory skills containing a search string.
+        
+        Args:
+            query: Case-insensitive substring to search for
+            
+        Returns:
+            (category, skill) pairs in inventory order
+        """
+        if self._flat_index is None:
+            # Lowercase each skill once, not once per search
+            self._flat_index = [
+                (skill.lower(), skill, category)
+                for category, skills in self.skills_inventory.items()
+                for skill in skills
+            ]
+        
+        query_lower = query.lower()
+        return [
+            (category, skill)
+            for skill_lower, skill, category in self._flat_index
+            if query_lower in skill_lower
+        ]
+    
     def _normalize_skill(self, skill: str) -> str:
         """Normalize skill name for comparison."""
-        return skill.lower().strip()
+        return _normalize_skill(skill)
     
-    def _create_skill_variants(self, skill: str) -> Set[str]:
+    def _create_skill_variants(self, skill: str) -> FrozenSet[str]:
         """Create variants of a skill for better matching."""
-        variants = {self._normalize_skill(skill)}
-        
-        # Add common variants
-        skill_lower = skill.lower()
-        
-        # Remove common suffixes
-        for suffix in ['.js', ' api', ' framework']:
-            if skill_lower.endswith(suffix):
-                base = skill_lower[:-len(suffix)].strip()
-                variants.add(base)
-        
-        # Add acronym variants
-        if skill_lower == 'natural language processing':
-            variants.add('nlp')
-        elif skill_lower == 'nlp':
-            variants.add('natural language processing')
-        elif skill_lower == 'large language models':
-            variants.add('llms')
-            variants.add('llm')
-        elif skill_lower in ['llms', 'llm']:
-            variants.add('large language models')
-        elif skill_lower == 'continuous integration':
-            variants.add('ci')
-        elif skill_lower == 'continuous deployment':
-            variants.add('cd')
-        elif skill_lower == 'ci/cd':
-            variants.add('continuous integration')
-            variants.add('continuous deployment')
-        
-        return variants
+        return _skill_variants(skill)
+    
+    def _get_inventory_index(self) -> List[Tuple[str, str, str, FrozenSet[str]]]:
+        """
+        Get inventory skills with their precomputed match data.
+        
+        Returns:
+            (category, skill, normalized skill, variants) per inventory skill
+        """
+        if self._inventory_index is None:
+            self._inventory_index = [
+                (category, skill, _normalize_skill(skill), _skill_variants(skill))
+                for category, skills in self.skills_inventory.items()
+                for skill in skills
+            ]
+        return self._inventory_index
+    
+    def _get_variant_scanner(self) -> tuple[re.Pattern, Dict[str, tuple], FrozenSet[str]]:
+        """
+        Get the single-pass scanner for all inventory skill variants.
+        
+        Returns:
+            (pattern, prefixes, word_variants) where pattern finds, at every
+            position of the text, the longest variant bounded by word
+            boundaries, prefixes maps each variant to the other variants it
+            starts with, and word_variants holds the single-word variants
+        """
+        if self._variant_scanner is None:
+            variants = set()
+            for _, _, _, skill_variants in self._get_inventory_index():
+                variants.update(skill_variants)
+            
+            # Zero-width lookahead so every start position is examined
+            pattern = re.compile(r'(?=\b(' + _trie_regex(variants) + r')\b)')
+            prefixes = {
+                variant: tuple(
+                    variant[:i] for i in range(len(variant))
+                    if variant[:i] in variants
+                )
+                for variant in variants
+            }
+            word_variants = frozenset(v for v in variants if _WORD_RE.fullmatch(v))
+            self._variant_scanner = (pattern, prefixes, word_variants)
+        
+        return self._variant_scanner
+    
+    def _count_variants(self, job_text_lower: str) -> Dict[str, int]:
+        """
+        Count word-bounded occurrences of each inventory variant in the text.
+        
+        One scan finds which variants occur. A variant hidden at some
+        position by a longer match there is a prefix of it, so prefixes of
+        found variants are candidates too. Only candidates get an exact
+        per-variant count.
+        
+        Args:
+            job_text_lower: Lowercased job description
+            
+        Returns:
+            Mapping of variant to occurrence count (present variants only);
+            counts may be capped at _SATURATING_COUNT
+        """
+        pattern, prefixes, word_variants = self._get_variant_scanner()
+        
+        found = {m.group(1) for m in pattern.finditer(job_text_lower)}
+        candidates = set(found)
+        for variant in found:
+            candidates.update(prefixes[variant])
+        
+        counts = {}
+        word_counts = None
+        for variant in candidates:
+            if variant in word_variants:
+                # A bounded single-word variant is exactly one whole token
+                if word_counts is None:
+                    word_counts = Counter(_WORD_RE.findall(job_text_lower))
+                count = word_counts[variant]
+            elif variant in found and job_text_lower.count(variant) == 1:
+                # str.count (non-overlapping, in C) bounds the word-bounded
+                # count from above; a found variant occurring once is done
+                count = 1
+            else:
+                # Scores saturate at _SATURATING_COUNT mentions; stop there
+                count = sum(1 for _ in islice(
+                    _variant_pattern(variant).finditer(job_text_lower),
+                    _SATURATING_COUNT
+                ))
+            
+            if count:
+                counts[variant] = count
+        return counts
     
     def find_matching_skills(
         self,
@@ -128,55 +396,126 @@ class SkillsManager:
             for skill in skills_list:
                 current_skills_normalized.update(self._create_skill_variants(skill))
         
+        # Occurrence counts for every inventory variant, from one scan
+        variant_counts = self._count_variants(job_text_lower)
+        
         # Find matching skills not in current resume
         matches = []
+        unmatched = []
         
-        for category, skills in self.skills_inventory.items():
-            for skill in skills:
-                skill_normalized = self._normalize_skill(skill)
-                
-                # Skip if already in resume
-                if skill_normalized in current_skills_normalized:
-                    continue
-                
-                # Check all variants
-                variants = self._create_skill_variants(skill)
-                
-                # Find best match
-                best_score = 0.0
-                match_type = None
+        for category, skill, skill_normalized, variants in self._get_inventory_index():
+            # Skip if already in resume
+            if skill_normalized in current_skills_normalized:
+                continue
+            
+            # Find best match across all variants
+            best_score = 0.0
+            match_type = None
+            
+            for variant in variants:
+                # Exact word boundary match
+                count = variant_counts.get(variant, 0)
                 
-                for variant in variants:
-                    # Exact word boundary match
-                    pattern = r'\b' + re.escape(variant) + r'\b'
-                    matches_found = re.findall(pattern, job_text_lower)
+                if count:
+                    # Weight: exact match is better, multiple mentions increase score
+                    score = min(count * 0.4, 1.0)
                     
-                    if matches_found:
-                        count = len(matches_found)
-                        # Weight: exact match is better, multiple mentions increase score
-                        score = min(count * 0.4, 1.0)
-                        
-                        if variant == skill_normalized:
-                            score *= 1.2  # Bonus for exact match
-                            match_type = "exact"
-                        else:
-                            match_type = "variant"
-                        
-                        if score > best_score:
-                            best_score = score
-                
-                # If skill appears in JD, add to matches
-                if best_score > 0:
-                    matches.append(SkillMatch(
-                        skill=skill,
-                        category=category,
-                        relevance_score=min(best_score, 1.0),
-                        match_type=match_type or "partial"
-                    ))
-        
-        # Sort by relevance and limit
-        matches.sort(key=lambda x: x.relevance_score, reverse=True)
-        return matches[:max_new_skills]
+                    if variant == skill_normalized:
+                        score *= 1.2  # Bonus for exact match
+                        match_type = "exact"
+                    else:
+                        match_type = "variant"
+                    
+                    if score > best_score:
+                        best_score = score
+            
+            # If skill appears in JD, add to matches
+            if best_score > 0:
+                matches.append(SkillMatch(
+                    skill=skill,
+                    category=category,
+                    relevance_score=min(best_score, 1.0),
+                    match_type=match_type or "partial"
+                ))
+            else:
+                unmatched.append((category, skill, skill_normalized))
+        
+        if unmatched:
+            matches.extend(self._find_fuzzy_matches(job_text_lower, unmatched))
+        
+        # Select the top matches by relevance without sorting them all
+        return heapq.nlargest(max_new_skills, matches, key=lambda x: x.relevance_score)
+    
+    def _find_fuzzy_matches(
+        self,
+        job_text_lower: str,
+        unmatched: List[Tuple[str, str, str]]
+    ) -> List[SkillMatch]:
+        """
+        Match skills missing from the text by edit-distance similarity.
+        
+        Catches spellings the variant rules miss, e.g. "reactjs" for
+        "React.js". Requires rapidfuzz and numpy (the "fuzzy" extra).
+        
+        Args:
+            job_text_lower: Lowercased job description
+            unmatched: (category, skill, normalized skill) with no exact match
+            
+        Returns:
+            SkillMatch objects for skills close to a JD word or word pair;
+            empty if rapidfuzz is not installed
+        """
+        modules = _rapidfuzz()
+        if modules is None:
+            return []
+        numpy, fuzz, process = modules
+        
+        words = _WORD_RE.findall(job_text_lower)
+        terms = set(words)
+        terms.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+        
+        terms_by_length: Dict[int, List[str]] = {}
+        for term in terms:
+            terms_by_length.setdefault(len(term), []).append(term)
+        
+        skills_by_length: Dict[int, List[int]] = {}
+        for i, (_, _, skill_normalized) in enumerate(unmatched):
+            skills_by_length.setdefault(len(skill_normalized), []).append(i)
+        
+        # One score matrix per skill length. ratio = 2 * LCS / (n + m) is at
+        # most 2 * min(n, m) / (n + m), so terms whose length alone keeps
+        # them under the cutoff are left out of the matrix
+        best_scores = [0.0] * len(unmatched)
+        for n, indices in skills_by_length.items():
+            choices = [
+                term
+                for m, bucket in terms_by_length.items()
+                if 200 * min(n, m) >= _FUZZY_CUTOFF * (n + m)
+                for term in bucket
+            ]
+            if not choices:
+                continue
+            
+            scores = process.cdist(
+                [unmatched[i][2] for i in indices],
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=_FUZZY_CUTOFF,
+                dtype=numpy.float64
+            )
+            for i, best in zip(indices, scores.max(axis=1).tolist()):
+                best_scores[i] = best
+        
+        return [
+            SkillMatch(
+                skill=skill,
+                category=category,
+                relevance_score=_FUZZY_WEIGHT * best / 100,
+                match_type="variant"
+            )
+            for (category, skill, _), best in zip(unmatched, best_scores)
+            if best
+        ]
     
     def merge_skills(
         self,
@@ -195,13 +534,18 @@ class SkillsManager:
         """
         merged = {k: list(v) for k, v in current_skills.items()}
         
+        # Lowercase resume categories once and resolve each inventory
+        # category once, however many matches share it
+        resume_categories = [(category.lower(), category) for category in current_skills]
+        resolved = {}
+        
         for match in new_matches:
             # Map inventory category to resume category
             # Try to find best matching category in resume
-            category_to_use = self._map_category_to_resume(
-                match.category, 
-                current_skills.keys()
-            )
+            category_to_use = resolved.get(match.category)
+            if category_to_use is None:
+                category_to_use = self._match_resume_category(match.category, resume_categories)
+                resolved[match.category] = category_to_use
             
             if category_to_use in merged:
                 merged[category_to_use].append(match.skill)
@@ -212,44 +556,27 @@ class SkillsManager:
         
         return merged
     
-    def _map_category_to_resume(
+    def _match_resume_category(
         self,
         inventory_category: str,
-        resume_categories: List[str]
+        resume_categories: List[Tuple[str, str]]
     ) -> str:
         """
-        Map inventory category to existing resume category.
+        Map inventory category to a resume category given as (lowered, original) pairs.
         
         Args:
             inventory_category: Category from skills inventory
-            resume_categories: Existing categories in resume
+            resume_categories: (lowercased, original) resume category pairs
             
         Returns:
             Best matching resume category or formatted inventory category
         """
-        # Common mappings
-        category_map = {
-            "programming_languages": ["Languages", "Programming Languages", "Core Languages"],
-            "web_frameworks": ["Frameworks", "Web Technologies", "Backend"],
-            "cloud_platforms": ["Cloud", "Cloud & Infrastructure", "Infrastructure"],
-            "containers_orchestration": ["DevOps", "Infrastructure", "Cloud"],
-            "databases": ["Databases", "Data Storage"],
-            "ai_machine_learning": ["AI/ML", "Machine Learning", "AI & ML"],
-            "devops_ci_cd": ["DevOps", "CI/CD", "Development Tools"],
-            "version_control": ["Tools", "Development Tools"],
-            "testing": ["Testing", "Quality Assurance"],
-            "api_development": ["Backend", "API Development"],
-        }
-        
-        # Try to find matching category
-        possible_categories = category_map.get(inventory_category, [])
-        
-        for resume_cat in resume_categories:
-            if resume_cat in possible_categories:
-                return resume_cat
-            # Check for partial matches
+        possible_categories = _CATEGORY_MAP.get(inventory_category, ())
+        
+        # Exact names are covered too: equal strings contain each other
+        for resume_lower, resume_cat in resume_categories:
             for possible in possible_categories:
-                if possible.lower() in resume_cat.lower() or resume_cat.lower() in possible.lower():
+                if possible in resume_lower or resume_lower in possible:
                     return resume_cat
         
         # Return formatted inventory category
@@ -313,16 +640,64 @@ class SkillsManager:
         
         if skill not in self.skills_inventory[category]:
             self.skills_inventory[category].append(skill)
+            self._inventory_index = None
+            self._variant_scanner = None
+            self._flat_index = None
             self._save_skills()
     
     def _save_skills(self) -> None:
-        """Save skills inventory back to YAML file."""
-        with open(self.skills_file, 'w') as f:
-            yaml.safe_dump(
-                self.skills_inventory,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True
-            )
+        """
+        Save skills inventory back to YAML file.
+        
+        The YAML is written to a temporary file and renamed over the
+        inventory, so an interrupted save never leaves it half-written.
+        """
+        self._cache_file.unlink(missing_ok=True)
+        
+        tmp_file = self.skills_file.with_name(self.skills_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w') as f:
+                yaml.dump(
+                    self.skills_inventory,
+                    f,
+                    Dumper=_YamlDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                    allow_unicode=True
+                )
+            os.replace(tmp_file, self.skills_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
 
+
+@lru_cache(maxsize=4)
+def _load_manager(skills_file: str, mtime_ns) -> SkillsManager:
+    """Build a SkillsManager, memoized on the inventory's path and mtime."""
+    return SkillsManager(Path(skills_file))
+
+
+def get_manager(skills_file: Path = None) -> SkillsManager:
+    """
+    Get a shared SkillsManager for a skills inventory.
+    
+    Repeated calls in one process reuse the loaded inventory and its
+    match index until the inventory file changes on disk.
+    
+    Args:
+        skills_file: Path to skills inventory YAML (default location if None)
+        
+    Returns:
+        SkillsManager for the inventory
+        
+    Raises:
+        FileNotFoundError: If the inventory file does not exist
+    """
+    skills_file = _DEFAULT_SKILLS_FILE if skills_file is None else Path(skills_file)
+    try:
+        mtime_ns = skills_file.stat().st_mtime_ns
+    except OSError:
+        # Not cached either way; SkillsManager reports the missing file
+        mtime_ns = None
+    return _load_manager(str(skills_file), mtime_ns)
@@ -2,17 +2,18 @@
 Threshold Gate - Determines whether to proceed based on match scores.
 """
 
+import os
+import sys
 from dataclasses import dataclass
 from typing import Literal
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+
+# rich is imported on first print, so evaluate-only callers never load it
 
 # Type for decision outcomes
 Decision = Literal["continue", "stop", "ask"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ThresholdConfig:
     """Configuration for match score thresholds."""
     
@@ -34,7 +35,24 @@ class ThresholdGate:
             config: Threshold configuration. Uses defaults if not provided.
         """
         self.config = config or ThresholdConfig()
-        self.console = Console()
+        self._console = None
+    
+    @property
+    def console(self):
+        """Rich console, created on first use."""
+        if self._console is None:
+            from rich.console import Console
+            
+            self._console = Console()
+        return self._console
+    
+    @property
+    def stop_below(self) -> int:
+        """Score below which evaluate always decides "stop"."""
+        config = self.config
+        if not config.ask_on_borderline and config.auto_stop_below:
+            return config.minimum_overall
+        return config.borderline_min
     
     def evaluate(self, match_score: int) -> Decision:
         """
@@ -46,17 +64,29 @@ class ThresholdGate:
         Returns:
             Decision: "continue", "stop", or "ask"
         """
-        if match_score >= self.config.minimum_overall:
+        config = self.config
+        if match_score >= config.minimum_overall:
             return "continue"
         
-        elif self.config.borderline_min <= match_score < self.config.minimum_overall:
-            if self.config.ask_on_borderline:
-                return "ask"
-            else:
-                return "stop" if self.config.auto_stop_below else "continue"
-        
-        else:  # Below borderline_min
+        if match_score < config.borderline_min:
             return "stop"
+        
+        # Borderline
+        if config.ask_on_borderline:
+            return "ask"
+        return "stop" if config.auto_stop_below else "continue"
+    
+    def evaluate_many(self, match_scores: list[int]) -> list[Decision]:
+        """
+        Evaluate a batch of match scores against the same thresholds.
+        
+        Args:
+            match_scores: Overall fit scores (0-100)
+            
+        Returns:
+            One decision per score, in order
+        """
+        return [self.evaluate(score) for score in match_scores]
     
     def print_decision(
         self,
@@ -81,6 +111,8 @@ class ThresholdGate:
     
     def _print_good_match(self, score: int, result) -> None:
         """Print good match message."""
+        from rich.panel import Panel
+        
         self.console.print()
         self.console.print(Panel.fit(
             f"[bold green]✅ GOOD MATCH[/bold green]\n\n"
@@ -94,6 +126,10 @@ class ThresholdGate:
     
     def _print_poor_match(self, score: int, result) -> None:
         """Print poor match warning."""
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.table import Table
+        
         self.console.print()
         
         # Build gaps table
@@ -102,24 +138,26 @@ class ThresholdGate:
         for gap in result.gaps[:5]:
             table.add_row(f"❌ {gap}")
         
+        # Header, gaps and recommendation laid out in a single render
         self.console.print(Panel(
-            f"[bold red]❌ POOR MATCH[/bold red]\n\n"
-            f"Score: {score}/100 (below {self.config.minimum_overall}% threshold)\n"
-            f"Interview Probability: {result.interview_probability:.0%}\n\n"
-            f"[bold]Key Gaps:[/bold]\n",
+            Group(
+                f"[bold red]❌ POOR MATCH[/bold red]\n\n"
+                f"Score: {score}/100 (below {self.config.minimum_overall}% threshold)\n"
+                f"Interview Probability: {result.interview_probability:.0%}\n\n"
+                f"[bold]Key Gaps:[/bold]",
+                table,
+                "\n[yellow]💡 RECOMMENDATION:[/yellow] Skip this application.\n"
+                "   Focus on better-fit opportunities (70+ score).\n\n"
+                "[dim]   To proceed anyway, use --force flag[/dim]"
+            ),
             title="Match Score",
             border_style="red"
         ))
-        self.console.print(table)
-        self.console.print()
-        self.console.print(
-            "[yellow]💡 RECOMMENDATION:[/yellow] Skip this application.\n"
-            "   Focus on better-fit opportunities (70+ score).\n\n"
-            "[dim]   To proceed anyway, use --force flag[/dim]"
-        )
     
     def _print_borderline_match(self, score: int, result) -> None:
         """Print borderline match prompt."""
+        from rich.panel import Panel
+        
         self.console.print()
         
         # Build strengths and gaps
@@ -137,17 +175,53 @@ class ThresholdGate:
             border_style="yellow"
         ))
     
-    def prompt_user_continue(self) -> bool:
+    def prompt_user_continue(self, timeout: float = 30) -> bool:
         """
         Prompt user whether to continue with borderline match.
         
+        Reads a single y/n keystroke, no Enter needed. Without an
+        interactive terminal (CI, piped input) or once timeout seconds pass,
+        the answer is no, so unattended runs never block.
+        
+        Args:
+            timeout: Seconds to wait for an answer
+            
         Returns:
             True if user wants to continue
         """
-        from rich.prompt import Confirm
+        if not sys.stdin.isatty():
+            self.console.print(
+                "\n[dim]No terminal to confirm on; skipping borderline match.[/dim]"
+            )
+            return False
+        
+        try:
+            import select
+            import termios
+            import tty
+        except ImportError:
+            # No termios (Windows): fall back to a line prompt
+            from rich.prompt import Confirm
+            
+            return Confirm.ask(
+                "\n[bold]Continue with customization?[/bold]",
+                default=False
+            )
         
-        return Confirm.ask(
-            "\n[bold]Continue with customization?[/bold]",
-            default=False
+        self.console.print(
+            "\n[bold]Continue with customization?[/bold] \\[y/N] ",
+            end=""
         )
-
+        
+        fd = sys.stdin.fileno()
+        saved_attrs = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            ready, _, _ = select.select([fd], [], [], timeout)
+            key = os.read(fd, 1) if ready else b""
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved_attrs)
+        
+        answer = key in (b"y", b"Y")
+        self.console.print("y" if answer else "n")
+        return answer
@@ -2,19 +2,166 @@
 Workflow - Complete end-to-end resume workflow with threshold gating.
 """
 
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from string import Template
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
-from .ollama_client import OllamaClient, OllamaConfig
-from .job_match import JobMatcher, JobMatchResult
-from .resume_customize import ResumeCustomizer, CustomizationResult
+from .ollama_client import OllamaClient, OllamaConfig, shared_session
+from .job_match import (
+    JobMatcher,
+    JobMatchResult,
+    _find_latest_resume,
+    _has_overall_score,
+    _load_resume_cached,
+)
+from .resume_customize import ResumeCustomizer, CustomizationResult, _find_base_resume
 from .threshold_gate import ThresholdGate, ThresholdConfig
-from .skills_manager import SkillsManager
-from ..resume_export.exporter import ResumeExporter
+from .skills_manager import SkillsManager, get_manager
+from .config_manager import get_config
 
+try:
+    # orjson is much faster at (de)serializing cached results
+    from orjson import dumps as _orjson_dumps, loads as _json_loads
+    
+    def _json_dumps(obj) -> bytes:
+        return _orjson_dumps(obj, default=str)
+except ImportError:
+    import json
+    from json import loads as _json_loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode("utf-8")
+
+
+# Stage results are cached here, keyed on the inputs that produced them
+_CACHE_DIR = Path.home() / ".cache" / "resume_ai"
+
+# Bump when cached result formats or prompts change
+_CACHE_VERSION = b"v5"
+
+
+# Verbose step banners, built once rather than on every run
+_HR = "=" * 70
+_STEP_HEADERS = {
+    1: f"{_HR}\nSTEP 1/4: Analyzing Job Match\n{_HR}",
+    3: f"\n{_HR}\nSTEP 3/4: Customizing Resume\n{_HR}",
+    4: f"\n{_HR}\nSTEP 4/4: Exporting to .docx\n{_HR}",
+}
+
+
+_FINAL_SUMMARY = Template("""
+[bold green]✅ Workflow Complete![/bold green]
+
+[bold]Match Score:[/bold] $score/100
+[bold]Company:[/bold] $company
+[bold]Role:[/bold] $role
+
+[bold]Files Created:[/bold]
+  📄 Resume (.docx): $resume_name
+  📝 Analysis: ${company}_Analysis.md
+  💼 Cover Letter Points: ${company}_Cover_Letter_Points.md
+  ✅ Checklist: ${company}_Application_Checklist.md
+${compensation_line}[bold]Location:[/bold] $location
 
-@dataclass
+[bold cyan]Next Steps:[/bold cyan]
+  1. Review the customized .docx resume
+  2. Read cover letter points for key talking points
+  3. Use checklist before submitting
+""")
+
+
+# Rich markup tags, dropped when printing without rich
+_MARKUP_RE = re.compile(r"\[/?[a-z ]+\]")
+
+
+@lru_cache(maxsize=1)
+def _rich():
+    """
+    Import rich once, on first use.
+    
+    Returns:
+        (Console, Table, Panel) or None if rich is not installed
+    """
+    try:
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.table import Table
+    except ImportError:
+        return None
+    return Console, Table, Panel
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Shared rich console, created on first use."""
+    return _rich()[0]()
+
+
+def _cache_enabled() -> bool:
+    """Whether stage results are cached (set RESUME_AI_CACHE=0 to disable)."""
+    return os.environ.get("RESUME_AI_CACHE", "1") != "0"
+
+
+def _parallel_enabled() -> bool:
+    """Whether forced runs customize alongside the match (RESUME_AI_PARALLEL=1)."""
+    return os.environ.get("RESUME_AI_PARALLEL", "0") == "1"
+
+
+def _parallel_match_enabled() -> bool:
+    """Whether the match rates rubric criteria concurrently (RESUME_AI_PARALLEL_MATCH=1)."""
+    return os.environ.get("RESUME_AI_PARALLEL_MATCH", "0") == "1"
+
+
+def _cache_key(*parts: bytes) -> str:
+    """Hash the inputs of a stage into a cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _cache_get(key: str, result_type: type):
+    """Return the cached result_type instance for key, or None."""
+    try:
+        with open(_CACHE_DIR / f"{key}.json", "rb") as f:
+            data = _json_loads(f.read())
+        
+        # Paths were stored as strings
+        if result_type is CustomizationResult:
+            data["output_directory"] = Path(data["output_directory"])
+            data["files_created"] = [Path(p) for p in data["files_created"]]
+            if data["resume_md_path"] is not None:
+                data["resume_md_path"] = Path(data["resume_md_path"])
+        
+        return result_type(**data)
+    except Exception:
+        # Missing, unreadable or outdated entry: recompute
+        return None
+
+
+def _cache_put(key: str, result) -> None:
+    """Store a result dataclass under key, replacing any earlier entry atomically."""
+    path = _CACHE_DIR / f"{key}.json"
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(asdict(result)))
+        os.replace(tmp_path, path)
+    except OSError:
+        # Unwritable cache: work without it
+        tmp_path.unlink(missing_ok=True)
+
+
+@dataclass(slots=True, frozen=True)
 class WorkflowResult:
     """Result from complete workflow."""
     
@@ -42,19 +189,154 @@ class ResumeWorkflow:
             threshold_config: Threshold configuration
             skills_manager: Skills manager for inventory-based customization
         """
-        self.ollama = OllamaClient(ollama_config)
+        # Clients are built on first use, so runs that stop at the threshold
+        # gate or are served from the cache skip connecting and loading
+        self.ollama_config = ollama_config or OllamaConfig()
         self.threshold = ThresholdGate(threshold_config)
-        self.job_matcher = JobMatcher(self.ollama)
-        self.skills_manager = skills_manager or self._init_skills_manager()
-        self.customizer = ResumeCustomizer(self.ollama, self.skills_manager)
+        self._skills_manager = skills_manager
+        self._ollama = None
+        # Batch and parallel stages may ask for the client from several threads
+        self._ollama_lock = threading.Lock()
+    
+    @property
+    def ollama(self) -> OllamaClient:
+        """Ollama client, connected on first use."""
+        with self._ollama_lock:
+            if self._ollama is None:
+                # Workflows in one process share keep-alive connections
+                self._ollama = OllamaClient(self.ollama_config, session=shared_session())
+            return self._ollama
+    
+    @cached_property
+    def job_matcher(self) -> JobMatcher:
+        """Job matcher, created on first use."""
+        return JobMatcher(self.ollama)
+    
+    @cached_property
+    def skills_manager(self) -> Optional[SkillsManager]:
+        """Skills manager, loaded on first use."""
+        return self._skills_manager or self._init_skills_manager()
+    
+    @cached_property
+    def customizer(self) -> ResumeCustomizer:
+        """Resume customizer, created on first use."""
+        return ResumeCustomizer(self.ollama, self.skills_manager)
     
     def _init_skills_manager(self) -> Optional[SkillsManager]:
         """Initialize skills manager if available."""
         try:
-            return SkillsManager()
+            return get_manager()
         except FileNotFoundError:
             return None
     
+    def _auto_resume_bytes(self) -> tuple[Optional[bytes], Optional[bytes]]:
+        """
+        Read the auto-detected resumes the stages will use, for cache keys.
+        
+        The match stage takes the most recent resume, while customization
+        prefers the master resume, so the two can be different files.
+        
+        Returns:
+            (match resume contents, customization resume contents), each
+            None if that resume can't be found
+        """
+        contents: dict[Path, Optional[bytes]] = {}
+        
+        def read(find) -> Optional[bytes]:
+            try:
+                path = find()
+            except OSError:
+                return None
+            if path not in contents:
+                try:
+                    contents[path] = path.read_bytes()
+                except OSError:
+                    contents[path] = None
+            return contents[path]
+        
+        return (
+            read(_find_latest_resume),
+            read(lambda: _find_base_resume(get_config(), verbose=False))
+        )
+    
+    def _read_base_resume(self, base_resume_path: Optional[Path]) -> Optional[str]:
+        """
+        Read an explicitly given base resume.
+        
+        Returns:
+            Resume text, or None to let the stages auto-detect the resume
+            
+        Raises:
+            FileNotFoundError: If the resume file does not exist
+        """
+        if base_resume_path is None:
+            return None
+        if not base_resume_path.exists():
+            raise FileNotFoundError(f"Resume not found: {base_resume_path}")
+        return _load_resume_cached(
+            str(base_resume_path),
+            base_resume_path.stat().st_mtime_ns
+        )
+    
+    def _resume_cache_bytes(
+        self,
+        resume_text: Optional[str]
+    ) -> tuple[Optional[bytes], Optional[bytes]]:
+        """
+        Resume contents for the match and customization cache keys.
+        
+        Returns:
+            (match resume contents, customization resume contents), both
+            None if caching is off
+        """
+        if not _cache_enabled():
+            return None, None
+        if resume_text is not None:
+            resume_bytes = resume_text.encode()
+            return resume_bytes, resume_bytes
+        return self._auto_resume_bytes()
+    
+    def _stage_keys(
+        self,
+        job_text: str,
+        resume_bytes: tuple[Optional[bytes], Optional[bytes]],
+        company_name: Optional[str],
+        output_dir: Optional[Path]
+    ) -> tuple[Optional[str], Optional[str]]:
+        """
+        Build the match and customization cache keys for one job posting.
+        
+        Args:
+            resume_bytes: Resume contents each stage uses, from
+                _resume_cache_bytes
+        
+        Returns:
+            (match key, customize key), each None without its resume bytes
+        """
+        match_bytes, customize_bytes = resume_bytes
+        inputs = (
+            _CACHE_VERSION,
+            self.ollama_config.model.encode(),
+            job_text.encode()
+        )
+        match_key = None
+        if match_bytes is not None:
+            match_key = _cache_key(
+                *inputs,
+                match_bytes,
+                b"match-rubric" if _parallel_match_enabled() else b"match"
+            )
+        customize_key = None
+        if customize_bytes is not None:
+            customize_key = _cache_key(
+                *inputs,
+                customize_bytes,
+                b"customize",
+                str(company_name).encode(),
+                str(output_dir).encode()
+            )
+        return match_key, customize_key
+    
     def process(
         self,
         job_posting_path: Path,
@@ -63,7 +345,8 @@ class ResumeWorkflow:
         output_dir: Optional[Path] = None,
         force: bool = False,
         skip_export: bool = False,
-        verbose: bool = True
+        verbose: bool = True,
+        job_text: Optional[str] = None
     ) -> WorkflowResult:
         """
         Execute complete workflow: match → threshold → customize → export.
@@ -73,27 +356,72 @@ class ResumeWorkflow:
             base_resume_path: Path to base resume (auto-detect if None)
             company_name: Company name (auto-extract if None)
             output_dir: Output directory (auto-create if None)
-            force: Skip threshold check
+            force: Skip threshold check and recompute cached results
             skip_export: Stop after customization
             verbose: Show progress
+            job_text: Job posting text, if already read (skips reading
+                job_posting_path)
             
         Returns:
             WorkflowResult with all generated files
         """
         # Read job posting
-        job_text = job_posting_path.read_text()
+        if job_text is None:
+            job_text = job_posting_path.read_text()
+        
+        # Read a given base resume once; both stages and the cache key share it
+        if base_resume_path is not None:
+            base_resume_path = Path(base_resume_path)
+        resume_text = self._read_base_resume(base_resume_path)
+        
+        # Identical job posting, resume and model reuse earlier LLM results
+        match_key, customize_key = self._stage_keys(
+            job_text,
+            self._resume_cache_bytes(resume_text),
+            company_name,
+            output_dir
+        )
         
         # STEP 1: Job Match
         if verbose:
-            print("=" * 70)
-            print("STEP 1/4: Analyzing Job Match")
-            print("=" * 70)
+            print(_STEP_HEADERS[1])
         
-        match_result = self.job_matcher.match(
-            job_description=job_text,
-            resume_path=base_resume_path,
-            verbose=verbose
-        )
+        # Without a threshold gate nothing waits on the match score, so
+        # customization can run alongside it; it runs quietly so the two
+        # Ollama streams don't interleave on the console
+        customize_future = None
+        customization_result = None
+        match_result = None
+        if force and _parallel_enabled():
+            # Build the shared clients here, not racing in two threads
+            self.customizer
+            self.job_matcher
+            executor = ThreadPoolExecutor(max_workers=1)
+            customize_future = executor.submit(
+                self._customize_stage,
+                job_text, base_resume_path, resume_text, company_name,
+                output_dir, customize_key, force, False
+            )
+            executor.shutdown(wait=False)
+        elif force:
+            # Otherwise one request carries both, sending the job posting and
+            # resume to the model once
+            customization_result = self._customize_stage(
+                job_text, base_resume_path, resume_text, company_name,
+                output_dir, customize_key, force, verbose,
+                include_match_analysis=True
+            )
+            # The combined analysis is a fragment of a full match, so it
+            # answers this run only and is never cached under match_key
+            match_analysis = customization_result.match_analysis_md
+            if match_analysis is not None and _has_overall_score(match_analysis):
+                match_result = self.job_matcher._parse_response(match_analysis)
+        
+        # No combined analysis (or it gave no overall score): match on its own
+        if match_result is None:
+            match_result = self._match_stage(
+                job_text, base_resume_path, resume_text, match_key, force, verbose
+            )
         
         # Print match results
         if verbose:
@@ -124,17 +452,20 @@ class ResumeWorkflow:
         
         # STEP 3: Customize
         if verbose:
-            print("\n" + "=" * 70)
-            print("STEP 3/4: Customizing Resume")
-            print("=" * 70)
+            print(_STEP_HEADERS[3])
         
-        customization_result = self.customizer.customize(
-            job_description=job_text,
-            base_resume_path=base_resume_path,
-            company_name=company_name,
-            output_dir=output_dir,
-            verbose=verbose
-        )
+        if customize_future is not None:
+            customization_result = customize_future.result()
+            if verbose:
+                print(f"📁 Output directory: {customization_result.output_directory}")
+        elif customization_result is not None:
+            if verbose:
+                print(f"✅ Customized with the job match: {customization_result.output_directory}")
+        else:
+            customization_result = self._customize_stage(
+                job_text, base_resume_path, resume_text, company_name,
+                output_dir, customize_key, force, verbose
+            )
         
         if skip_export:
             return WorkflowResult(
@@ -145,33 +476,12 @@ class ResumeWorkflow:
         
         # STEP 4: Export
         if verbose:
-            print("\n" + "=" * 70)
-            print("STEP 4/4: Exporting to .docx")
-            print("=" * 70)
-        
-        # Get resume markdown file
-        resume_md = customization_result.output_directory / \
-                   f"{customization_result.company_name}_Bisike_Nnadi_Resume_2025.md"
-        
-        # Export using existing export functionality
-        exporter = ResumeExporter()
-        export_result = exporter.export(
-            str(resume_md),
-            formats=["docx"],
-            validate=True
-        )
-        
-        if verbose:
-            print(f"\n✅ Resume exported: {export_result.output_files['docx']}")
+            print(_STEP_HEADERS[4])
         
-        # Create package
-        from ..resume_export.package_builder import PackageBuilder
-        builder = PackageBuilder()
-        package_dir = builder.build_package(
-            str(customization_result.output_directory)
-        )
+        docx_path, package_dir = self._export_stage(customization_result)
         
         if verbose:
+            print(f"\n✅ Resume exported: {docx_path}")
             print(f"✅ Package complete: {package_dir}")
         
         # Final summary
@@ -179,23 +489,277 @@ class ResumeWorkflow:
             self._print_final_summary(
                 match_result,
                 customization_result,
-                export_result.output_files['docx']
+                str(docx_path)
             )
         
         return WorkflowResult(
             status="completed",
             match_result=match_result,
             customization_result=customization_result,
-            export_path=Path(export_result.output_files['docx']),
-            package_dir=Path(package_dir)
+            export_path=docx_path,
+            package_dir=package_dir
         )
     
+    def process_batch(
+        self,
+        job_posting_paths: list[Path],
+        base_resume_path: Optional[Path] = None,
+        force: bool = False,
+        skip_export: bool = False,
+        verbose: bool = True
+    ) -> list[WorkflowResult]:
+        """
+        Execute the workflow for several job postings.
+        
+        Every posting is matched first, then the thresholds are applied to
+        all scores together, and only postings that pass are customized and
+        exported. Company names and output directories are auto-detected
+        per posting.
+        
+        Args:
+            job_posting_paths: Paths to job posting files
+            base_resume_path: Path to base resume (auto-detect if None)
+            force: Skip threshold checks and recompute cached results
+            skip_export: Stop after customization
+            verbose: Show progress
+            
+        Returns:
+            One WorkflowResult per job posting, in the same order
+        """
+        if not job_posting_paths:
+            return []
+        
+        job_texts = [path.read_text() for path in job_posting_paths]
+        
+        # The resume is read, and hashed for cache keys, once for the batch
+        if base_resume_path is not None:
+            base_resume_path = Path(base_resume_path)
+        resume_text = self._read_base_resume(base_resume_path)
+        resume_bytes = self._resume_cache_bytes(resume_text)
+        match_keys = []
+        customize_keys = []
+        for job_text in job_texts:
+            match_key, customize_key = self._stage_keys(job_text, resume_bytes, None, None)
+            match_keys.append(match_key)
+            customize_keys.append(customize_key)
+        
+        # STEP 1: Job Match, all postings at once. They run quietly so the
+        # Ollama streams don't interleave; the server queues the requests,
+        # but their connections and prompt building overlap
+        if verbose:
+            print(f"{_HR}\nSTEP 1/4: Analyzing {len(job_texts)} Job Matches\n{_HR}")
+        
+        # Build the shared client here, not racing in the worker threads
+        self.job_matcher
+        with ThreadPoolExecutor(max_workers=min(4, len(job_texts))) as executor:
+            match_results = list(executor.map(
+                lambda job_text, match_key: self._match_stage(
+                    job_text, base_resume_path, resume_text, match_key, force, False
+                ),
+                job_texts,
+                match_keys
+            ))
+        
+        # STEP 2: Threshold Gate, one pass over every score
+        if force:
+            decisions = ["continue"] * len(match_results)
+        else:
+            decisions = self.threshold.evaluate_many(
+                [match_result.overall_fit_score for match_result in match_results]
+            )
+        
+        results: list[Optional[WorkflowResult]] = [None] * len(job_texts)
+        advancing = []
+        for i, (match_result, decision) in enumerate(zip(match_results, decisions)):
+            if verbose:
+                print(f"\n📄 {job_posting_paths[i].name}")
+                self._print_match_summary(match_result)
+            
+            if not force:
+                self.threshold.print_decision(
+                    match_result.overall_fit_score,
+                    decision,
+                    match_result
+                )
+            
+            if decision == "stop":
+                results[i] = WorkflowResult(
+                    status="stopped_low_score",
+                    match_result=match_result
+                )
+            elif decision == "ask" and not self.threshold.prompt_user_continue():
+                results[i] = WorkflowResult(
+                    status="stopped_user",
+                    match_result=match_result
+                )
+            else:
+                advancing.append(i)
+        
+        if not advancing:
+            return results
+        
+        # STEP 3 and 4: Customize and export the postings that passed
+        if verbose:
+            print(f"\n{_HR}\nSTEP 3/4: Customizing {len(advancing)} Resumes\n{_HR}")
+        
+        def finish(i: int) -> WorkflowResult:
+            customization_result = self._customize_stage(
+                job_texts[i], base_resume_path, resume_text, None, None,
+                customize_keys[i], force, False
+            )
+            if skip_export:
+                return WorkflowResult(
+                    status="completed",
+                    match_result=match_results[i],
+                    customization_result=customization_result
+                )
+            
+            docx_path, package_dir = self._export_stage(customization_result)
+            return WorkflowResult(
+                status="completed",
+                match_result=match_results[i],
+                customization_result=customization_result,
+                export_path=docx_path,
+                package_dir=package_dir
+            )
+        
+        self.customizer
+        with ThreadPoolExecutor(max_workers=min(4, len(advancing))) as executor:
+            for i, result in zip(advancing, executor.map(finish, advancing)):
+                results[i] = result
+        
+        if verbose:
+            for i in advancing:
+                result = results[i]
+                if result.export_path is not None:
+                    self._print_final_summary(
+                        result.match_result,
+                        result.customization_result,
+                        str(result.export_path)
+                    )
+                else:
+                    print(f"✅ Customized: {result.customization_result.output_directory}")
+        
+        return results
+    
+    def _export_stage(
+        self,
+        customization_result: CustomizationResult
+    ) -> tuple[Path, Path]:
+        """
+        Export the customized resume and build its application package.
+        
+        The package is built after the export, so START_HERE only lists
+        the .docx once it has actually been written.
+        
+        Returns:
+            (.docx path, package directory)
+            
+        Raises:
+            RuntimeError: If the export fails
+        """
+        from resume_export.exporter import ResumeExporter
+        from resume_export.package_builder import PackageBuilder
+        
+        # Resume markdown file, as written by the customizer
+        resume_md = customization_result.resume_md_path
+        docx_path = resume_md.with_suffix(".docx")
+        package_dir = customization_result.output_directory
+        
+        export_result = ResumeExporter().export(resume_md, docx_path, validate=True)
+        if not export_result["success"]:
+            raise RuntimeError(f"Export failed: {'; '.join(export_result['errors'])}")
+        
+        PackageBuilder().create_package(package_dir)
+        return docx_path, package_dir
+    
+    def _match_stage(
+        self,
+        job_text: str,
+        base_resume_path: Optional[Path],
+        resume_text: Optional[str],
+        cache_key: Optional[str],
+        force: bool,
+        verbose: bool
+    ) -> JobMatchResult:
+        """Run the job match, reusing a cached result unless forced."""
+        if cache_key is not None and not force:
+            match_result = _cache_get(cache_key, JobMatchResult)
+            if match_result is not None:
+                if verbose:
+                    print("♻️  Using cached job match analysis")
+                return match_result
+        
+        if _parallel_match_enabled():
+            match_result = self.job_matcher.match_parallel(
+                job_description=job_text,
+                resume_text=resume_text,
+                resume_path=base_resume_path,
+                verbose=verbose
+            )
+        else:
+            # With the gate ahead, a score it will stop on ends the analysis
+            match_result = self.job_matcher.match(
+                job_description=job_text,
+                resume_text=resume_text,
+                resume_path=base_resume_path,
+                verbose=verbose,
+                stop_below=None if force else self.threshold.stop_below
+            )
+        
+        # A cut-short analysis only answers this run's threshold check
+        if cache_key is not None and not match_result.truncated:
+            _cache_put(cache_key, match_result)
+        return match_result
+    
+    def _customize_stage(
+        self,
+        job_text: str,
+        base_resume_path: Optional[Path],
+        resume_text: Optional[str],
+        company_name: Optional[str],
+        output_dir: Optional[Path],
+        cache_key: Optional[str],
+        force: bool,
+        verbose: bool,
+        include_match_analysis: bool = False
+    ) -> CustomizationResult:
+        """Run the customization, reusing a cached result unless forced."""
+        if cache_key is not None and not force:
+            customization_result = _cache_get(cache_key, CustomizationResult)
+            # Only reuse a result whose files are still on disk
+            if customization_result is not None and all(
+                path.exists() for path in customization_result.files_created
+            ):
+                if verbose:
+                    print(f"♻️  Using cached customization in {customization_result.output_directory}")
+                return customization_result
+        
+        customization_result = self.customizer.customize(
+            job_description=job_text,
+            base_resume_path=base_resume_path,
+            company_name=company_name,
+            output_dir=output_dir,
+            verbose=verbose,
+            base_resume_text=resume_text,
+            include_match_analysis=include_match_analysis
+        )
+        if cache_key is not None:
+            _cache_put(cache_key, customization_result)
+        return customization_result
+    
     def _print_match_summary(self, result: JobMatchResult) -> None:
         """Print formatted match summary."""
-        from rich.console import Console
-        from rich.table import Table
+        rich = _rich()
+        if rich is None:
+            print(f"\nOverall Fit Score: {result.overall_fit_score}/100")
+            print(f"Interview Probability: {result.interview_probability:.0%}")
+            print(f"ATS Pass Probability: {result.ats_pass_probability:.0%}")
+            print(f"Seniority Alignment: {result.seniority_alignment}")
+            return
         
-        console = Console()
+        _, Table, _ = rich
+        console = _console()
         
         table = Table(title="Match Analysis", show_header=False)
         table.add_column("Metric", style="cyan")
@@ -216,35 +780,26 @@ class ResumeWorkflow:
         export_path: str
     ) -> None:
         """Print final workflow summary."""
-        from rich.console import Console
-        from rich.panel import Panel
-        
-        console = Console()
-        
         compensation_line = ""
         if customization_result.compensation_negotiation_guide_md:
             compensation_line = f"  💰 Compensation Guide: {customization_result.company_name}_Compensation_Negotiation_Guide.md\n"
         
-        summary = f"""
-[bold green]✅ Workflow Complete![/bold green]
-
-[bold]Match Score:[/bold] {match_result.overall_fit_score}/100
-[bold]Company:[/bold] {customization_result.company_name}
-[bold]Role:[/bold] {customization_result.role_title}
-
-[bold]Files Created:[/bold]
-  📄 Resume (.docx): {Path(export_path).name}
-  📝 Analysis: {customization_result.company_name}_Analysis.md
-  💼 Cover Letter Points: {customization_result.company_name}_Cover_Letter_Points.md
-  ✅ Checklist: {customization_result.company_name}_Application_Checklist.md
-{compensation_line}[bold]Location:[/bold] {customization_result.output_directory}
-
-[bold cyan]Next Steps:[/bold cyan]
-  1. Review the customized .docx resume
-  2. Read cover letter points for key talking points
-  3. Use checklist before submitting
-"""
+        summary = _FINAL_SUMMARY.substitute(
+            score=match_result.overall_fit_score,
+            company=customization_result.company_name,
+            role=customization_result.role_title,
+            resume_name=Path(export_path).name,
+            compensation_line=compensation_line,
+            location=customization_result.output_directory
+        )
+        
+        rich = _rich()
+        if rich is None:
+            print(_MARKUP_RE.sub("", summary))
+            return
         
+        _, _, Panel = rich
+        console = _console()
         console.print()
         console.print(Panel(summary, border_style="green"))
 
@@ -6,20 +6,94 @@ Combines AI-powered resume analysis, customization, and traditional export.
 """
 
 import argparse
+import functools
+import os
+import re
 import sys
+import textwrap
 from pathlib import Path
 
 # Version
 __version__ = "0.4.0"
 
+# Markdown file names setup offers as the base resume
+_MASTER_RE = re.compile(r'master.*\.md$', re.IGNORECASE)
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create main argument parser with subcommands."""
-    parser = argparse.ArgumentParser(
-        prog='resume-builder',
-        description='AI-powered resume builder with ATS-optimized export',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Subcommands in help order: name -> (aliases, one-line help)
+_COMMANDS = {
+    'workflow': (('process',), 'Complete workflow: match → customize → export'),
+    'job-match': (('match',), 'Analyze how well resume matches job description'),
+    'resume-eval': (('eval',), 'Evaluate and compare multiple resumes'),
+    'resume-customize': (('customize',), 'Customize resume for specific job'),
+    'export': ((), 'Export markdown resume to .docx (traditional formatting)'),
+    'setup': ((), 'Interactive setup wizard'),
+    'config': ((), 'Manage configuration'),
+}
+
+# Every name or alias a subcommand can be invoked by -> its name
+_COMMAND_NAMES = {
+    alias: name
+    for name, (aliases, _) in _COMMANDS.items()
+    for alias in (name, *aliases)
+}
+
+# Subcommand descriptions and argument help, shared by every parser build
+_HELP_BASE_RESUME = 'Base resume to customize (auto-detect if not provided)'
+_HELP_COMPANY = 'Company name (auto-extract if not provided)'
+_HELP_OUTPUT_DIR = 'Output directory (auto-create if not provided)'
+_HELP_MODEL = 'Ollama model to use (default: llama3.1)'
+_HELP_QUIET = 'Minimal output'
+_HELP_JOB_POSTING = 'Path to job posting file'
+
+_DESC_WORKFLOW = 'Run complete workflow with threshold gating at 70%'
+_HELP_WORKFLOW_JOB_POSTING = 'Path to job posting file (.txt or .md)'
+_HELP_WORKFLOW_MIN_SCORE = 'Minimum match score to continue (default: 70)'
+_HELP_WORKFLOW_FORCE = 'Skip threshold check and continue regardless of score'
+_HELP_WORKFLOW_NO_EXPORT = 'Stop after customization, skip export to .docx'
+
+_DESC_JOB_MATCH = 'Score resume fit and predict interview probability'
+_HELP_JOB_MATCH_RESUME = 'Resume to analyze (auto-detect if not provided)'
+_HELP_JOB_MATCH_SAVE = 'Save analysis to file'
+
+_DESC_EVAL = 'Analyze resumes and generate master resume'
+_HELP_EVAL_SEARCH = 'Directory to search for resumes'
+_HELP_EVAL_RESUME_TEXT = 'Paste resume text directly'
+_HELP_EVAL_SAVE = 'Save evaluation to file'
+
+_DESC_CUSTOMIZE = 'AI-powered resume customization with keyword optimization'
+_HELP_CUSTOMIZE_ROLE = 'Role title (auto-extract if not provided)'
+
+_DESC_EXPORT = 'Convert markdown to ATS-optimized .docx without AI'
+_HELP_EXPORT_INPUT = 'Input markdown resume file'
+_HELP_EXPORT_OUTPUT = 'Output directory (default: same as input)'
+_HELP_EXPORT_VALIDATE = 'Validate ATS compliance after export'
+_HELP_EXPORT_PACKAGE = 'Create complete application package'
+_HELP_EXPORT_FORMATS = 'Export formats (default: docx)'
+
+_DESC_SETUP = 'Configure resume builder for first-time use'
+_HELP_SETUP_NON_INTERACTIVE = 'Use defaults without prompts'
+
+_DESC_CONFIG = 'View and modify resume builder configuration'
+_HELP_CONFIG_ACTION = 'Config action (see below)'
+_HELP_CONFIG_ARGS = 'KEY for get, KEY VALUE for set'
+
+# Config action -> (argument names it takes, one-line help)
+_CONFIG_ACTIONS = {
+    'list': ((), 'Show all configuration values'),
+    'show': ((), 'Same as list'),
+    'set': (('key', 'value'), 'Set a configuration value'),
+    'get': (('key',), 'Get a configuration value'),
+    'validate': ((), 'Validate configured paths'),
+    'path': ((), 'Show config file location'),
+}
+
+_CONFIG_EPILOG = "actions:\n" + "".join(
+    f"  {' '.join((action, *(n.upper() for n in names))):20}{help_text}\n"
+    for action, (names, help_text) in _CONFIG_ACTIONS.items()
+)
+
+
+_EPILOG = """
 Examples:
   # Complete workflow (recommended)
   resume-builder workflow job-posting.txt
@@ -34,6 +108,89 @@ Examples:
   
 For more information, visit: https://github.com/bisikennadi/resumes-builder
         """
+
+_COMMAND_CHOICES = "{" + ",".join(_COMMAND_NAMES) + "}"
+
+# Column argparse starts help text at, and its width with COLUMNS=80
+_HELP_POSITION = 24
+_HELP_WIDTH = 78
+
+
+def _format_command_help() -> str:
+    """Render the subcommand list from _COMMANDS the way argparse lays it out."""
+    lines = []
+    for name, (aliases, help_text) in _COMMANDS.items():
+        invocation = f"    {name} ({', '.join(aliases)})" if aliases else f"    {name}"
+        wrapped = textwrap.wrap(help_text, _HELP_WIDTH - _HELP_POSITION)
+        if len(invocation) <= _HELP_POSITION - 2:
+            lines.append(f"{invocation:{_HELP_POSITION}}{wrapped[0]}")
+            wrapped = wrapped[1:]
+        else:
+            lines.append(invocation)
+        lines.extend(" " * _HELP_POSITION + line for line in wrapped)
+    return "\n".join(lines) + "\n"
+
+
+# Top-level help as argparse renders it at 80 columns, printed without building a parser
+_HELP = f"""\
+usage: resume-builder [-h] [-v]
+                      {_COMMAND_CHOICES}
+                      ...
+
+AI-powered resume builder with ATS-optimized export
+
+options:
+  -h, --help            show this help message and exit
+  -v, --version         show program's version number and exit
+
+commands:
+  {_COMMAND_CHOICES}
+                        Available commands
+{_format_command_help()}
+""" + _EPILOG.strip("\n") + "\n"
+
+
+def _sniff_command(argv: list[str]) -> str | None:
+    """
+    Find the subcommand argv invokes, without parsing it.
+    
+    Returns:
+        Subcommand name, or None for top-level help/version, no command
+        or an unknown one
+    """
+    for arg in argv:
+        if arg in ('-h', '--help', '-v', '--version'):
+            return None
+        if not arg.startswith('-'):
+            return _COMMAND_NAMES.get(arg)
+    return None
+
+
+def _add_command_parser(subparsers, name: str, **kwargs) -> argparse.ArgumentParser:
+    """Register a subcommand with its aliases and help from _COMMANDS."""
+    aliases, help_text = _COMMANDS[name]
+    return subparsers.add_parser(name, aliases=list(aliases), help=help_text, **kwargs)
+
+
+def create_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """
+    Create main argument parser with subcommands.
+    
+    Only the subcommand argv invokes gets its full parser; the others are
+    registered by name and help alone, which is all top-level help and
+    "invalid choice" errors need.
+    
+    Args:
+        argv: Arguments to be parsed (defaults to sys.argv[1:])
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = argparse.ArgumentParser(
+        prog='resume-builder',
+        description='AI-powered resume builder with ATS-optimized export',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument(
@@ -49,255 +206,251 @@ For more information, visit: https://github.com/bisikennadi/resumes-builder
         help='Available commands'
     )
     
-    # Workflow command (recommended)
-    add_workflow_parser(subparsers)
-    
-    # Individual AI commands
-    add_job_match_parser(subparsers)
-    add_eval_parser(subparsers)
-    add_customize_parser(subparsers)
-    
-    # Export command
-    add_export_parser(subparsers)
-    
-    # Configuration commands
-    add_setup_parser(subparsers)
-    add_config_parser(subparsers)
+    # Subcommand -h/--help is only wired up when argv asks for it; the
+    # sniffer stops at a -h before the command, so any here come after it
+    command = _sniff_command(argv)
+    wants_help = '-h' in argv or '--help' in argv
+    for name in _COMMANDS:
+        if name == command:
+            _PARSER_BUILDERS[name](subparsers, add_help=wants_help)
+        else:
+            _add_command_parser(subparsers, name, add_help=False)
     
     return parser
 
 
-def add_workflow_parser(subparsers):
+def _command_parser(name: str) -> argparse.ArgumentParser:
+    """Build one subcommand's full parser on its own, e.g. to print its help."""
+    parser = argparse.ArgumentParser(prog='resume-builder')
+    subparsers = parser.add_subparsers(dest='command')
+    _PARSER_BUILDERS[name](subparsers)
+    return subparsers.choices[name]
+
+
+def add_workflow_parser(subparsers, add_help: bool = True):
     """Add workflow command (complete end-to-end)."""
-    parser = subparsers.add_parser(
+    parser = _add_command_parser(
+        subparsers,
         'workflow',
-        aliases=['process'],
-        help='Complete workflow: match → customize → export',
-        description='Run complete workflow with threshold gating at 70%'
+        add_help=add_help,
+        description=_DESC_WORKFLOW
     )
     
     parser.add_argument(
         'job_posting',
         type=Path,
-        help='Path to job posting file (.txt or .md)'
+        help=_HELP_WORKFLOW_JOB_POSTING
     )
     
     parser.add_argument(
         '--base-resume',
         type=Path,
-        help='Base resume to customize (auto-detect if not provided)'
+        help=_HELP_BASE_RESUME
     )
     
     parser.add_argument(
         '--company',
-        help='Company name (auto-extract if not provided)'
+        help=_HELP_COMPANY
     )
     
     parser.add_argument(
         '--output-dir',
         type=Path,
-        help='Output directory (auto-create if not provided)'
+        help=_HELP_OUTPUT_DIR
     )
     
     parser.add_argument(
         '--min-score',
         type=int,
         default=70,
-        help='Minimum match score to continue (default: 70)'
+        help=_HELP_WORKFLOW_MIN_SCORE
     )
     
     parser.add_argument(
         '--force',
         action='store_true',
-        help='Skip threshold check and continue regardless of score'
+        help=_HELP_WORKFLOW_FORCE
     )
     
     parser.add_argument(
         '--no-export',
         action='store_true',
-        help='Stop after customization, skip export to .docx'
+        help=_HELP_WORKFLOW_NO_EXPORT
     )
     
     parser.add_argument(
         '--model',
         default='llama3.1',
-        help='Ollama model to use (default: llama3.1)'
+        help=_HELP_MODEL
     )
     
     parser.add_argument(
         '--quiet',
         action='store_true',
-        help='Minimal output'
+        help=_HELP_QUIET
     )
-    
-    parser.set_defaults(func=workflow_command)
 
 
-def add_job_match_parser(subparsers):
+def add_job_match_parser(subparsers, add_help: bool = True):
     """Add job-match command."""
-    parser = subparsers.add_parser(
+    parser = _add_command_parser(
+        subparsers,
         'job-match',
-        aliases=['match'],
-        help='Analyze how well resume matches job description',
-        description='Score resume fit and predict interview probability'
+        add_help=add_help,
+        description=_DESC_JOB_MATCH
     )
     
     parser.add_argument(
         'job_posting',
         type=Path,
-        help='Path to job posting file'
+        help=_HELP_JOB_POSTING
     )
     
     parser.add_argument(
         '--resume',
         type=Path,
-        help='Resume to analyze (auto-detect if not provided)'
+        help=_HELP_JOB_MATCH_RESUME
     )
     
     parser.add_argument(
         '--model',
         default='llama3.1',
-        help='Ollama model to use (default: llama3.1)'
+        help=_HELP_MODEL
     )
     
     parser.add_argument(
         '--save',
         type=Path,
-        help='Save analysis to file'
+        help=_HELP_JOB_MATCH_SAVE
     )
     
     parser.add_argument(
         '--quiet',
         action='store_true',
-        help='Minimal output'
+        help=_HELP_QUIET
     )
-    
-    parser.set_defaults(func=job_match_command)
 
 
-def add_eval_parser(subparsers):
+def add_eval_parser(subparsers, add_help: bool = True):
     """Add resume-eval command."""
-    parser = subparsers.add_parser(
+    parser = _add_command_parser(
+        subparsers,
         'resume-eval',
-        aliases=['eval'],
-        help='Evaluate and compare multiple resumes',
-        description='Analyze resumes and generate master resume'
+        add_help=add_help,
+        description=_DESC_EVAL
     )
     
     parser.add_argument(
         '--search',
         type=Path,
-        help='Directory to search for resumes'
+        help=_HELP_EVAL_SEARCH
     )
     
     parser.add_argument(
         '--resume-text',
-        help='Paste resume text directly'
+        help=_HELP_EVAL_RESUME_TEXT
     )
     
     parser.add_argument(
         '--model',
         default='llama3.1',
-        help='Ollama model to use (default: llama3.1)'
+        help=_HELP_MODEL
     )
     
     parser.add_argument(
         '--save',
         type=Path,
-        help='Save evaluation to file'
+        help=_HELP_EVAL_SAVE
     )
     
     parser.add_argument(
         '--quiet',
         action='store_true',
-        help='Minimal output'
+        help=_HELP_QUIET
     )
-    
-    parser.set_defaults(func=eval_command)
 
 
-def add_customize_parser(subparsers):
+def add_customize_parser(subparsers, add_help: bool = True):
     """Add resume-customize command."""
-    parser = subparsers.add_parser(
+    parser = _add_command_parser(
+        subparsers,
         'resume-customize',
-        aliases=['customize'],
-        help='Customize resume for specific job',
-        description='AI-powered resume customization with keyword optimization'
+        add_help=add_help,
+        description=_DESC_CUSTOMIZE
     )
     
     parser.add_argument(
         'job_posting',
         type=Path,
-        help='Path to job posting file'
+        help=_HELP_JOB_POSTING
     )
     
     parser.add_argument(
         '--base-resume',
         type=Path,
-        help='Base resume to customize (auto-detect if not provided)'
+        help=_HELP_BASE_RESUME
     )
     
     parser.add_argument(
         '--company',
-        help='Company name (auto-extract if not provided)'
+        help=_HELP_COMPANY
     )
     
     parser.add_argument(
         '--role',
-        help='Role title (auto-extract if not provided)'
+        help=_HELP_CUSTOMIZE_ROLE
     )
     
     parser.add_argument(
         '--output-dir',
         type=Path,
-        help='Output directory (auto-create if not provided)'
+        help=_HELP_OUTPUT_DIR
     )
     
     parser.add_argument(
         '--model',
         default='llama3.1',
-        help='Ollama model to use (default: llama3.1)'
+        help=_HELP_MODEL
     )
     
     parser.add_argument(
         '--quiet',
         action='store_true',
-        help='Minimal output'
+        help=_HELP_QUIET
     )
-    
-    parser.set_defaults(func=customize_command)
 
 
-def add_export_parser(subparsers):
+def add_export_parser(subparsers, add_help: bool = True):
     """Add export command (existing functionality)."""
-    parser = subparsers.add_parser(
+    parser = _add_command_parser(
+        subparsers,
         'export',
-        help='Export markdown resume to .docx (traditional formatting)',
-        description='Convert markdown to ATS-optimized .docx without AI'
+        add_help=add_help,
+        description=_DESC_EXPORT
     )
     
     parser.add_argument(
         'input',
         type=Path,
-        help='Input markdown resume file'
+        help=_HELP_EXPORT_INPUT
     )
     
     parser.add_argument(
         '-o', '--output',
         type=Path,
-        help='Output directory (default: same as input)'
+        help=_HELP_EXPORT_OUTPUT
     )
     
     parser.add_argument(
         '--validate',
         action='store_true',
-        help='Validate ATS compliance after export'
+        help=_HELP_EXPORT_VALIDATE
     )
     
     parser.add_argument(
         '--package',
         action='store_true',
-        help='Create complete application package'
+        help=_HELP_EXPORT_PACKAGE
     )
     
     parser.add_argument(
@@ -305,286 +458,263 @@ def add_export_parser(subparsers):
         nargs='+',
         choices=['docx', 'pdf'],
         default=['docx'],
-        help='Export formats (default: docx)'
+        help=_HELP_EXPORT_FORMATS
     )
-    
-    parser.set_defaults(func=export_command)
 
 
 # Command implementations
-def workflow_command(args):
+def _cli_safe(show_traceback: bool = False):
+    """
+    Turn an exception escaping a command into an error message and exit 1.
+    
+    KeyboardInterrupt is left to _run, which handles it for every command.
+    
+    Args:
+        show_traceback: Also print the traceback unless --quiet was given
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(args) -> int:
+            try:
+                return fn(args)
+            except Exception as e:
+                print(f"\n❌ Error: {e}")
+                if show_traceback and not args.quiet:
+                    import traceback
+                    traceback.print_exc()
+                return 1
+        return wrapper
+    return decorator
+
+
+def _read_job_posting(path: Path) -> str:
+    """
+    Read a job posting file as UTF-8 text.
+    
+    Raises:
+        ValueError: If the file is not valid UTF-8
+    """
+    try:
+        return Path(path).read_text(encoding='utf-8')
+    except UnicodeDecodeError as e:
+        raise ValueError(
+            f"Job posting {path} is not valid UTF-8 (byte {e.start}); "
+            "re-save it with UTF-8 encoding"
+        ) from None
+
+
+@_cli_safe(show_traceback=True)
+def workflow_command(args) -> int:
     """Execute complete workflow."""
+    # Fail fast on a bad path, before loading any workflow internals
+    if not os.path.exists(str(args.job_posting)):
+        print(f"❌ Job posting not found: {args.job_posting}")
+        return 1
+    
     from resume_ai import OllamaConfig
     from resume_ai.workflow import ResumeWorkflow
     from resume_ai.threshold_gate import ThresholdConfig
     
-    try:
-        # Configure
-        ollama_config = OllamaConfig(model=args.model)
-        threshold_config = ThresholdConfig(minimum_overall=args.min_score)
-        
-        # Initialize workflow
-        workflow = ResumeWorkflow(
-            ollama_config=ollama_config,
-            threshold_config=threshold_config
-        )
-        
-        # Execute
-        result = workflow.process(
-            job_posting_path=args.job_posting,
-            base_resume_path=args.base_resume,
-            company_name=args.company,
-            output_dir=args.output_dir,
-            force=args.force,
-            skip_export=args.no_export,
-            verbose=not args.quiet
-        )
-        
-        if result.status == "completed":
-            sys.exit(0)
-        else:
-            print(f"\n⏹️  Workflow stopped: {result.status}")
-            sys.exit(1)
-            
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Interrupted by user")
-        sys.exit(130)
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        if not args.quiet:
-            import traceback
-            traceback.print_exc()
-        sys.exit(1)
+    # Configure
+    ollama_config = OllamaConfig(model=args.model)
+    threshold_config = ThresholdConfig(minimum_overall=args.min_score)
+    
+    # Initialize workflow
+    workflow = ResumeWorkflow(
+        ollama_config=ollama_config,
+        threshold_config=threshold_config
+    )
+    
+    # Execute
+    result = workflow.process(
+        job_posting_path=args.job_posting,
+        job_text=_read_job_posting(args.job_posting),
+        base_resume_path=args.base_resume,
+        company_name=args.company,
+        output_dir=args.output_dir,
+        force=args.force,
+        skip_export=args.no_export,
+        verbose=not args.quiet
+    )
+    
+    if result.status == "completed":
+        return 0
+    else:
+        print(f"\n⏹️  Workflow stopped: {result.status}")
+        return 1
 
 
-def job_match_command(args):
+@_cli_safe()
+def job_match_command(args) -> int:
     """Execute job-match command."""
     from resume_ai import OllamaClient, OllamaConfig
     from resume_ai.job_match import JobMatcher
     
-    try:
-        # Configure
-        ollama_config = OllamaConfig(model=args.model)
-        ollama = OllamaClient(ollama_config)
-        matcher = JobMatcher(ollama)
-        
-        # Read job posting
-        job_text = args.job_posting.read_text()
-        
-        # Execute
-        result = matcher.match(
-            job_description=job_text,
-            resume_path=args.resume,
-            verbose=not args.quiet
-        )
-        
-        # Print results
-        if not args.quiet:
-            print("\n" + "=" * 70)
-            print("JOB MATCH ANALYSIS")
-            print("=" * 70)
-            print(result.raw_output)
-        
-        # Save if requested
-        if args.save:
-            args.save.write_text(result.raw_output)
-            print(f"\n💾 Analysis saved to: {args.save}")
-        
-        sys.exit(0)
-        
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Interrupted by user")
-        sys.exit(130)
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+    # Configure
+    ollama_config = OllamaConfig(model=args.model)
+    ollama = OllamaClient(ollama_config)
+    matcher = JobMatcher(ollama)
+    
+    # Read job posting
+    job_text = _read_job_posting(args.job_posting)
+    
+    # Execute
+    result = matcher.match(
+        job_description=job_text,
+        resume_path=args.resume,
+        verbose=not args.quiet
+    )
+    
+    # Print results
+    if not args.quiet:
+        print("\n" + "=" * 70)
+        print("JOB MATCH ANALYSIS")
+        print("=" * 70)
+        print(result.raw_output)
+    
+    # Save if requested
+    if args.save:
+        args.save.write_text(result.raw_output)
+        print(f"\n💾 Analysis saved to: {args.save}")
+    
+    return 0
 
 
-def eval_command(args):
+@_cli_safe()
+def eval_command(args) -> int:
     """Execute resume-eval command."""
     from resume_ai import OllamaClient, OllamaConfig
     from resume_ai.resume_eval import ResumeEvaluator
     
-    try:
-        # Configure
-        ollama_config = OllamaConfig(model=args.model)
-        ollama = OllamaClient(ollama_config)
-        evaluator = ResumeEvaluator(ollama)
-        
-        # Execute
-        result = evaluator.evaluate(
-            resume_text=args.resume_text,
-            search_scope=args.search,
-            verbose=not args.quiet
-        )
-        
-        # Print results
-        if not args.quiet:
-            print("\n" + "=" * 70)
-            print("RESUME EVALUATION")
-            print("=" * 70)
-            print(result.raw_output)
-        
-        # Save if requested
-        if args.save:
-            args.save.write_text(result.raw_output)
-            print(f"\n💾 Evaluation saved to: {args.save}")
-        
-        sys.exit(0)
-        
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Interrupted by user")
-        sys.exit(130)
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+    # Configure
+    ollama_config = OllamaConfig(model=args.model)
+    ollama = OllamaClient(ollama_config)
+    evaluator = ResumeEvaluator(ollama)
+    
+    # Execute
+    result = evaluator.evaluate(
+        resume_text=args.resume_text,
+        search_scope=args.search,
+        verbose=not args.quiet
+    )
+    
+    # Print results
+    if not args.quiet:
+        print("\n" + "=" * 70)
+        print("RESUME EVALUATION")
+        print("=" * 70)
+        print(result.raw_output)
+    
+    # Save if requested
+    if args.save:
+        args.save.write_text(result.raw_output)
+        print(f"\n💾 Evaluation saved to: {args.save}")
+    
+    return 0
 
 
-def customize_command(args):
+@_cli_safe()
+def customize_command(args) -> int:
     """Execute resume-customize command."""
     from resume_ai import OllamaClient, OllamaConfig
     from resume_ai.resume_customize import ResumeCustomizer
     
-    try:
-        # Configure
-        ollama_config = OllamaConfig(model=args.model)
-        ollama = OllamaClient(ollama_config)
-        customizer = ResumeCustomizer(ollama)
-        
-        # Read job posting
-        job_text = args.job_posting.read_text()
-        
-        # Execute
-        result = customizer.customize(
-            job_description=job_text,
-            base_resume_path=args.base_resume,
-            company_name=args.company,
-            output_dir=args.output_dir,
-            verbose=not args.quiet
-        )
-        
-        print(f"\n✅ Customization complete!")
-        print(f"📁 Files saved to: {result.output_directory}")
-        
-        sys.exit(0)
-        
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Interrupted by user")
-        sys.exit(130)
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+    # Configure
+    ollama_config = OllamaConfig(model=args.model)
+    ollama = OllamaClient(ollama_config)
+    customizer = ResumeCustomizer(ollama)
+    
+    # Read job posting
+    job_text = _read_job_posting(args.job_posting)
+    
+    # Execute
+    result = customizer.customize(
+        job_description=job_text,
+        base_resume_path=args.base_resume,
+        company_name=args.company,
+        output_dir=args.output_dir,
+        verbose=not args.quiet
+    )
+    
+    print(f"\n✅ Customization complete!")
+    print(f"📁 Files saved to: {result.output_directory}")
+    
+    return 0
 
 
-def export_command(args):
+@_cli_safe()
+def export_command(args) -> int:
     """Execute export command."""
     from resume_export.exporter import ResumeExporter
     from resume_export.package_builder import PackageBuilder
     
-    try:
-        exporter = ResumeExporter()
-        
-        result = exporter.export(
-            str(args.input),
-            formats=args.formats,
-            output_dir=str(args.output) if args.output else None,
-            validate=args.validate
+    exporter = ResumeExporter()
+    
+    result = exporter.export(
+        str(args.input),
+        formats=args.formats,
+        output_dir=str(args.output) if args.output else None,
+        validate=args.validate
+    )
+    
+    print(f"\n✅ Export complete!")
+    for format, path in result.output_files.items():
+        print(f"   {format.upper()}: {path}")
+    
+    if args.package:
+        builder = PackageBuilder()
+        package_dir = builder.build_package(
+            str(args.input.parent)
         )
-        
-        print(f"\n✅ Export complete!")
-        for format, path in result.output_files.items():
-            print(f"   {format.upper()}: {path}")
-        
-        if args.package:
-            builder = PackageBuilder()
-            package_dir = builder.build_package(
-                str(args.input.parent)
-            )
-            print(f"📦 Package: {package_dir}")
-        
-        sys.exit(0)
-        
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Interrupted by user")
-        sys.exit(130)
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+        print(f"📦 Package: {package_dir}")
+    
+    return 0
 
 
-def add_setup_parser(subparsers):
+def add_setup_parser(subparsers, add_help: bool = True):
     """Add setup command for initial configuration."""
-    parser = subparsers.add_parser(
+    parser = _add_command_parser(
+        subparsers,
         'setup',
-        help='Interactive setup wizard',
-        description='Configure resume builder for first-time use'
+        add_help=add_help,
+        description=_DESC_SETUP
     )
     
     parser.add_argument(
         '--non-interactive',
         action='store_true',
-        help='Use defaults without prompts'
+        help=_HELP_SETUP_NON_INTERACTIVE
     )
-    
-    parser.set_defaults(func=setup_command)
 
 
-def add_config_parser(subparsers):
+def add_config_parser(subparsers, add_help: bool = True):
     """Add config command for managing configuration."""
-    parser = subparsers.add_parser(
+    parser = _add_command_parser(
+        subparsers,
         'config',
-        help='Manage configuration',
-        description='View and modify resume builder configuration'
+        add_help=add_help,
+        description=_DESC_CONFIG,
+        epilog=_CONFIG_EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
-    subparsers_config = parser.add_subparsers(
-        dest='config_action',
-        help='Config action'
-    )
-    
-    # config list
-    list_parser = subparsers_config.add_parser(
-        'list',
-        aliases=['show'],
-        help='Show all configuration values'
-    )
-    list_parser.set_defaults(func=config_list_command)
-    
-    # config set
-    set_parser = subparsers_config.add_parser(
-        'set',
-        help='Set a configuration value'
-    )
-    set_parser.add_argument('key', help='Configuration key')
-    set_parser.add_argument('value', help='Value to set')
-    set_parser.set_defaults(func=config_set_command)
-    
-    # config get
-    get_parser = subparsers_config.add_parser(
-        'get',
-        help='Get a configuration value'
-    )
-    get_parser.add_argument('key', help='Configuration key')
-    get_parser.set_defaults(func=config_get_command)
-    
-    # config validate
-    validate_parser = subparsers_config.add_parser(
-        'validate',
-        help='Validate configured paths'
+    parser.add_argument(
+        'config_action',
+        nargs='?',
+        choices=list(_CONFIG_ACTIONS),
+        metavar='action',
+        help=_HELP_CONFIG_ACTION
     )
-    validate_parser.set_defaults(func=config_validate_command)
     
-    # config path
-    path_parser = subparsers_config.add_parser(
-        'path',
-        help='Show config file location'
+    parser.add_argument(
+        'config_args',
+        nargs='*',
+        metavar='arg',
+        help=_HELP_CONFIG_ARGS
     )
-    path_parser.set_defaults(func=config_path_command)
-    
-    parser.set_defaults(func=lambda args: parser.print_help())
 
 
-def setup_command(args):
+def setup_command(args) -> int:
     """Run interactive setup wizard."""
     from resume_ai.config_manager import ConfigManager, ResumeConfig
     
@@ -617,9 +747,14 @@ def setup_command(args):
         print("\nSearching for base/master resume...")
         resume_dir = Path(resume_path).expanduser()
         
+        # One directory pass, matching "master" in any case
         master_resumes = []
         if resume_dir.exists():
-            master_resumes = list(resume_dir.glob("*master*.md")) + list(resume_dir.glob("*Master*.md"))
+            with os.scandir(resume_dir) as it:
+                master_resumes = [
+                    Path(entry.path) for entry in it
+                    if _MASTER_RE.search(entry.name) and entry.is_file()
+                ]
         
         base_resume_path = None
         if master_resumes:
@@ -654,64 +789,71 @@ def setup_command(args):
         # Save configuration
         config_manager.save_user_config()
         
-        print("\n" + "=" * 70)
-        print("  Configuration Saved!")
-        print("=" * 70)
-        print(f"\nConfig location: {config_manager.get_config_location()}")
-        print(f"Resume path: {resume_path}")
-        print(f"Output path: {output_path}")
+        base_resume_line = ""
         if base_resume_path:
-            print(f"Base resume: {base_resume_path}")
+            base_resume_line = f"Base resume: {base_resume_path}\n"
         
-        print("\n✅ Setup complete!")
-        print("\nNext steps:")
-        print("  1. Make sure Ollama is running: ollama serve")
-        print("  2. Test with: resume-builder workflow job-posting.txt")
-        print("  3. Manage skills: resume-skills list")
+        rule = "=" * 70
+        sys.stdout.write(
+            f"\n{rule}\n"
+            "  Configuration Saved!\n"
+            f"{rule}\n"
+            f"\nConfig location: {config_manager.get_config_location()}\n"
+            f"Resume path: {resume_path}\n"
+            f"Output path: {output_path}\n"
+            f"{base_resume_line}"
+            "\n✅ Setup complete!\n"
+            "\nNext steps:\n"
+            "  1. Make sure Ollama is running: ollama serve\n"
+            "  2. Test with: resume-builder workflow job-posting.txt\n"
+            "  3. Manage skills: resume-skills list\n"
+        )
     else:
         # Non-interactive: save defaults
         config_manager.save_user_config()
         print(f"✓ Configuration saved to: {config_manager.get_config_location()}")
     
-    sys.exit(0)
+    return 0
 
 
-def config_list_command(args):
+def config_list_command(args) -> int:
     """List all configuration values."""
     from resume_ai.config_manager import get_config
     
     config = get_config()
+    cfg = config.config
+    
+    base_resume_line = ""
+    if cfg.base_resume_path:
+        base_resume_line = f"  Base Resume:  {cfg.base_resume_path}\n"
+    
+    rule = "=" * 70
+    sys.stdout.write(
+        f"\n{rule}\n"
+        "  Resume Builder Configuration\n"
+        f"{rule}\n"
+        "\n📁 Resume Paths:\n"
+        f"  Primary:      {cfg.resume_primary_path}\n"
+        f"  Applications: {cfg.resume_applications_path}\n"
+        f"  Fallback:     {cfg.resume_fallback_path}\n"
+        f"{base_resume_line}"
+        "\n🤖 Ollama Configuration:\n"
+        f"  URL:         {cfg.ollama_url}\n"
+        f"  Model:       {cfg.ollama_model}\n"
+        f"  Temperature: {cfg.ollama_temperature}\n"
+        "\n📊 Thresholds:\n"
+        f"  Minimum:     {cfg.threshold_minimum}\n"
+        f"  Borderline:  {cfg.threshold_borderline_min}-{cfg.threshold_borderline_max}\n"
+        "\n📤 Output:\n"
+        f"  Directory:   {cfg.output_base_dir}\n"
+        f"\n📝 Config File: {config.get_config_location()}\n"
+        "\n"
+    )
     
-    print("\n" + "=" * 70)
-    print("  Resume Builder Configuration")
-    print("=" * 70)
-    
-    print("\n📁 Resume Paths:")
-    print(f"  Primary:      {config.config.resume_primary_path}")
-    print(f"  Applications: {config.config.resume_applications_path}")
-    print(f"  Fallback:     {config.config.resume_fallback_path}")
-    if config.config.base_resume_path:
-        print(f"  Base Resume:  {config.config.base_resume_path}")
-    
-    print("\n🤖 Ollama Configuration:")
-    print(f"  URL:         {config.config.ollama_url}")
-    print(f"  Model:       {config.config.ollama_model}")
-    print(f"  Temperature: {config.config.ollama_temperature}")
-    
-    print("\n📊 Thresholds:")
-    print(f"  Minimum:     {config.config.threshold_minimum}")
-    print(f"  Borderline:  {config.config.threshold_borderline_min}-{config.config.threshold_borderline_max}")
-    
-    print("\n📤 Output:")
-    print(f"  Directory:   {config.config.output_base_dir}")
-    
-    print(f"\n📝 Config File: {config.get_config_location()}")
-    print()
-    
-    sys.exit(0)
+    return 0
 
 
-def config_set_command(args):
+def config_set_command(args) -> int:
     """Set a configuration value."""
     from resume_ai.config_manager import get_config
     
@@ -720,13 +862,13 @@ def config_set_command(args):
         config.set_value(args.key, args.value)
         print(f"✓ Set {args.key} = {args.value}")
         print(f"  Saved to: {config.get_config_location()}")
-        sys.exit(0)
+        return 0
     except ValueError as e:
         print(f"❌ Error: {e}")
-        sys.exit(1)
+        return 1
 
 
-def config_get_command(args):
+def config_get_command(args) -> int:
     """Get a configuration value."""
     from resume_ai.config_manager import get_config
     
@@ -735,17 +877,18 @@ def config_get_command(args):
     
     if value is not None:
         print(value)
-        sys.exit(0)
+        return 0
     else:
         print(f"❌ Unknown configuration key: {args.key}")
-        sys.exit(1)
+        return 1
 
 
-def config_validate_command(args):
+def config_validate_command(args) -> int:
     """Validate configured paths."""
     from resume_ai.config_manager import get_config
     
     config = get_config()
+    cfg = config.config
     validation = config.validate_paths()
     
     print("\n" + "=" * 70)
@@ -759,15 +902,15 @@ def config_validate_command(args):
         
         # Get the actual path
         if 'resume_primary' in name:
-            path = config.config.resume_primary_path
+            path = cfg.resume_primary_path
         elif 'resume_applications' in name:
-            path = config.config.resume_applications_path
+            path = cfg.resume_applications_path
         elif 'output_dir' in name:
-            path = config.config.output_base_dir
+            path = cfg.output_base_dir
         elif 'base_resume' in name:
-            path = config.config.base_resume_path
+            path = cfg.base_resume_path
         elif 'skills_inventory' in name:
-            path = config.config.skills_inventory_path
+            path = cfg.skills_inventory_path
         else:
             path = ""
         
@@ -780,13 +923,13 @@ def config_validate_command(args):
     
     if all_valid:
         print("✅ All paths valid!")
-        sys.exit(0)
+        return 0
     else:
         print("⚠️  Some paths are invalid. Run 'resume-builder setup' to reconfigure.")
-        sys.exit(1)
+        return 1
 
 
-def config_path_command(args):
+def config_path_command(args) -> int:
     """Show config file location."""
     from resume_ai.config_manager import get_config
     
@@ -800,29 +943,106 @@ def config_path_command(args):
     else:
         print(f"\n⚠️  Config file doesn't exist yet. Run 'resume-builder setup' to create it.")
     
-    sys.exit(0)
+    return 0
 
 
-def main():
-    """Main entry point."""
-    from resume_ai.config_manager import get_config
-    
-    parser = create_parser()
-    args = parser.parse_args()
+def config_command(args) -> int:
+    """Run the requested config action."""
+    action = args.config_action
+    if action is None:
+        # Bare "config": list the actions
+        _command_parser('config').print_help()
+        return 0
+    
+    # Actions take their few positionals from config_args, checked here
+    # instead of by a nested parser per action
+    names, _ = _CONFIG_ACTIONS[action]
+    if len(args.config_args) != len(names):
+        usage = ' '.join((action, *(n.upper() for n in names)))
+        sys.stderr.write(
+            f"usage: resume-builder config {usage}\n"
+            f"resume-builder config: error: {action} takes "
+            f"{len(names)} argument(s), got {len(args.config_args)}\n"
+        )
+        return 2
+    for name, value in zip(names, args.config_args):
+        setattr(args, name, value)
     
-    # Check for first run (except for setup and config commands)
-    if hasattr(args, 'func') and args.func != setup_command and not (hasattr(args, 'config_action')):
+    return _CONFIG_DISPATCH[action](args)
+
+
+# Config action (or alias) -> function running it
+_CONFIG_DISPATCH = {
+    'list': config_list_command,
+    'show': config_list_command,
+    'set': config_set_command,
+    'get': config_get_command,
+    'validate': config_validate_command,
+    'path': config_path_command,
+}
+
+# Subcommand name -> function running it
+_COMMAND_DISPATCH = {
+    'workflow': workflow_command,
+    'job-match': job_match_command,
+    'resume-eval': eval_command,
+    'resume-customize': customize_command,
+    'export': export_command,
+    'setup': setup_command,
+    'config': config_command,
+}
+
+# Subcommand name -> function adding its full parser
+_PARSER_BUILDERS = {
+    'workflow': add_workflow_parser,
+    'job-match': add_job_match_parser,
+    'resume-eval': add_eval_parser,
+    'resume-customize': add_customize_parser,
+    'export': add_export_parser,
+    'setup': add_setup_parser,
+    'config': add_config_parser,
+}
+
+
+def _run(argv: list[str]) -> int:
+    """Parse argv, run the selected command and return its exit status."""
+    # Version and top-level help need no parser
+    if argv in (['-v'], ['--version']):
+        print(f"resume-builder {__version__}")
+        return 0
+    if not argv or argv in (['-h'], ['--help']):
+        sys.stdout.write(_HELP)
+        return 0 if argv else 1
+    
+    parser = create_parser(argv)
+    args = parser.parse_args(argv)
+    
+    command = _COMMAND_NAMES.get(args.command)
+    if command is None:
+        sys.stdout.write(_HELP)
+        return 1
+    
+    # Check for first run (except for setup and config commands, which
+    # don't load resume_ai at all before they run)
+    if command not in ('setup', 'config'):
+        from resume_ai.config_manager import get_config
+        
         config = get_config()
         if config.is_first_run():
             print("\n⚠️  First time setup required!")
             print("Run: resume-builder setup\n")
-            sys.exit(1)
+            return 1
     
-    if not hasattr(args, 'func'):
-        parser.print_help()
-        sys.exit(1)
-    
-    args.func(args)
+    try:
+        return _COMMAND_DISPATCH[command](args)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interrupted by user")
+        return 130
+
+
+def main():
+    """Main entry point."""
+    sys.exit(_run(sys.argv[1:]))
 
 
 if __name__ == '__main__':
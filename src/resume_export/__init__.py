@@ -8,9 +8,36 @@ with automatic validation and package building.
 __version__ = "0.1.0"
 __author__ = "Bisike Nnadi"
 
-from .parser import ResumeParser
-from .docx_builder import DocxBuilder
-from .exporter import ResumeExporter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .parser import ResumeParser
+    from .docx_builder import DocxBuilder
+    from .exporter import ResumeExporter
 
 __all__ = ["ResumeParser", "DocxBuilder", "ResumeExporter", "__version__"]
 
+# Public name -> submodule defining it; imported on first access, so
+# importing the package (or just package_builder) doesn't load python-docx
+_LAZY_IMPORTS = {
+    "ResumeParser": ".parser",
+    "DocxBuilder": ".docx_builder",
+    "ResumeExporter": ".exporter",
+}
+
+
+def __getattr__(name: str):
+    """Import a public class from its submodule on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
@@ -7,12 +7,19 @@ Creates complete application packages with resume and supporting documents.
 from pathlib import Path
 from typing import List, Dict, Any
 import logging
+import os
 from datetime import datetime
 
 
 logger = logging.getLogger(__name__)
 
 
+def _scan_file_names(directory: Path) -> List[str]:
+    """Names of the regular files in a directory, in one scan."""
+    with os.scandir(directory) as it:
+        return [entry.name for entry in it if entry.is_file()]
+
+
 class PackageBuilder:
     """Build complete application packages."""
     
@@ -27,17 +34,15 @@ class PackageBuilder:
             List of files in the package
         """
         application_dir = Path(application_dir)
-        package_files = []
         
-        # Find all files in directory
-        for file in application_dir.iterdir():
-            if file.is_file():
-                package_files.append(file.name)
+        # Find all files in directory; one scan also feeds START_HERE
+        files = _scan_file_names(application_dir)
+        package_files = list(files)
         
         # Create START_HERE if it doesn't exist
         start_here_path = application_dir / "00_START_HERE.md"
         if not start_here_path.exists():
-            self._create_start_here(application_dir)
+            self._create_start_here(application_dir, files)
             package_files.append("00_START_HERE.md")
         
         # Create README if it doesn't exist
@@ -50,14 +55,14 @@ class PackageBuilder:
         
         return sorted(package_files)
     
-    def _create_start_here(self, application_dir: Path):
-        """Create 00_START_HERE.md quick reference file."""
+    def _create_start_here(self, application_dir: Path, files: List[str]):
+        """Create 00_START_HERE.md quick reference file listing the given files."""
         # Extract company name from directory
         company_name = application_dir.name
         
         # Find resume files
-        docx_files = list(application_dir.glob("*.docx"))
-        pdf_files = list(application_dir.glob("*.pdf"))
+        docx_files = [name for name in files if name.endswith(".docx")]
+        pdf_files = [name for name in files if name.endswith(".pdf")]
         
         content = f"""# 📋 START HERE - Quick Reference
 
@@ -73,12 +78,12 @@ class PackageBuilder:
         
         if docx_files:
             for docx in docx_files:
-                content += f"- ✅ **{docx.name}** [SUBMIT THIS - .docx format]\n"
+                content += f"- ✅ **{docx}** [SUBMIT THIS - .docx format]\n"
         
         if pdf_files:
             content += "\n### Backup Format\n"
             for pdf in pdf_files:
-                content += f"- ✅ **{pdf.name}** [SUBMIT THIS - .pdf format]\n"
+                content += f"- ✅ **{pdf}** [SUBMIT THIS - .pdf format]\n"
         
         content += """
 ---
@@ -95,20 +100,20 @@ class PackageBuilder:
 """
         
         # Find supporting files
-        for file in sorted(application_dir.glob("*.md")):
-            if file.name not in ["00_START_HERE.md", "README.md"]:
-                if "Analysis" in file.name:
-                    content += f"- 📊 **{file.name}** - Job requirements analysis\n"
-                elif "Cover_Letter" in file.name:
-                    content += f"- ✍️  **{file.name}** - Cover letter key points\n"
-                elif "Checklist" in file.name:
-                    content += f"- ☑️  **{file.name}** - Application checklist\n"
-                elif "Compensation" in file.name or "Negotiation" in file.name:
-                    content += f"- 💰 **{file.name}** - Compensation & negotiation strategy\n"
-                elif "Gaps" in file.name:
-                    content += f"- ⚠️  **{file.name}** - Technical gaps & preparation\n"
+        for name in sorted(name for name in files if name.endswith(".md")):
+            if name not in ["00_START_HERE.md", "README.md"]:
+                if "Analysis" in name:
+                    content += f"- 📊 **{name}** - Job requirements analysis\n"
+                elif "Cover_Letter" in name:
+                    content += f"- ✍️  **{name}** - Cover letter key points\n"
+                elif "Checklist" in name:
+                    content += f"- ☑️  **{name}** - Application checklist\n"
+                elif "Compensation" in name or "Negotiation" in name:
+                    content += f"- 💰 **{name}** - Compensation & negotiation strategy\n"
+                elif "Gaps" in name:
+                    content += f"- ⚠️  **{name}** - Technical gaps & preparation\n"
                 else:
-                    content += f"- 📄 **{file.name}**\n"
+                    content += f"- 📄 **{name}**\n"
         
         content += """
 ---
@@ -0,0 +1,63 @@
+"""Shared fixtures for the resume builder tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Run against the checkout without requiring `pip install -e .`
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+
+SAMPLE_RESUME_MD = """\
+# Jane Doe
+
+jane@example.com | (555) 555-0100 | Seattle, WA
+
+## Summary
+
+Backend engineer with eight years of Python and distributed systems work.
+
+## Skills
+
+**Languages:** Python, Go, SQL
+**Cloud:** AWS, Kubernetes, Terraform
+
+## Experience
+
+### Senior Software Engineer | Example Corp | 2019 - Present
+
+- Built event pipelines in Python and Kafka handling 2M messages a day
+- Led the migration of 40 services to Kubernetes on AWS
+
+## Education
+
+### B.S. Computer Science | State University | 2015
+"""
+
+
+@pytest.fixture
+def sample_resume_md() -> str:
+    """A small markdown resume the exporter can parse."""
+    return SAMPLE_RESUME_MD
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep config and cache files written by the code under test out of $HOME."""
+    from resume_ai import config_manager, skills_manager, workflow
+
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+
+    # These locations are resolved at import time, before HOME is patched
+    config_dir = home / ".config" / "resume-builder"
+    monkeypatch.setattr(config_manager.ConfigManager, "USER_CONFIG_DIR", config_dir)
+    monkeypatch.setattr(config_manager.ConfigManager, "USER_CONFIG_FILE", config_dir / "config.yaml")
+    monkeypatch.setattr(config_manager, "_config_manager", None)
+    monkeypatch.setattr(workflow, "_CACHE_DIR", home / ".cache" / "resume_ai")
+    monkeypatch.setattr(skills_manager, "_CACHE_DIR", home / ".cache" / "resume_ai" / "skills")
+    return home
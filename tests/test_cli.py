@@ -0,0 +1,93 @@
+"""Tests for the unified resume-builder CLI."""
+
+import pytest
+
+import resume_builder_cli as cli
+from resume_ai.config_manager import ConfigManager
+
+
+def test_bare_config_prints_actions(capsys):
+    assert cli._run(["config"]) == 0
+
+    out = capsys.readouterr().out
+    assert out.startswith("usage: resume-builder config")
+    for action in cli._CONFIG_ACTIONS:
+        assert f"  {action}" in out
+
+
+def test_config_get_requires_key(capsys):
+    assert cli._run(["config", "get"]) == 2
+    assert "KEY" in capsys.readouterr().err
+
+
+def test_config_set_then_get(capsys):
+    assert cli._run(["config", "set", "ollama_model", "mistral"]) == 0
+    capsys.readouterr()
+
+    assert cli._run(["config", "get", "ollama_model"]) == 0
+    assert "mistral" in capsys.readouterr().out
+
+
+def test_job_posting_decode_error_is_reported(tmp_path, capsys):
+    ConfigManager().save_user_config()
+    job_posting = tmp_path / "job.txt"
+    job_posting.write_bytes("Senior engineer – Zürich".encode("cp1252"))
+
+    assert cli._run(["workflow", str(job_posting), "--quiet"]) == 1
+    assert "not valid UTF-8" in capsys.readouterr().out
+
+
+def test_job_posting_is_reread_after_edit(tmp_path):
+    job_posting = tmp_path / "job.txt"
+    job_posting.write_text("first", encoding="utf-8")
+    assert cli._read_job_posting(job_posting) == "first"
+
+    job_posting.write_text("second", encoding="utf-8")
+    assert cli._read_job_posting(job_posting) == "second"
+
+
+def test_static_help_matches_argparse(monkeypatch):
+    monkeypatch.setenv("COLUMNS", "80")
+
+    assert cli._HELP == cli.create_parser(["--help"]).format_help()
+
+
+def test_help_lists_every_command(capsys):
+    assert cli._run(["--help"]) == 0
+
+    out = capsys.readouterr().out
+    for name, (_, help_text) in cli._COMMANDS.items():
+        assert name in out
+        assert help_text.split()[0] in out
+
+
+def test_version_and_bare_invocation(capsys):
+    assert cli._run(["--version"]) == 0
+    assert capsys.readouterr().out == f"resume-builder {cli.__version__}\n"
+
+    assert cli._run([]) == 1
+    assert capsys.readouterr().out == cli._HELP
+
+
+@pytest.mark.parametrize("argv, command", [
+    (["process", "job.txt"], "workflow"),
+    (["match", "job.txt"], "job-match"),
+    (["eval"], "resume-eval"),
+    (["customize", "job.txt", "--company", "Acme"], "resume-customize"),
+    (["export", "resume.md", "--package"], "export"),
+])
+def test_aliases_dispatch_to_their_command(monkeypatch, argv, command):
+    ConfigManager().save_user_config()
+    calls = []
+    monkeypatch.setitem(cli._COMMAND_DISPATCH, command, lambda args: calls.append(args) or 0)
+
+    assert cli._run(argv) == 0
+    assert cli._COMMAND_NAMES[calls[0].command] == command
+
+
+def test_unknown_command_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        cli._run(["frobnicate"])
+
+    assert exc_info.value.code == 2
+    assert "invalid choice" in capsys.readouterr().err
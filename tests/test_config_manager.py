@@ -0,0 +1,73 @@
+"""Tests for the configuration manager."""
+
+from pathlib import Path
+
+from resume_ai.config_manager import ConfigManager, ResumeConfig
+
+
+def test_search_paths_pick_up_directories_created_later(tmp_path):
+    manager = ConfigManager()
+    resumes = tmp_path / "resumes"
+    manager.set_value("resume_primary_path", str(resumes))
+
+    assert resumes not in manager.get_resume_search_paths()
+
+    resumes.mkdir()
+    assert manager.get_resume_search_paths()[0] == resumes
+
+    resumes.rmdir()
+    assert manager.get_resume_search_paths()[-1] == Path.cwd()
+    assert resumes not in manager.get_resume_search_paths()
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_user_config_overrides_project_config(tmp_path, monkeypatch):
+    project = _write(tmp_path / "settings.yaml", (
+        "ollama:\n"
+        "  model: mistral\n"
+        "  temperature: 0.2\n"
+        "thresholds:\n"
+        "  minimum_overall: 75\n"
+        "  unknown_key: [1, 2]\n"
+        "notes: {ignored: true}\n"
+        "verbose: true\n"
+    ))
+    monkeypatch.setattr(ConfigManager, "PROJECT_CONFIG_FILE", project)
+    _write(ConfigManager.USER_CONFIG_FILE, "ollama:\n  model: llama3.2\nthresholds:\n")
+
+    config = ConfigManager().load_config()
+
+    assert config.ollama_model == "llama3.2"
+    assert config.ollama_temperature == 0.2
+    assert config.threshold_minimum == 75
+    assert config.verbose is True
+
+
+def test_unreadable_config_falls_back_to_defaults(tmp_path, monkeypatch):
+    monkeypatch.setattr(ConfigManager, "PROJECT_CONFIG_FILE", tmp_path / "missing.yaml")
+    _write(ConfigManager.USER_CONFIG_FILE, "ollama: [unclosed\n")
+
+    assert ConfigManager().load_config() == ResumeConfig()
+
+
+def test_saved_config_loads_back(tmp_path, monkeypatch):
+    monkeypatch.setattr(ConfigManager, "PROJECT_CONFIG_FILE", tmp_path / "missing.yaml")
+    manager = ConfigManager()
+    manager.set_value("ollama_model", "qwen: 7b")
+    manager.set_value("threshold_minimum", 65)
+    manager.set_value("base_resume_path", "~/resume.md")
+
+    loaded = ConfigManager().load_config()
+
+    assert loaded == manager.config
+    assert loaded.ollama_model == "qwen: 7b"
+    assert loaded.threshold_minimum == 65
+
+    # A rewrite within the same mtime tick is still picked up
+    manager.set_value("threshold_minimum", 66)
+    assert ConfigManager().load_config().threshold_minimum == 66
@@ -0,0 +1,144 @@
+"""Tests for job match analysis."""
+
+import re
+
+from resume_ai import job_match
+from resume_ai.job_match import JobMatcher
+
+_CRITERION_SCORES = {
+    "Experience Relevance": 80,
+    "Skills Match": 90,
+    "Domain Fit": 40,
+    "Seniority Alignment": 70,
+    "Title Alignment": 60,
+}
+
+
+class _CriterionOllama:
+    """Answers each criterion prompt with that criterion's score."""
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.prompts = []
+
+    def generate(self, prompt, system=None, num_keep=None, **kwargs):
+        self.prompts.append(prompt)
+        criterion = re.search(r"Rate ONLY the (.+?) of this resume", prompt).group(1)
+        score = self.scores.get(criterion, "unknown")
+        lines = [f"Score: {score}", f"Strength: strong {criterion}", f"Gap: weak {criterion}"]
+        if criterion == "Seniority Alignment":
+            lines.append("Alignment: Appropriate")
+        return "\n".join(lines)
+
+
+def _expected_overall(scores) -> int:
+    return round(sum(
+        scores.get(criterion, 0) * weight
+        for criterion, weight, _ in job_match._MATCH_CRITERIA
+    ))
+
+
+def test_match_parallel_rates_every_criterion(sample_resume_md):
+    scores = {
+        criterion: _CRITERION_SCORES.get(criterion, 50)
+        for criterion, _, _ in job_match._MATCH_CRITERIA
+    }
+    ollama = _CriterionOllama(scores)
+
+    result = JobMatcher(ollama).match_parallel("Senior Python engineer", resume_text=sample_resume_md)
+
+    assert len(ollama.prompts) == len(job_match._MATCH_CRITERIA)
+    assert result.overall_fit_score == _expected_overall(scores)
+    assert result.matching_strengths[0] == "strong Skills Match"
+    assert result.gaps[0] == "weak Domain Fit"
+    assert result.seniority_alignment == "Appropriate"
+
+
+def test_match_parallel_falls_back_to_full_analysis(sample_resume_md, monkeypatch):
+    # One criterion answers without a score
+    ollama = _CriterionOllama({"Skills Match": 90})
+    matcher = JobMatcher(ollama)
+    calls = []
+    monkeypatch.setattr(matcher, "match", lambda *args, **kwargs: calls.append(kwargs) or "full")
+
+    assert matcher.match_parallel("Senior Python engineer", resume_text=sample_resume_md) == "full"
+    assert calls[0]["resume_text"] == sample_resume_md
+
+
+class _StreamingOllama:
+    """Streams a canned analysis token by token until on_token asks to stop."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.sent = 0
+
+    def generate(self, prompt, system=None, stream=False, verbose=False, num_keep=None, on_token=None):
+        text = ""
+        for token in self.tokens:
+            text += token
+            self.sent += 1
+            if on_token is not None and on_token(token):
+                break
+        return text
+
+
+_ANALYSIS_TOKENS = ["## Overall Fit Score\n", "45", "/100\n", "## Matching Strengths\n", "- Python\n"]
+
+
+def test_match_stops_streaming_on_a_low_score(sample_resume_md):
+    ollama = _StreamingOllama(_ANALYSIS_TOKENS)
+
+    result = JobMatcher(ollama).match("Staff Rust engineer", resume_text=sample_resume_md, stop_below=60)
+
+    assert result.truncated
+    assert ollama.sent == 3
+
+
+def test_match_reads_everything_when_the_score_passes(sample_resume_md):
+    ollama = _StreamingOllama(_ANALYSIS_TOKENS)
+
+    result = JobMatcher(ollama).match("Staff Rust engineer", resume_text=sample_resume_md, stop_below=40)
+
+    assert not result.truncated
+    assert ollama.sent == len(_ANALYSIS_TOKENS)
+
+
+def _docx_with_breaks_and_tabs(path):
+    from docx import Document
+    from docx.enum.text import WD_BREAK
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    document = Document()
+    document.add_heading("Jane Doe", level=1)
+    bullet = document.add_paragraph("Line one")
+    bullet.add_run().add_break()
+    bullet.add_run("Line two\tPython, Go")
+    paged = document.add_paragraph("Before page break")
+    paged.add_run().add_break(WD_BREAK.PAGE)
+    paged.add_run("after")
+    table = document.add_table(rows=1, cols=1)
+    table.cell(0, 0).text = "Only in a table"
+    linked = document.add_paragraph("Portfolio: ")
+    linked._p.append(parse_xml(
+        f'<w:hyperlink {nsdecls("w", "r")} r:id="rId99">'
+        '<w:r><w:t>janedoe.dev</w:t></w:r></w:hyperlink>'
+    ))
+    linked._p.append(parse_xml(
+        f'<w:r {nsdecls("w")}><w:t>e</w:t><w:noBreakHyphen/><w:t>mail</w:t><w:cr/><w:t>x</w:t></w:r>'
+    ))
+    document.add_paragraph("")
+    document.save(path)
+    return path
+
+
+def test_read_docx_text_matches_python_docx_paragraphs(tmp_path):
+    from docx import Document
+
+    path = _docx_with_breaks_and_tabs(tmp_path / "resume.docx")
+
+    text = job_match._read_docx_text(path)
+
+    assert text == "\n".join(p.text for p in Document(path).paragraphs)
+    assert "Line one\nLine two\tPython, Go" in text
+    assert "Only in a table" not in text
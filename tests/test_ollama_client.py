@@ -0,0 +1,69 @@
+"""Tests for the Ollama HTTP client."""
+
+import json
+
+from resume_ai.ollama_client import OllamaClient, OllamaConfig
+
+
+class _FakeResponse:
+    def __init__(self, payload=None, frames=None):
+        self._payload = payload
+        self._frames = frames or []
+        self.closed = False
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size):
+        for frame in self._frames:
+            yield (json.dumps(frame) + "\n").encode()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeSession:
+    def __init__(self, response: _FakeResponse):
+        self.response = response
+        self.posts = []
+
+    def get(self, url, timeout):
+        return _FakeResponse({"models": [{"name": "llama3.1:latest"}]})
+
+    def post(self, url, data, headers, timeout, stream=False):
+        self.posts.append(json.loads(data))
+        return self.response
+
+    def close(self) -> None:
+        pass
+
+
+def test_generate_posts_every_request():
+    session = _FakeSession(_FakeResponse({"response": "hello"}))
+    client = OllamaClient(OllamaConfig(temperature=0.0), session=session)
+
+    assert client.generate("prompt") == "hello"
+    assert client.generate("prompt") == "hello"
+
+    # Identical requests both reach the server; nothing is cached client-side
+    assert len(session.posts) == 2
+    assert session.posts[0]["keep_alive"] == "10m"
+    assert session.posts[0]["options"]["temperature"] == 0.0
+
+
+def test_generate_stream_stops_when_on_token_returns_true():
+    frames = [{"response": "Score: "}, {"response": "40"}, {"response": " more"}, {"done": True}]
+    response = _FakeResponse(frames=frames)
+    client = OllamaClient(session=_FakeSession(response))
+
+    text = client.generate("prompt", stream=True, on_token=lambda token: token == "40")
+
+    assert text == "Score: 40"
+    assert response.closed
@@ -0,0 +1,29 @@
+"""Tests for the application package builder."""
+
+from resume_export.package_builder import PackageBuilder
+
+
+def test_create_package_lists_files_and_writes_start_here(tmp_path):
+    app_dir = tmp_path / "Acme"
+    app_dir.mkdir()
+    (app_dir / "Jane_Doe_Resume.docx").write_bytes(b"docx")
+    (app_dir / "Job_Analysis.md").write_text("# Analysis\n", encoding="utf-8")
+    (app_dir / "notes").mkdir()
+
+    files = PackageBuilder().create_package(app_dir)
+
+    assert files == [
+        "00_START_HERE.md", "Jane_Doe_Resume.docx", "Job_Analysis.md", "README.md"
+    ]
+    start_here = (app_dir / "00_START_HERE.md").read_text(encoding="utf-8")
+    assert "Jane_Doe_Resume.docx" in start_here
+    assert "Job_Analysis.md" in start_here
+
+
+def test_create_package_keeps_an_existing_start_here(tmp_path):
+    (tmp_path / "00_START_HERE.md").write_text("mine\n", encoding="utf-8")
+
+    files = PackageBuilder().create_package(tmp_path)
+
+    assert files == ["00_START_HERE.md", "README.md"]
+    assert (tmp_path / "00_START_HERE.md").read_text(encoding="utf-8") == "mine\n"
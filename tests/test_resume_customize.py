@@ -0,0 +1,124 @@
+"""Tests for AI resume customization."""
+
+import asyncio
+
+from resume_ai.resume_customize import ResumeCustomizer
+
+RESPONSE = """\
+# ANALYSIS
+
+Strong backend match.
+
+# CUSTOMIZED RESUME START
+# Jane Doe
+
+## Summary
+
+Python engineer.
+# CUSTOMIZED RESUME END
+
+# APPLICATION CHECKLIST
+
+- Submit the .docx
+"""
+
+
+class _FakeOllama:
+    def __init__(self):
+        self.prompts = []
+
+    def generate(self, prompt, system=None, stream=False, verbose=False, num_keep=None):
+        self.prompts.append(prompt)
+        return RESPONSE
+
+
+class _NoSkills:
+    def find_matching_skills(self, job_description, current_skills, max_new_skills=8):
+        return []
+
+
+def _customizer() -> ResumeCustomizer:
+    return ResumeCustomizer(_FakeOllama(), skills_manager=_NoSkills())
+
+
+def test_customize_writes_parsed_sections(tmp_path, sample_resume_md):
+    customizer = _customizer()
+
+    result = customizer.customize(
+        "Senior Python engineer at Acme",
+        company_name="Acme",
+        role_title="Engineer",
+        output_dir=tmp_path / "Acme",
+        base_resume_text=sample_resume_md,
+    )
+
+    assert result.resume_md_path.read_text().startswith("# Jane Doe")
+    assert result.analysis_md == RESPONSE
+    assert all(path.exists() for path in result.files_created)
+    assert sample_resume_md.splitlines()[0] in customizer.ollama.prompts[0]
+
+
+def test_near_identical_postings_each_generate(tmp_path, sample_resume_md):
+    customizer = _customizer()
+    posting = "Senior Python engineer, AWS, Kubernetes, Kafka"
+
+    for company in ("Acme", "Globex"):
+        customizer.customize(
+            f"{posting} at {company}",
+            company_name=company,
+            role_title="Engineer",
+            output_dir=tmp_path / company,
+            base_resume_text=sample_resume_md,
+        )
+
+    # Output for one company is never rewritten and reused for another
+    assert len(customizer.ollama.prompts) == 2
+
+
+def test_customize_many_keeps_input_order(tmp_path, sample_resume_md, monkeypatch):
+    base_resume = tmp_path / "master_resume.md"
+    base_resume.write_text(sample_resume_md, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    customizer = _customizer()
+    output_dirs = {}
+
+    def create_output_directory(config, company_name):
+        path = tmp_path / "out" / company_name
+        path.mkdir(parents=True, exist_ok=True)
+        output_dirs[company_name] = path
+        return path
+
+    monkeypatch.setattr(customizer, "_create_output_directory", create_output_directory)
+    postings = [f"Position: Engineer\\nCompany: {name}\\nat {name}" for name in ("Acme", "Globex", "Initech")]
+
+    results = asyncio.run(customizer.customize_many(postings, base_resume_path=base_resume))
+
+    assert [result.company_name for result in results] == ["Acme", "Globex", "Initech"]
+    assert len(customizer.ollama.prompts) == 3
+
+
+def test_base_resume_file_is_reread_after_edit(tmp_path, sample_resume_md):
+    customizer = _customizer()
+    base_resume = tmp_path / "master_resume.md"
+    base_resume.write_text(sample_resume_md + "\r\nÜber-skill   \r\n", encoding="utf-8")
+
+    customizer.customize(
+        "Senior Python engineer at Acme",
+        company_name="Acme",
+        role_title="Engineer",
+        output_dir=tmp_path / "Acme",
+        base_resume_path=base_resume,
+    )
+    base_resume.write_text(sample_resume_md + "\nRust\n" * 5000, encoding="utf-8")
+    customizer.customize(
+        "Senior Python engineer at Acme",
+        company_name="Acme",
+        role_title="Engineer",
+        output_dir=tmp_path / "Acme",
+        base_resume_path=base_resume,
+    )
+
+    first, second = customizer.ollama.prompts
+    assert "Über-skill" in first
+    assert "Über-skill   " not in first and "\r" not in first
+    assert "Rust" in second and "Über-skill" not in second
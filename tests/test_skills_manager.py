@@ -0,0 +1,257 @@
+"""Tests for the skills inventory manager."""
+
+import json
+import os
+import random
+import re
+
+import pytest
+import yaml
+
+from resume_ai import skills_manager
+from resume_ai.skills_manager import SkillMatch, SkillsManager
+
+INVENTORY = """\
+programming_languages:
+  - Python
+  - Go
+cloud_platforms:
+  - AWS
+  - Google Cloud
+"""
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    path = tmp_path / "skills_inventory.yaml"
+    path.write_text(INVENTORY, encoding="utf-8")
+    return path
+
+
+def _cache_files():
+    return sorted(skills_manager._CACHE_DIR.glob("*.json"))
+
+
+def test_parsed_inventory_is_cached_as_json_in_user_cache(inventory):
+    manager = SkillsManager(inventory)
+
+    assert manager.skills_inventory == {
+        "programming_languages": ["Python", "Go"],
+        "cloud_platforms": ["AWS", "Google Cloud"],
+    }
+    [cache_file] = _cache_files()
+    assert json.loads(cache_file.read_text())["skills"] == manager.skills_inventory
+    # Nothing is written next to the inventory
+    assert sorted(p.name for p in inventory.parent.iterdir()) == ["home", inventory.name]
+
+
+def test_cache_is_used_while_inventory_is_unchanged(inventory, monkeypatch):
+    SkillsManager(inventory)
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("inventory was re-parsed")
+
+    monkeypatch.setattr(skills_manager.yaml, "load", fail_load)
+    assert SkillsManager(inventory).skills_inventory["programming_languages"] == ["Python", "Go"]
+
+
+def test_edited_inventory_invalidates_cache(inventory):
+    SkillsManager(inventory)
+    stat = inventory.stat()
+    inventory.write_text(INVENTORY + "databases:\n  - PostgreSQL\n", encoding="utf-8")
+    os.utime(inventory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert SkillsManager(inventory).skills_inventory["databases"] == ["PostgreSQL"]
+
+
+def test_corrupt_cache_is_ignored(inventory):
+    SkillsManager(inventory)
+    [cache_file] = _cache_files()
+    cache_file.write_bytes(b"\x80not json")
+
+    assert SkillsManager(inventory).skills_inventory["cloud_platforms"] == ["AWS", "Google Cloud"]
+
+
+def test_add_skill_saves_and_reloads(inventory):
+    manager = SkillsManager(inventory)
+    manager.add_skill("databases", "PostgreSQL")
+
+    assert SkillsManager(inventory).skills_inventory["databases"] == ["PostgreSQL"]
+
+
+def test_import_does_not_load_numpy_or_rapidfuzz():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, resume_ai.skills_manager; "
+        "print(any(m.split('.')[0] in ('numpy', 'rapidfuzz') for m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_fuzzy_match_catches_run_together_spelling(inventory):
+    pytest.importorskip("rapidfuzz")
+    pytest.importorskip("numpy")
+    inventory.write_text("web_frameworks:\n  - React.js\n", encoding="utf-8")
+    manager = SkillsManager(inventory)
+
+    [match] = manager.find_matching_skills("Frontend work in reactjs and TypeScript", {})
+
+    assert match.skill == "React.js"
+    assert match.match_type == "variant"
+
+
+def test_exact_matches_without_rapidfuzz(inventory, monkeypatch):
+    monkeypatch.setattr(skills_manager, "_rapidfuzz", lambda: None)
+    manager = SkillsManager(inventory)
+
+    matches = manager.find_matching_skills("Python services on AWS; pythn typo", {})
+
+    assert {match.skill for match in matches} == {"Python", "AWS"}
+
+
+def _baseline_find_matching_skills(inventory, job_description, current_resume_skills, max_new_skills):
+    """find_matching_skills as first released: one regex search per skill variant."""
+
+    def variants_of(skill):
+        skill_lower = skill.lower()
+        variants = {skill_lower.strip()}
+        for suffix in [".js", " api", " framework"]:
+            if skill_lower.endswith(suffix):
+                variants.add(skill_lower[:-len(suffix)].strip())
+        if skill_lower == "natural language processing":
+            variants.add("nlp")
+        elif skill_lower == "nlp":
+            variants.add("natural language processing")
+        elif skill_lower == "large language models":
+            variants.update(("llms", "llm"))
+        elif skill_lower in ["llms", "llm"]:
+            variants.add("large language models")
+        elif skill_lower == "continuous integration":
+            variants.add("ci")
+        elif skill_lower == "continuous deployment":
+            variants.add("cd")
+        elif skill_lower == "ci/cd":
+            variants.update(("continuous integration", "continuous deployment"))
+        return variants
+
+    job_text_lower = job_description.lower()
+    current = set()
+    for skills in current_resume_skills.values():
+        for skill in skills:
+            current.update(variants_of(skill))
+
+    matches = []
+    for category, skills in inventory.items():
+        for skill in skills:
+            skill_normalized = skill.lower().strip()
+            if skill_normalized in current:
+                continue
+            best_score = 0.0
+            match_type = None
+            for variant in variants_of(skill):
+                found = re.findall(r"\b" + re.escape(variant) + r"\b", job_text_lower)
+                if found:
+                    score = min(len(found) * 0.4, 1.0)
+                    if variant == skill_normalized:
+                        score *= 1.2
+                        match_type = "exact"
+                    else:
+                        match_type = "variant"
+                    best_score = max(best_score, score)
+            if best_score > 0:
+                matches.append((skill, category, min(best_score, 1.0), match_type or "partial"))
+
+    matches.sort(key=lambda match: match[2], reverse=True)
+    return matches[:max_new_skills]
+
+
+PARITY_EXTRA_SKILLS = {
+    "tricky": [
+        "Node.js", "Node", "React.js", "REST API", "REST", "Spring Framework",
+        "C++", "C", "C#", ".NET", "CI/CD", "Continuous Integration", "CI",
+        "Large Language Models", "LLM", "NLP", "Go", "Google Cloud", "Google",
+        "Vue.js", "Graph API", "Objective-C", "  Padded Skill  ",
+    ],
+}
+
+
+def test_find_matching_skills_matches_baseline_on_random_postings(tmp_path, monkeypatch):
+    monkeypatch.setattr(skills_manager, "_rapidfuzz", lambda: None)
+    with open(skills_manager._DEFAULT_SKILLS_FILE, encoding="utf-8") as f:
+        inventory = yaml.safe_load(f)
+    inventory.update(PARITY_EXTRA_SKILLS)
+    inventory_file = tmp_path / "inventory.yaml"
+    inventory_file.write_text(yaml.safe_dump(inventory), encoding="utf-8")
+    manager = SkillsManager(inventory_file)
+    inventory = manager.skills_inventory
+
+    rng = random.Random(1234)
+    all_skills = [skill for skills in inventory.values() for skill in skills]
+    vocabulary = sorted({
+        variant
+        for skill in all_skills
+        for variant in skills_manager._skill_variants(skill)
+    }) + ["experience", "team", "nodes", "golang", "api", "cloud", "js", "framework", "c+", "#"]
+    separators = [" ", " ", ", ", ". ", "/", "-", "\n", "(", ")", "", "_"]
+
+    for _ in range(400):
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(0, 60))]
+        words = [word.upper() if rng.random() < 0.1 else word for word in words]
+        job = "".join(word + rng.choice(separators) for word in words)
+        resume_skills = {"Skills": rng.sample(all_skills, rng.randint(0, 15))}
+        max_new = rng.randint(1, 40)
+
+        got = [
+            (m.skill, m.category, m.relevance_score, m.match_type)
+            for m in manager.find_matching_skills(job, resume_skills, max_new)
+        ]
+        assert got == _baseline_find_matching_skills(inventory, job, resume_skills, max_new), job
+
+
+def test_trie_regex_matches_exactly_the_words():
+    words = ["c", "c++", "c#", "go", "golang", "google cloud", "node.js", "node", "ci/cd"]
+    pattern = re.compile(skills_manager._trie_regex(words))
+
+    for word in words:
+        assert pattern.fullmatch(word), word
+    for other in ["", "goo", "google", "node.", "cd", "c+", "ci"]:
+        assert not pattern.fullmatch(other), other
+    # The longest word at a position wins
+    assert pattern.match("golang and go").group() == "golang"
+    assert pattern.match("node.js").group() == "node.js"
+
+
+def test_count_variants_finds_variants_hidden_by_longer_matches(inventory):
+    manager = SkillsManager(inventory)
+    manager.add_skill("cloud_platforms", "Google")
+
+    counts = manager._count_variants("google cloud, google, go-to go. going google cloud")
+
+    assert counts == {"google cloud": 2, "google": 3, "go": 2}
+
+
+def test_merge_skills_maps_inventory_categories_onto_the_resume(inventory):
+    manager = SkillsManager(inventory)
+    current = {"Languages": ["Python"], "Cloud & Infrastructure": ["AWS"]}
+    matches = [
+        SkillMatch("Go", "programming_languages", 1.0, "exact"),
+        SkillMatch("Kubernetes", "containers_orchestration", 0.8, "exact"),
+        SkillMatch("PostgreSQL", "databases", 0.8, "exact"),
+        SkillMatch("Redis", "databases", 0.4, "exact"),
+    ]
+
+    merged = manager.merge_skills(current, matches)
+
+    assert merged == {
+        "Languages": ["Python", "Go"],
+        "Cloud & Infrastructure": ["AWS", "Kubernetes"],
+        "Databases": ["PostgreSQL", "Redis"],
+    }
+    assert current["Languages"] == ["Python"]
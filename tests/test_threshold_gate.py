@@ -0,0 +1,88 @@
+"""Tests for the match score threshold gate."""
+
+import io
+import os
+import sys
+import threading
+
+import pytest
+
+from resume_ai.threshold_gate import ThresholdConfig, ThresholdGate
+
+
+def test_evaluate_uses_default_thresholds():
+    gate = ThresholdGate()
+
+    assert gate.evaluate(85) == "continue"
+    assert gate.evaluate(70) == "continue"
+    assert gate.evaluate(65) == "ask"
+    assert gate.evaluate(59) == "stop"
+
+
+def test_evaluate_follows_config_changed_after_init():
+    gate = ThresholdGate()
+
+    gate.config.minimum_overall = 80
+    gate.config.ask_on_borderline = False
+
+    # Reports and decisions read the same, current config
+    assert gate.evaluate(75) == "stop"
+    assert gate.stop_below == 80
+    gate.config.auto_stop_below = False
+    assert gate.evaluate(75) == "continue"
+    assert gate.stop_below == 60
+
+
+def test_stop_below_is_borderline_min_when_asking():
+    gate = ThresholdGate(ThresholdConfig(minimum_overall=75, borderline_min=50))
+
+    assert gate.stop_below == 50
+
+
+def test_evaluate_many_matches_evaluate():
+    gate = ThresholdGate(ThresholdConfig(ask_on_borderline=False, auto_stop_below=False))
+    scores = list(range(0, 101, 5))
+
+    assert gate.evaluate_many(scores) == [gate.evaluate(score) for score in scores]
+    assert gate.evaluate_many([]) == []
+
+
+def test_prompt_answers_no_without_a_terminal(monkeypatch):
+    # An open pipe nobody writes to must not block
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "r") as piped_stdin:
+        monkeypatch.setattr(sys, "stdin", piped_stdin)
+
+        assert ThresholdGate().prompt_user_continue() is False
+    os.close(write_fd)
+
+
+def test_prompt_ignores_piped_answers(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("y\n"))
+
+    assert ThresholdGate().prompt_user_continue() is False
+
+
+@pytest.mark.parametrize("key, expected", [(b"y", True), (b"Y", True), (b"n", False), (b"x", False)])
+def test_prompt_reads_one_keystroke_on_a_terminal(monkeypatch, key, expected):
+    pytest.importorskip("termios")
+    master, slave = os.openpty()
+    with os.fdopen(slave, "r") as tty_stdin:
+        monkeypatch.setattr(sys, "stdin", tty_stdin)
+        # Typed once the prompt is up; switching to cbreak flushes typeahead
+        typist = threading.Timer(0.2, os.write, (master, key))
+        typist.start()
+
+        assert ThresholdGate().prompt_user_continue(timeout=5) is expected
+        typist.join()
+    os.close(master)
+
+
+def test_prompt_on_a_terminal_answers_no_after_timeout(monkeypatch):
+    pytest.importorskip("termios")
+    master, slave = os.openpty()
+    with os.fdopen(slave, "r") as tty_stdin:
+        monkeypatch.setattr(sys, "stdin", tty_stdin)
+
+        assert ThresholdGate().prompt_user_continue(timeout=0.05) is False
+    os.close(master)
@@ -0,0 +1,295 @@
+"""Tests for the end-to-end resume workflow."""
+
+import io
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from resume_ai.config_manager import get_config
+from resume_ai.job_match import JobMatcher, JobMatchResult
+from resume_ai.resume_customize import CustomizationResult
+from resume_ai.workflow import ResumeWorkflow
+
+
+def _match_result(score: int) -> JobMatchResult:
+    return JobMatchResult(
+        overall_fit_score=score,
+        interview_probability=0.5,
+        matching_strengths=["Python"],
+        gaps=["Rust"],
+        seniority_alignment="Senior",
+        ats_keyword_match=80,
+        ats_structural_readiness=90,
+        ats_pass_probability=0.8,
+        highest_impact_improvements=[],
+        final_verdict="Apply",
+        raw_output=f"Score: {score}",
+    )
+
+
+def _customization_result(output_dir: Path, resume_md: str) -> CustomizationResult:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    resume_md_path = output_dir / "Jane_Doe_Resume.md"
+    resume_md_path.write_text(resume_md, encoding="utf-8")
+    analysis_path = output_dir / "Job_Analysis.md"
+    analysis_path.write_text("# Analysis\n", encoding="utf-8")
+    return CustomizationResult(
+        company_name="Acme",
+        role_title="Engineer",
+        customized_resume_md=resume_md,
+        analysis_md="# Analysis\n",
+        cover_letter_points_md="",
+        application_checklist_md="",
+        output_directory=output_dir,
+        files_created=[resume_md_path, analysis_path],
+        resume_md_path=resume_md_path,
+    )
+
+
+class _FakeMatcher:
+    def __init__(self, score: int):
+        self.score = score
+        self.calls = 0
+
+    def match(self, **kwargs) -> JobMatchResult:
+        self.calls += 1
+        return _match_result(self.score)
+
+
+class _FakeCustomizer:
+    def __init__(self, output_dir: Path, resume_md: str):
+        self.output_dir = output_dir
+        self.resume_md = resume_md
+        self.calls = 0
+
+    def customize(self, **kwargs) -> CustomizationResult:
+        self.calls += 1
+        return _customization_result(self.output_dir, self.resume_md)
+
+
+@pytest.fixture
+def workflow(monkeypatch):
+    monkeypatch.setenv("RESUME_AI_CACHE", "0")
+    return ResumeWorkflow()
+
+
+def test_export_stage_writes_docx_and_package(workflow, tmp_path, sample_resume_md):
+    result = _customization_result(tmp_path / "Acme", sample_resume_md)
+
+    docx_path, package_dir = workflow._export_stage(result)
+
+    assert docx_path == result.resume_md_path.with_suffix(".docx")
+    assert docx_path.exists()
+    assert package_dir == result.output_directory
+    start_here = (package_dir / "00_START_HERE.md").read_text(encoding="utf-8")
+    assert docx_path.name in start_here
+    assert (package_dir / "README.md").exists()
+
+
+def test_export_stage_failure_builds_no_package(workflow, tmp_path, sample_resume_md):
+    result = _customization_result(tmp_path / "Acme", sample_resume_md)
+    result.resume_md_path.unlink()
+
+    with pytest.raises(RuntimeError, match="Export failed"):
+        workflow._export_stage(result)
+
+    assert not (result.output_directory / "00_START_HERE.md").exists()
+
+
+def test_process_runs_export_step(workflow, tmp_path, sample_resume_md):
+    job_posting = tmp_path / "job.txt"
+    job_posting.write_text("Senior Python engineer, AWS, Kubernetes", encoding="utf-8")
+    base_resume = tmp_path / "master_resume.md"
+    base_resume.write_text(sample_resume_md, encoding="utf-8")
+    workflow.job_matcher = _FakeMatcher(score=90)
+    workflow.customizer = _FakeCustomizer(tmp_path / "Acme", sample_resume_md)
+
+    result = workflow.process(job_posting, base_resume_path=base_resume, verbose=False)
+
+    assert result.status == "completed"
+    assert result.export_path.exists()
+    assert result.export_path.suffix == ".docx"
+    assert (result.package_dir / "00_START_HERE.md").exists()
+
+
+def test_process_stops_below_threshold(workflow, tmp_path, sample_resume_md):
+    job_posting = tmp_path / "job.txt"
+    job_posting.write_text("Staff Rust engineer", encoding="utf-8")
+    base_resume = tmp_path / "master_resume.md"
+    base_resume.write_text(sample_resume_md, encoding="utf-8")
+    workflow.job_matcher = _FakeMatcher(score=30)
+    workflow.customizer = _FakeCustomizer(tmp_path / "Acme", sample_resume_md)
+
+    result = workflow.process(job_posting, base_resume_path=base_resume, verbose=False)
+
+    assert result.status == "stopped_low_score"
+    assert workflow.customizer.calls == 0
+    assert result.export_path is None
+
+
+def test_workflow_does_not_connect_until_a_stage_generates(workflow, tmp_path, sample_resume_md):
+    job_posting = tmp_path / "job.txt"
+    job_posting.write_text("Staff Rust engineer", encoding="utf-8")
+    base_resume = tmp_path / "master_resume.md"
+    base_resume.write_text(sample_resume_md, encoding="utf-8")
+    workflow.job_matcher = _FakeMatcher(score=30)
+
+    workflow.process(job_posting, base_resume_path=base_resume, verbose=False)
+
+    # No warmup or client was started for a run the gate stopped
+    assert workflow._ollama is None
+
+
+class _ScoringMatcher:
+    """Scores each posting by the number in its text."""
+
+    def match(self, job_description, **kwargs) -> JobMatchResult:
+        return _match_result(int(job_description.split()[-1]))
+
+
+class _PerPostingCustomizer:
+    """Customizes into a directory named after the posting's first word."""
+
+    def __init__(self, output_root: Path, resume_md: str):
+        self.output_root = output_root
+        self.resume_md = resume_md
+        self.jobs = []
+
+    def customize(self, job_description, **kwargs) -> CustomizationResult:
+        self.jobs.append(job_description)
+        return _customization_result(self.output_root / job_description.split()[0], self.resume_md)
+
+
+def test_process_batch_gates_each_posting_and_keeps_order(workflow, tmp_path, sample_resume_md):
+    postings = []
+    for name, score in [("Acme", 90), ("Initech", 30), ("Globex", 85), ("Hooli", 20)]:
+        posting = tmp_path / f"{name}.txt"
+        posting.write_text(f"{name} backend engineer, fit {score}", encoding="utf-8")
+        postings.append(posting)
+    base_resume = tmp_path / "master_resume.md"
+    base_resume.write_text(sample_resume_md, encoding="utf-8")
+    workflow.job_matcher = _ScoringMatcher()
+    workflow.customizer = _PerPostingCustomizer(tmp_path / "out", sample_resume_md)
+
+    results = workflow.process_batch(postings, base_resume_path=base_resume, verbose=False)
+
+    assert [result.status for result in results] == [
+        "completed", "stopped_low_score", "completed", "stopped_low_score"
+    ]
+    assert [result.match_result.overall_fit_score for result in results] == [90, 30, 85, 20]
+    assert sorted(job.split()[0] for job in workflow.customizer.jobs) == ["Acme", "Globex"]
+    assert results[0].export_path.parent.name == "Acme"
+    assert results[2].export_path.parent.name == "Globex"
+    assert all(results[i].export_path.exists() for i in (0, 2))
+
+
+def test_process_batch_of_nothing(workflow):
+    assert workflow.process_batch([], verbose=False) == []
+
+
+class _ParsingMatcher(_FakeMatcher, JobMatcher):
+    """Fake matcher that parses combined analyses like the real one."""
+
+
+class _CombinedCustomizer(_FakeCustomizer):
+    """Answers a combined request with the given PART 1 match analysis."""
+
+    def __init__(self, output_dir: Path, resume_md: str, match_analysis: str):
+        super().__init__(output_dir, resume_md)
+        self.match_analysis = match_analysis
+
+    def customize(self, include_match_analysis=False, **kwargs) -> CustomizationResult:
+        result = super().customize(**kwargs)
+        if include_match_analysis:
+            result = replace(result, match_analysis_md=self.match_analysis)
+        return result
+
+
+@pytest.fixture
+def cached_workflow(monkeypatch):
+    monkeypatch.delenv("RESUME_AI_CACHE", raising=False)
+    monkeypatch.delenv("RESUME_AI_PARALLEL", raising=False)
+    return ResumeWorkflow()
+
+
+@pytest.mark.parametrize("match_analysis", [
+    "## Overall Fit Score\n85/100\n",
+    "## Matching Strengths\n- Python\n",
+])
+def test_forced_combined_match_is_not_reused_by_later_runs(
+    cached_workflow, tmp_path, sample_resume_md, match_analysis
+):
+    job_posting = tmp_path / "job.txt"
+    job_posting.write_text("Senior Python engineer, AWS", encoding="utf-8")
+    base_resume = tmp_path / "master_resume.md"
+    base_resume.write_text(sample_resume_md, encoding="utf-8")
+    cached_workflow.job_matcher = _ParsingMatcher(score=90)
+    cached_workflow.customizer = _CombinedCustomizer(tmp_path / "Acme", sample_resume_md, match_analysis)
+
+    forced = cached_workflow.process(
+        job_posting, base_resume_path=base_resume, force=True, skip_export=True, verbose=False
+    )
+    # Without a score in PART 1 the match runs on its own
+    has_score = "Overall Fit Score" in match_analysis
+    assert forced.match_result.overall_fit_score == (85 if has_score else 90)
+    assert cached_workflow.job_matcher.calls == (0 if has_score else 1)
+
+    later = cached_workflow.process(
+        job_posting, base_resume_path=base_resume, skip_export=True, verbose=False
+    )
+    assert later.status == "completed"
+    assert later.match_result.overall_fit_score == 90
+
+
+def test_borderline_match_stops_without_a_terminal(workflow, tmp_path, sample_resume_md, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("y\n"))
+    job_posting = tmp_path / "job.txt"
+    job_posting.write_text("Senior Python engineer", encoding="utf-8")
+    base_resume = tmp_path / "master_resume.md"
+    base_resume.write_text(sample_resume_md, encoding="utf-8")
+    workflow.job_matcher = _FakeMatcher(score=65)
+    workflow.customizer = _FakeCustomizer(tmp_path / "Acme", sample_resume_md)
+
+    result = workflow.process(job_posting, base_resume_path=base_resume, verbose=False)
+
+    assert result.status == "stopped_user"
+    assert workflow.customizer.calls == 0
+
+
+def test_cache_keys_follow_the_resume_each_stage_uses(cached_workflow, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    config = get_config()
+    with config.batch():
+        config.set_value("resume_primary_path", str(resumes))
+        config.set_value("resume_applications_path", str(tmp_path / "missing"))
+        config.set_value("resume_fallback_path", str(tmp_path / "missing"))
+    master = resumes / "master_resume.md"
+    master.write_text("# Jane Doe\n\nMaster resume\n", encoding="utf-8")
+    newer = resumes / "Acme_resume.md"
+    newer.write_text("# Jane Doe\n\nTailored for Acme\n", encoding="utf-8")
+    os.utime(master, (1_000_000, 1_000_000))
+
+    def keys():
+        return cached_workflow._stage_keys(
+            "Senior Python engineer", cached_workflow._resume_cache_bytes(None), None, None
+        )
+
+    match_key, customize_key = keys()
+    assert cached_workflow._resume_cache_bytes(None) == (newer.read_bytes(), master.read_bytes())
+
+    # Another run's output becomes the newest resume; customization still uses the master
+    (resumes / "Globex_resume.md").write_text("# Jane Doe\n\nTailored for Globex\n", encoding="utf-8")
+    new_match_key, same_customize_key = keys()
+    assert new_match_key != match_key
+    assert same_customize_key == customize_key
+
+    # Editing the master, though not the newest resume, invalidates customization
+    master.write_text("# Jane Doe\n\nMaster resume, updated\n", encoding="utf-8")
+    os.utime(master, (1_000_000, 1_000_000))
+    edited_match_key, edited_customize_key = keys()
+    assert edited_match_key == new_match_key
+    assert edited_customize_key != customize_key